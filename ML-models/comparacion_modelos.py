@@ -0,0 +1,235 @@
+# COMPARACIÓN DE MODELOS PARA LA PREDICCIÓN DE CELO POSPARTO
+# ==========================================================
+#
+# Reemplaza a los scripts sueltos de Pruebas (RNA, SVM, regresión logística) y
+# a estadisticosTEST.py. Los datos se cargan y codifican una sola vez, todos
+# los modelos se evalúan con los mismos pliegues estratificados y en paralelo,
+# y las puntuaciones alimentan directamente las pruebas de Friedman, Nemenyi y
+# Wilcoxon. No abre ventanas: el resultado queda en un informe.
+#
+# Uso:
+#   python comparacion_modelos.py datos_vacas_limpios.csv --pliegues 10 --salida informe_comparacion.md
+
+import argparse
+import itertools
+import json
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+import pandas as pd
+from scipy.stats import friedmanchisquare, rankdata, studentized_range, wilcoxon
+from sklearn.ensemble import RandomForestClassifier
+from sklearn.linear_model import LogisticRegression
+from sklearn.metrics import accuracy_score, f1_score, roc_auc_score
+from sklearn.model_selection import StratifiedKFold
+from sklearn.neural_network import MLPClassifier
+from sklearn.preprocessing import StandardScaler
+from sklearn.svm import SVC
+
+from preprocesamiento import preparar
+
+METRICAS = ('f1_macro', 'auc', 'exactitud')
+
+
+# (constructor, necesita características escaladas)
+def candidatos():
+    return {
+        'LogisticRegression': (lambda: LogisticRegression(class_weight='balanced', max_iter=5000, random_state=42), True),
+        'RandomForest': (lambda: RandomForestClassifier(n_estimators=100, random_state=42), False),
+        'SVM': (lambda: SVC(kernel='rbf', C=1.0, gamma='scale', class_weight='balanced', random_state=42), True),
+        'MLP': (lambda: MLPClassifier(hidden_layer_sizes=(64, 32), early_stopping=True, max_iter=500,
+                                      random_state=42), True),
+    }
+
+
+# 1. Carga, limpieza y codificación: preprocesamiento.py las guarda en caché por hash del CSV
+def cargar_datos(ruta):
+    datos = preparar(ruta)
+    print(f"Datos {datos.clave} ({'caché' if datos.desde_cache else 'procesados'})")
+    return np.asarray(datos.X), np.asarray(datos.y, dtype=int)
+
+
+# 2. Pliegues y escaladores: se calculan una vez y los comparten todos los modelos
+def preparar_pliegues(X, y, n_pliegues, semilla=42):
+    pliegues = []
+    for entrenamiento, prueba in StratifiedKFold(n_splits=n_pliegues, shuffle=True, random_state=semilla).split(X, y):
+        escalador = StandardScaler().fit(X[entrenamiento])
+        pliegues.append((entrenamiento, prueba, escalador))
+    return pliegues
+
+
+# Estado de cada proceso del pool: se recibe una vez al iniciarlo, no en cada tarea
+_DATOS = {}
+
+
+def _iniciar_trabajador(X, y, pliegues):
+    _DATOS.update(X=X, y=y, pliegues=pliegues)
+    # Escalado por pliegue, calculado una vez por proceso y reutilizado por los modelos que lo necesitan
+    _DATOS['escalados'] = {}
+
+
+def _caracteristicas(indice, escalar):
+    X = _DATOS['X']
+    entrenamiento, prueba, escalador = _DATOS['pliegues'][indice]
+    if not escalar:
+        return X[entrenamiento], X[prueba]
+    if indice not in _DATOS['escalados']:
+        _DATOS['escalados'][indice] = (escalador.transform(X[entrenamiento]), escalador.transform(X[prueba]))
+    return _DATOS['escalados'][indice]
+
+
+def _evaluar(nombre, indice):
+    """Entrena ``nombre`` en el pliegue ``indice`` y devuelve sus métricas sobre la parte de prueba."""
+    construir, escalar = candidatos()[nombre]
+    entrenamiento, prueba, _ = _DATOS['pliegues'][indice]
+    X_train, X_test = _caracteristicas(indice, escalar)
+    y_train, y_test = _DATOS['y'][entrenamiento], _DATOS['y'][prueba]
+
+    inicio = time.perf_counter()
+    modelo = construir().fit(X_train, y_train)
+    y_pred = modelo.predict(X_test)
+    puntaje = modelo.predict_proba(X_test)[:, 1] if hasattr(modelo, 'predict_proba') else modelo.decision_function(X_test)
+    return nombre, indice, {
+        'f1_macro': f1_score(y_test, y_pred, average='macro'),
+        'auc': roc_auc_score(y_test, puntaje),
+        'exactitud': accuracy_score(y_test, y_pred),
+        'segundos': time.perf_counter() - inicio,
+    }
+
+
+# 3. Evaluación en paralelo: una tarea por (modelo, pliegue)
+def evaluar_modelos(X, y, pliegues, modelos, procesos=None):
+    resultados = {nombre: [None] * len(pliegues) for nombre in modelos}
+    tareas = list(itertools.product(modelos, range(len(pliegues))))
+    with ProcessPoolExecutor(max_workers=procesos, initializer=_iniciar_trabajador,
+                             initargs=(X, y, pliegues)) as pool:
+        for nombre, indice, metricas in pool.map(_evaluar, *zip(*tareas)):
+            resultados[nombre][indice] = metricas
+    return resultados
+
+
+# 4. Pruebas estadísticas sobre las puntuaciones por pliegue
+def nemenyi(puntuaciones):
+    """Valores p de Nemenyi tras Friedman; ``puntuaciones`` es (pliegues x modelos)."""
+    n, k = puntuaciones.shape
+    # Rango 1 para el mejor modelo de cada pliegue
+    rangos = np.apply_along_axis(rankdata, 1, -puntuaciones).mean(axis=0)
+    diferencia_critica = np.sqrt(k * (k + 1) / (6.0 * n))
+    q = np.abs(rangos[:, None] - rangos[None, :]) / diferencia_critica
+    return rangos, studentized_range.sf(q * np.sqrt(2), k, np.inf)
+
+
+def pruebas_estadisticas(resultados, metrica):
+    nombres = list(resultados)
+    puntuaciones = np.array([[pliegue[metrica] for pliegue in resultados[nombre]] for nombre in nombres]).T
+    estadistico, p = friedmanchisquare(*puntuaciones.T)
+    rangos, p_nemenyi = nemenyi(puntuaciones)
+
+    pares = []
+    for i, j in itertools.combinations(range(len(nombres)), 2):
+        diferencias = puntuaciones[:, i] - puntuaciones[:, j]
+        if np.allclose(diferencias, 0):
+            est_w, p_w = float('nan'), 1.0
+        else:
+            est_w, p_w = wilcoxon(puntuaciones[:, i], puntuaciones[:, j])
+        pares.append({'modelos': [nombres[i], nombres[j]], 'estadistico': float(est_w), 'p': float(p_w)})
+
+    return {
+        'metrica': metrica,
+        'friedman': {'estadistico': float(estadistico), 'p': float(p)},
+        'rangos_medios': dict(zip(nombres, rangos.tolist())),
+        'nemenyi': pd.DataFrame(p_nemenyi, index=nombres, columns=nombres).to_dict(),
+        'wilcoxon': pares,
+    }
+
+
+# 5. Informe
+def _tabla(df, formato='{:.4f}', indice=True):
+    """Tabla Markdown sin depender de ``tabulate``."""
+    celda = lambda v: formato.format(v) if isinstance(v, (float, np.floating)) else str(v)
+    encabezado = ([''] if indice else []) + [str(c) for c in df.columns]
+    filas = [([str(i)] if indice else []) + [celda(v) for v in fila] for i, fila in zip(df.index, df.to_numpy())]
+    return '\n'.join('| ' + ' | '.join(fila) + ' |' for fila in [encabezado, ['---'] * len(encabezado)] + filas)
+
+
+def escribir_informe(ruta, resultados, estadisticas, contexto):
+    resumen = pd.DataFrame({
+        nombre: {
+            **{f'{m} (media)': np.mean([p[m] for p in pliegues]) for m in METRICAS},
+            **{f'{m} (desv.)': np.std([p[m] for p in pliegues]) for m in METRICAS},
+            'segundos por pliegue': np.mean([p['segundos'] for p in pliegues]),
+        }
+        for nombre, pliegues in resultados.items()
+    }).T
+
+    lineas = [
+        '# Comparación de modelos - celo posparto',
+        '',
+        f"Datos: `{contexto['datos']}` ({contexto['filas']} filas, {contexto['columnas']} columnas), "
+        f"{contexto['pliegues']} pliegues estratificados, {contexto['segundos']:.1f} s en total.",
+        '',
+        '## Métricas por modelo',
+        '',
+        _tabla(resumen),
+        '',
+        f"## Pruebas estadísticas ({estadisticas['metrica']})",
+        '',
+        f"Friedman: estadístico = {estadisticas['friedman']['estadistico']:.3f}, "
+        f"p = {estadisticas['friedman']['p']:.4g}",
+        '',
+        'Rangos medios (1 = mejor):',
+        '',
+        _tabla(pd.Series(estadisticas['rangos_medios'], name='rango').sort_values().to_frame(), '{:.2f}'),
+        '',
+        'Nemenyi (valores p):',
+        '',
+        _tabla(pd.DataFrame(estadisticas['nemenyi'])),
+        '',
+        'Wilcoxon por pares:',
+        '',
+        _tabla(pd.DataFrame([
+            {'modelos': ' vs '.join(par['modelos']), 'estadístico': par['estadistico'], 'p': par['p']}
+            for par in estadisticas['wilcoxon']
+        ]), '{:.4g}', indice=False),
+        '',
+    ]
+    with open(ruta, 'w', encoding='utf-8') as f:
+        f.write('\n'.join(lineas))
+
+    # Puntuaciones por pliegue, para volver a analizarlas sin reentrenar
+    with open(os.path.splitext(ruta)[0] + '.json', 'w', encoding='utf-8') as f:
+        json.dump({'contexto': contexto, 'pliegues': resultados, 'estadisticas': estadisticas}, f,
+                  ensure_ascii=False, indent=2)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Compara los modelos candidatos con validación cruzada.')
+    parser.add_argument('datos', help='CSV con las lecturas y la columna celo')
+    parser.add_argument('--pliegues', type=int, default=10)
+    parser.add_argument('--modelos', nargs='+', choices=list(candidatos()), default=list(candidatos()))
+    parser.add_argument('--metrica', choices=METRICAS, default='f1_macro', help='Métrica de las pruebas estadísticas')
+    parser.add_argument('--procesos', type=int, default=None, help='Procesos del pool (por defecto, uno por CPU)')
+    parser.add_argument('--salida', default='informe_comparacion.md')
+    args = parser.parse_args()
+
+    if len(args.modelos) < 3:
+        parser.error('La prueba de Friedman necesita al menos 3 modelos')
+
+    inicio = time.perf_counter()
+    X, y = cargar_datos(args.datos)
+    pliegues = preparar_pliegues(X, y, args.pliegues)
+    resultados = evaluar_modelos(X, y, pliegues, args.modelos, args.procesos)
+    estadisticas = pruebas_estadisticas(resultados, args.metrica)
+
+    contexto = {
+        'datos': args.datos, 'filas': int(X.shape[0]), 'columnas': int(X.shape[1]),
+        'pliegues': args.pliegues, 'segundos': time.perf_counter() - inicio,
+    }
+    escribir_informe(args.salida, resultados, estadisticas, contexto)
+    print(f"Friedman p = {estadisticas['friedman']['p']:.4g}; informe en {args.salida}")
+
+
+if __name__ == '__main__':
+    main()
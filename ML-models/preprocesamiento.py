@@ -0,0 +1,190 @@
+# PREPROCESAMIENTO CON CACHÉ PARA ENTRENAMIENTO Y EXPERIMENTOS
+# ============================================================
+#
+# La limpieza (imputación, duplicados, valores atípicos), la codificación y el
+# escalador ajustado se guardan en disco bajo el hash del contenido del CSV.
+# Mientras el archivo no cambie, las siguientes ejecuciones cargan las matrices
+# ya listas (.npy mapeado en memoria) sin volver a leer ni procesar el CSV.
+#
+# Uso desde otro script:
+#   from preprocesamiento import preparar
+#   datos = preparar('datos_vacas_limpios.csv')
+#   datos.X, datos.y, datos.escalador, datos.codificador
+#
+# El escalador se ajusta solo con las columnas numéricas (``datos.escaladas``);
+# las one-hot de raza y parto_asistido quedan en 0/1, como en limpieza.py.
+
+import hashlib
+import json
+import os
+import shutil
+import sys
+import tempfile
+from collections import namedtuple
+
+import joblib
+import numpy as np
+import pandas as pd
+from sklearn.preprocessing import StandardScaler
+
+# El codificador se comparte con la API para que entrenamiento y predicción codifiquen igual
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+from backend.codificador import ALIAS_COLUMNAS, CAMPOS_RELATIVOS, PREFIJO_RAZA, CodificadorCaracteristicas
+
+# Cambiar al modificar la limpieza: invalida las entradas guardadas con la versión anterior
+VERSION_PREPROCESAMIENTO = 2
+
+DIRECTORIO_CACHE = os.path.join(os.path.dirname(os.path.abspath(__file__)), '.cache_preprocesamiento')
+
+# Nombres de columna de los distintos datasets -> nombres del codificador
+ALIAS = {
+    'actividad_fisica': 'actividad',
+    'temperatura_corporal': 'temperatura',
+    'condicion_corporal': 'condicion',
+    'celo_posparto': 'celo',
+}
+
+# Campos que se estandarizan; el resto de las columnas son binarias
+CAMPOS_ESCALADOS = ('actividad', 'temperatura', 'dias_posparto', 'condicion') + CAMPOS_RELATIVOS
+
+DatosPreparados = namedtuple(
+    'DatosPreparados', ['X', 'y', 'escalador', 'escaladas', 'codificador', 'limpio', 'clave', 'desde_cache'],
+)
+
+
+def hash_archivo(ruta, tamano_bloque=1 << 20):
+    """SHA-256 del contenido del archivo, leído por bloques."""
+    h = hashlib.sha256()
+    with open(ruta, 'rb') as f:
+        for bloque in iter(lambda: f.read(tamano_bloque), b''):
+            h.update(bloque)
+    return h.hexdigest()
+
+
+def clave_cache(ruta, codificador):
+    h = hashlib.sha256()
+    h.update(hash_archivo(ruta).encode())
+    h.update(str(VERSION_PREPROCESAMIENTO).encode())
+    h.update(json.dumps(codificador.a_dict(), sort_keys=True).encode())
+    return h.hexdigest()[:16]
+
+
+def limpiar(df):
+    """Mismos pasos que limpieza.py, sin escalar ni codificar (eso lo hace ``preparar``)."""
+    df = df.rename(columns=ALIAS)
+    if 'parto_asistido' not in df.columns:
+        df['parto_asistido'] = 0
+
+    # 1. Valores faltantes: temperatura con la media; sin actividad o sin celo se descarta la fila
+    df['temperatura'] = df['temperatura'].fillna(df['temperatura'].mean())
+    df = df.dropna(subset=['actividad', 'celo'])
+
+    # 2. Duplicados
+    df = df.drop_duplicates()
+
+    # 3. Valores atípicos de actividad (regla de 1.5 IQR)
+    q1, q3 = df['actividad'].quantile([0.25, 0.75])
+    iqr = q3 - q1
+    df = df[df['actividad'].between(q1 - 1.5 * iqr, q3 + 1.5 * iqr)]
+
+    return df.reset_index(drop=True)
+
+
+def columnas_escaladas(codificador):
+    """Índices de las columnas de ``codificador`` a las que se aplica el escalador."""
+    return [
+        i for i, columna in enumerate(codificador.columnas) if ALIAS_COLUMNAS.get(columna, columna) in CAMPOS_ESCALADOS
+    ]
+
+
+def escalar(datos, X):
+    """Copia de ``X`` con las columnas numéricas estandarizadas por ``datos.escalador``."""
+    X = np.array(X, dtype=float)
+    X[:, datos.escaladas] = datos.escalador.transform(X[:, datos.escaladas])
+    return X
+
+
+def _guardar_limpio(df, directorio):
+    # Parquet si está pyarrow; si no, el mismo DataFrame serializado con pickle
+    try:
+        df.to_parquet(os.path.join(directorio, 'limpio.parquet'), index=False)
+    except ImportError:
+        df.to_pickle(os.path.join(directorio, 'limpio.pkl'))
+
+
+def _cargar_limpio(directorio):
+    ruta = os.path.join(directorio, 'limpio.parquet')
+    if os.path.exists(ruta):
+        return pd.read_parquet(ruta)
+    return pd.read_pickle(os.path.join(directorio, 'limpio.pkl'))
+
+
+def _procesar(ruta, codificador, directorio):
+    """Limpia, codifica y ajusta el escalador; escribe todo en ``directorio``."""
+    limpio = limpiar(pd.read_csv(ruta))
+    campos = list(codificador.campos)
+    con_raza = 'raza' in limpio.columns
+    if not con_raza:
+        # Datasets sin raza (p. ej. datos_vacas2.csv): el codificador queda sin sus columnas
+        codificador = CodificadorCaracteristicas(
+            [columna for columna in codificador.columnas if not columna.startswith(PREFIJO_RAZA)], codificador.razas,
+        )
+        campos.remove('raza')
+    faltantes = [campo for campo in campos + ['celo'] if campo not in limpio.columns]
+    if faltantes:
+        raise SystemExit(f'Columnas faltantes en {ruta}: {faltantes}')
+    limpio = limpio.dropna(subset=campos)
+
+    X = codificador.transformar(limpio if con_raza else limpio.assign(raza=''))
+    y = limpio['celo'].to_numpy(dtype=np.int8)
+    escaladas = columnas_escaladas(codificador)
+    escalador = StandardScaler().fit(X[:, escaladas])
+
+    np.save(os.path.join(directorio, 'X.npy'), X)
+    np.save(os.path.join(directorio, 'y.npy'), y)
+    joblib.dump(escalador, os.path.join(directorio, 'escalador.joblib'))
+    codificador.guardar(os.path.join(directorio, 'codificador.json'))
+    _guardar_limpio(limpio, directorio)
+    with open(os.path.join(directorio, 'meta.json'), 'w', encoding='utf-8') as f:
+        json.dump({'origen': os.path.abspath(ruta), 'filas': int(X.shape[0]), 'columnas': codificador.columnas,
+                   'escaladas': escaladas, 'version': VERSION_PREPROCESAMIENTO}, f, ensure_ascii=False, indent=2)
+
+
+def preparar(ruta, directorio_cache=DIRECTORIO_CACHE, codificador=None, cargar_limpio=False):
+    """Devuelve los datos listos para entrenar, desde la caché si el CSV no cambió.
+
+    ``X`` e ``y`` se abren mapeados en memoria (solo lectura); ``X`` queda sin
+    escalar (ver ``escalar``). Si el CSV no tiene ``raza``, el codificador
+    devuelto no tiene sus columnas. ``limpio`` (el DataFrame tras la limpieza)
+    solo se carga si se pide con ``cargar_limpio``.
+    """
+    codificador = codificador or CodificadorCaracteristicas.para_razas()
+    clave = clave_cache(ruta, codificador)
+    directorio = os.path.join(directorio_cache, clave)
+
+    desde_cache = os.path.exists(os.path.join(directorio, 'meta.json'))
+    if not desde_cache:
+        os.makedirs(directorio_cache, exist_ok=True)
+        # Se escribe en un temporal y se renombra: una ejecución interrumpida no deja una entrada a medias
+        temporal = tempfile.mkdtemp(dir=directorio_cache, prefix='.tmp-')
+        try:
+            _procesar(ruta, codificador, temporal)
+            os.replace(temporal, directorio)
+        except OSError:
+            # Otro proceso guardó la misma entrada mientras tanto
+            if not os.path.exists(os.path.join(directorio, 'meta.json')):
+                raise
+        finally:
+            shutil.rmtree(temporal, ignore_errors=True)
+
+    codificador = CodificadorCaracteristicas.cargar(os.path.join(directorio, 'codificador.json'))
+    return DatosPreparados(
+        X=np.load(os.path.join(directorio, 'X.npy'), mmap_mode='r'),
+        y=np.load(os.path.join(directorio, 'y.npy'), mmap_mode='r'),
+        escalador=joblib.load(os.path.join(directorio, 'escalador.joblib')),
+        escaladas=columnas_escaladas(codificador),
+        codificador=codificador,
+        limpio=_cargar_limpio(directorio) if cargar_limpio else None,
+        clave=clave,
+        desde_cache=desde_cache,
+    )
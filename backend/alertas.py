@@ -0,0 +1,146 @@
+"""Alertas de celo: cada predicción nueva sobre el umbral genera una ``Alerta``.
+
+Las alertas se crean junto con las lecturas (predicción individual, por lote,
+importación) y al reevaluar vacas que cruzan el umbral. Los clientes las
+reciben por long-polling (``GET alertas/``) o Server-Sent Events
+(``GET alertas/eventos/``) indicando un cursor: el ``id`` de la última alerta
+recibida. Solo se envían las posteriores, con los datos actuales de la vaca.
+
+Los ids se asignan al insertar. Una importación larga que confirma su
+transacción después de otra más corta puede hacer visible una alerta con un
+id menor que el cursor de un cliente; las predicciones individuales, que son
+las que generan alertas en tiempo real, confirman de inmediato.
+"""
+import asyncio
+import weakref
+
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.db.models import Max
+
+from .metricas import Contador, registro as registro_metricas
+from .models import UMBRAL_CELO, Alerta, Vaca
+from .serializers import VacaListaSerializer, fecha_iso
+
+# Opciones: umbral (%), intervalo (s) entre consultas, espera_maxima (s) de un long-poll, limite por respuesta
+OPCIONES = {'umbral': UMBRAL_CELO, 'intervalo': 1.0, 'espera_maxima': 25, 'limite': 500,
+            **getattr(settings, 'ALERTAS_CELO', {})}
+
+alertas_creadas = registro_metricas.registrar(Contador(
+    'celo_alertas_total', 'Alertas de celo generadas por predicciones sobre el umbral.',
+))
+
+
+def crear_alertas(vacas):
+    """Crea una alerta por cada vaca no inseminada cuya ``prediccion`` supera el umbral."""
+    umbral = OPCIONES['umbral']
+    alertas = [
+        Alerta(vaca=vaca, finca_id=vaca.finca_id, prediccion=vaca.prediccion, umbral=umbral)
+        for vaca in vacas if vaca.prediccion > umbral and not vaca.inseminada
+    ]
+    if alertas:
+        Alerta.objects.bulk_create(alertas, batch_size=1000)
+        alertas_creadas.incrementar(cantidad=len(alertas))
+    return alertas
+
+
+def ultimo_cursor():
+    return Alerta.objects.aggregate(ultimo=Max('id'))['ultimo'] or 0
+
+
+def alertas_desde(cursor, finca_id=None, limite=None):
+    """``(alertas, cursor)``: alertas con id mayor que ``cursor``, cada una con su vaca serializada.
+
+    Con ``finca_id`` solo las de esa finca; el cursor avanza igual hasta la
+    última alerta de todas, para que las de otras fincas no despierten de
+    nuevo al cliente.
+    """
+    limite = limite or OPCIONES['limite']
+    ultimo = ultimo_cursor()
+    alertas = Alerta.objects.filter(id__gt=cursor, id__lte=ultimo)
+    if finca_id is not None:
+        alertas = alertas.filter(finca_id=finca_id)
+    alertas = list(alertas.order_by('id').values('id', 'vaca_id', 'prediccion', 'umbral', 'creada')[:limite])
+    if len(alertas) < limite:
+        cursor = max(cursor, ultimo)
+    else:
+        cursor = alertas[-1]['id']
+    if not alertas:
+        return [], cursor
+    # Una consulta para todas las vacas, con el mismo formato que el listado
+    serializador = VacaListaSerializer()
+    vacas = {
+        vaca['id']: vaca
+        for vaca in serializador.serializar(
+            Vaca.objects.filter(id__in={a['vaca_id'] for a in alertas}).values(*serializador.columnas)
+        )
+    }
+    return [
+        {'id': a['id'], 'prediccion': a['prediccion'], 'umbral': a['umbral'], 'creada': fecha_iso(a['creada']),
+         'vaca': vacas.get(a['vaca_id'])}
+        for a in alertas
+    ], cursor
+
+
+class _EstadoBucle:
+    def __init__(self):
+        self.ultimo_id = None
+        self.esperando = 0
+        self.tarea = None
+        # Se reemplaza por uno nuevo cada vez que se avisa un cambio
+        self.evento = asyncio.Event()
+
+
+class VigiaAlertas:
+    """Despierta a las peticiones en espera cuando aparecen alertas nuevas.
+
+    Una sola tarea por bucle de eventos consulta el último id cada
+    ``intervalo`` segundos mientras haya clientes esperando, así que el costo
+    en la base de datos no crece con la cantidad de conexiones abiertas.
+    """
+
+    def __init__(self, intervalo=1.0):
+        self.intervalo = intervalo
+        self._estados = weakref.WeakKeyDictionary()
+
+    def _estado(self, bucle):
+        estado = self._estados.get(bucle)
+        if estado is None:
+            estado = self._estados[bucle] = _EstadoBucle()
+        return estado
+
+    async def esperar(self, cursor, segundos):
+        """True cuando hay alertas posteriores a ``cursor``; False si pasan ``segundos`` sin ellas."""
+        bucle = asyncio.get_running_loop()
+        estado = self._estado(bucle)
+        estado.esperando += 1
+        if estado.tarea is None:
+            estado.tarea = bucle.create_task(self._vigilar(estado))
+        limite = bucle.time() + segundos
+        try:
+            while estado.ultimo_id is None or estado.ultimo_id <= cursor:
+                restante = limite - bucle.time()
+                if restante <= 0:
+                    return False
+                try:
+                    await asyncio.wait_for(estado.evento.wait(), restante)
+                except asyncio.TimeoutError:
+                    return False
+            return True
+        finally:
+            estado.esperando -= 1
+
+    async def _vigilar(self, estado):
+        try:
+            while estado.esperando > 0:
+                ultimo = await sync_to_async(ultimo_cursor)()
+                if ultimo != estado.ultimo_id:
+                    estado.ultimo_id = ultimo
+                    evento, estado.evento = estado.evento, asyncio.Event()
+                    evento.set()
+                await asyncio.sleep(self.intervalo)
+        finally:
+            estado.tarea = None
+
+
+vigia = VigiaAlertas(OPCIONES['intervalo'])
@@ -0,0 +1,10 @@
+from django.apps import AppConfig
+
+
+class BackendConfig(AppConfig):
+    name = 'backend'
+    # Fijo aquí para que las migraciones no dependan de DEFAULT_AUTO_FIELD del proyecto
+    default_auto_field = 'django.db.models.BigAutoField'
+
+    def ready(self):
+        from . import signals  # noqa: F401
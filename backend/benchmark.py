@@ -0,0 +1,191 @@
+"""Medición de latencia y rendimiento de los endpoints de predicción.
+
+Lo usa el comando ``benchmark_api``. Cada hilo envía peticiones según una
+mezcla ponderada de escenarios; se registra la duración de cada una y al
+final se resumen percentiles y peticiones por segundo por endpoint.
+"""
+import json
+import random
+import subprocess
+import threading
+import time
+import urllib.error
+import urllib.request
+
+import numpy as np
+from django.db import connections
+from django.urls import reverse
+
+from .codificador import RAZAS
+
+# Los escenarios async solo agrupan predicciones contra un servidor ASGI (--url)
+ESCENARIOS = ('predecir', 'reevaluar', 'listar', 'predecir_async', 'reevaluar_async')
+MEZCLA_POR_DEFECTO = {'predecir': 6, 'reevaluar': 2, 'listar': 2}
+
+
+class ClienteLocal:
+    """Peticiones en el mismo proceso con el cliente de pruebas de DRF (sin red)."""
+
+    def __init__(self, usuario):
+        self._usuario = usuario
+        self._clientes = threading.local()
+
+    def _cliente(self):
+        # APIClient no es seguro entre hilos: uno por hilo
+        if not hasattr(self._clientes, 'cliente'):
+            from rest_framework.test import APIClient
+
+            self._clientes.cliente = APIClient()
+            self._clientes.cliente.force_authenticate(self._usuario)
+        return self._clientes.cliente
+
+    def enviar(self, metodo, ruta, datos=None):
+        respuesta = getattr(self._cliente(), metodo)(ruta, datos, format='json')
+        return respuesta.status_code
+
+
+class ClienteHTTP:
+    """Peticiones reales contra un servidor en marcha (``runserver``, gunicorn...)."""
+
+    def __init__(self, url_base, token=None):
+        self.url_base = url_base.rstrip('/')
+        self.token = token
+
+    def enviar(self, metodo, ruta, datos=None):
+        cuerpo = None if datos is None or metodo == 'get' else json.dumps(datos).encode()
+        peticion = urllib.request.Request(self.url_base + ruta, data=cuerpo, method=metodo.upper())
+        peticion.add_header('Content-Type', 'application/json')
+        if self.token:
+            peticion.add_header('Authorization', f'Bearer {self.token}')
+        try:
+            with urllib.request.urlopen(peticion) as respuesta:
+                respuesta.read()
+                return respuesta.status
+        except urllib.error.HTTPError as e:
+            return e.code
+
+
+def lectura_aleatoria(rng):
+    return {
+        'nombre': f'Bench {rng.randrange(10 ** 6)}',
+        'actividad': rng.randint(60, 160),
+        'temperatura': round(rng.uniform(37.5, 40.5), 1),
+        'dias_posparto': rng.randint(20, 150),
+        'condicion': round(rng.uniform(1, 5), 1),
+        'raza': rng.choice(RAZAS)[0],
+        'parto_asistido': rng.random() < 0.2,
+    }
+
+
+def peticion(escenario, rng, ids_vacas):
+    """``(método, ruta, datos)`` de una petición del escenario."""
+    if escenario in ('predecir', 'predecir_async'):
+        datos = lectura_aleatoria(rng)
+        # La mitad son nuevas lecturas de vacas existentes
+        if ids_vacas and rng.random() < 0.5:
+            datos['vaca'] = rng.choice(ids_vacas)
+        ruta = 'predecir-celo' if escenario == 'predecir' else 'predecir-celo-async'
+        return 'post', reverse(ruta), datos
+    if escenario in ('reevaluar', 'reevaluar_async'):
+        ruta = 'vaca-reevaluar' if escenario == 'reevaluar' else 'vaca-reevaluar-async'
+        return 'put', reverse(ruta, args=[rng.choice(ids_vacas)]), {}
+    if escenario == 'listar':
+        return 'get', reverse('vaca-list') + '?page_size=100', None
+    raise ValueError(f'Escenario desconocido: {escenario}')
+
+
+def ejecutar(cliente, ids_vacas, mezcla=None, peticiones=1000, concurrencia=8, calentamiento=20, semilla=42):
+    """Envía ``peticiones`` repartidas entre ``concurrencia`` hilos y devuelve las mediciones."""
+    mezcla = mezcla or MEZCLA_POR_DEFECTO
+    escenarios = [e for e in mezcla if mezcla[e] > 0]
+    pesos = [mezcla[e] for e in escenarios]
+    if {'reevaluar', 'reevaluar_async'} & set(escenarios) and not ids_vacas:
+        raise ValueError('El escenario reevaluar necesita vacas en la base de datos')
+
+    rng = random.Random(semilla)
+    plan = [peticion(e, rng, ids_vacas) + (e,) for e in rng.choices(escenarios, pesos, k=peticiones)]
+    # El calentamiento carga el modelo y llena las cachés; no se mide
+    for metodo, ruta, datos, _ in plan[:calentamiento]:
+        cliente.enviar(metodo, ruta, datos)
+
+    mediciones = {e: [] for e in escenarios}
+    errores = {e: 0 for e in escenarios}
+    siguiente = iter(plan)
+    candado = threading.Lock()
+
+    def trabajar():
+        try:
+            while True:
+                with candado:
+                    item = next(siguiente, None)
+                if item is None:
+                    return
+                metodo, ruta, datos, escenario = item
+                inicio = time.perf_counter()
+                try:
+                    estado = cliente.enviar(metodo, ruta, datos)
+                except Exception:
+                    # Un error del servidor cuenta como petición fallida, no detiene el hilo
+                    estado = 500
+                duracion = time.perf_counter() - inicio
+                with candado:
+                    mediciones[escenario].append(duracion)
+                    if estado >= 400:
+                        errores[escenario] += 1
+        finally:
+            # Cada hilo abre su propia conexión con el cliente en proceso
+            connections.close_all()
+
+    hilos = [threading.Thread(target=trabajar) for _ in range(concurrencia)]
+    inicio = time.perf_counter()
+    for hilo in hilos:
+        hilo.start()
+    for hilo in hilos:
+        hilo.join()
+    return mediciones, errores, time.perf_counter() - inicio
+
+
+def resumir(mediciones, errores, segundos):
+    """Percentiles en milisegundos y peticiones por segundo de cada endpoint y del total."""
+    def estadisticas(duraciones, fallidas):
+        ms = np.array(duraciones) * 1000
+        p50, p95, p99 = np.percentile(ms, [50, 95, 99]) if len(ms) else (0.0, 0.0, 0.0)
+        return {
+            'peticiones': len(ms),
+            'errores': fallidas,
+            'p50_ms': round(float(p50), 2),
+            'p95_ms': round(float(p95), 2),
+            'p99_ms': round(float(p99), 2),
+            'media_ms': round(float(ms.mean()), 2) if len(ms) else 0.0,
+            'peticiones_por_segundo': round(len(ms) / segundos, 1) if segundos else 0.0,
+        }
+
+    todas = [d for duraciones in mediciones.values() for d in duraciones]
+    return {
+        'endpoints': {e: estadisticas(mediciones[e], errores[e]) for e in mediciones},
+        'total': estadisticas(todas, sum(errores.values())),
+        'segundos': round(segundos, 3),
+    }
+
+
+def commit_actual():
+    try:
+        return subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], capture_output=True, text=True,
+                              check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def comparar(actual, anterior):
+    """Variación porcentual de p95 y peticiones/s respecto a un resultado anterior.
+
+    Es None si el resultado anterior no tiene el endpoint o su valor es 0.
+    """
+    cambios = {}
+    for endpoint, datos in actual['endpoints'].items():
+        previo = anterior.get('endpoints', {}).get(endpoint) or {}
+        cambios[endpoint] = {
+            campo: round(100.0 * (datos[campo] - previo[campo]) / previo[campo], 1) if previo.get(campo) else None
+            for campo in ('p95_ms', 'peticiones_por_segundo')
+        }
+    return cambios
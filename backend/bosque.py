@@ -0,0 +1,137 @@
+"""Evaluación de un Random Forest de sklearn con NumPy puro.
+
+Para lotes pequeños (una vaca por petición) el costo fijo de
+``RandomForestClassifier.predict_proba`` (validación de la entrada y reparto
+entre los 100 árboles) supera al cálculo en sí. Aquí el bosque se aplana en
+arreglos contiguos y todos los árboles se recorren a la vez para todo el lote.
+"""
+import numpy as np
+
+# Filas evaluadas a la vez por predict_proba
+FILAS_POR_BLOQUE = 512
+
+ARREGLOS = ('caracteristica', 'umbral', 'izquierdo', 'derecho', 'valor', 'raices', 'clases')
+
+
+class BosqueCompilado:
+    """Random Forest aplanado: un nodo por posición en arreglos compartidos.
+
+    Los índices de hijos son globales (no relativos a cada árbol) y cada hoja
+    apunta a sí misma, de modo que basta con avanzar ``profundidad`` pasos
+    para que todas las filas terminen en su hoja. ``valor`` guarda la
+    proporción de clases de cada nodo.
+    """
+
+    def __init__(self, caracteristica, umbral, izquierdo, derecho, valor, raices, clases, profundidad=None):
+        # Los arreglos que ya tienen el tipo y la disposición correctos no se
+        # copian (p. ej. los que vienen mapeados en memoria desde un paquete)
+        self.caracteristica = np.ascontiguousarray(caracteristica, dtype=np.intp)
+        self.umbral = np.ascontiguousarray(umbral, dtype=np.float64)
+        self.izquierdo = np.ascontiguousarray(izquierdo, dtype=np.intp)
+        self.derecho = np.ascontiguousarray(derecho, dtype=np.intp)
+        self.valor = np.ascontiguousarray(valor, dtype=np.float64)
+        self.raices = np.ascontiguousarray(raices, dtype=np.intp)
+        self.clases = np.asarray(clases)
+        self.profundidad = self._calcular_profundidad() if profundidad is None else int(profundidad)
+
+    @classmethod
+    def desde_sklearn(cls, bosque):
+        """Aplana un ``RandomForestClassifier`` entrenado (una sola salida)."""
+        caracteristica, umbral, izquierdo, derecho, valor, raices = [], [], [], [], [], []
+        desplazamiento = 0
+        for estimador in bosque.estimators_:
+            arbol = estimador.tree_
+            n = arbol.node_count
+            hoja = arbol.children_left == -1
+            propios = np.arange(n) + desplazamiento
+
+            caracteristica.append(np.where(hoja, 0, arbol.feature))
+            umbral.append(np.where(hoja, 0.0, arbol.threshold))
+            izquierdo.append(np.where(hoja, propios, arbol.children_left + desplazamiento))
+            derecho.append(np.where(hoja, propios, arbol.children_right + desplazamiento))
+            # sklearn normaliza el valor de la hoja para obtener la probabilidad de cada árbol
+            proporciones = arbol.value[:, 0, :]
+            valor.append(proporciones / proporciones.sum(axis=1, keepdims=True))
+            raices.append(desplazamiento)
+            desplazamiento += n
+
+        return cls(
+            caracteristica=np.concatenate(caracteristica),
+            umbral=np.concatenate(umbral),
+            izquierdo=np.concatenate(izquierdo),
+            derecho=np.concatenate(derecho),
+            valor=np.concatenate(valor),
+            raices=np.array(raices),
+            clases=bosque.classes_,
+        )
+
+    def _calcular_profundidad(self):
+        # Recorrido en anchura desde todas las raíces hasta que solo quedan hojas
+        nodos = self.raices
+        profundidad = 0
+        while True:
+            internos = nodos[self.izquierdo[nodos] != nodos]
+            if not len(internos):
+                return profundidad
+            nodos = np.concatenate([self.izquierdo[internos], self.derecho[internos]])
+            profundidad += 1
+
+    @property
+    def n_arboles(self):
+        return len(self.raices)
+
+    def predict_proba(self, X):
+        """Probabilidad de cada clase, igual a ``RandomForestClassifier.predict_proba``."""
+        # sklearn compara las características convertidas a float32
+        X = np.asarray(X, dtype=np.float32)
+        if X.shape[0] <= FILAS_POR_BLOQUE:
+            return self._predict_proba_bloque(X)
+        # Por bloques para que los arreglos de trabajo quepan en caché
+        return np.concatenate([
+            self._predict_proba_bloque(X[inicio:inicio + FILAS_POR_BLOQUE])
+            for inicio in range(0, X.shape[0], FILAS_POR_BLOQUE)
+        ])
+
+    def _predict_proba_bloque(self, X):
+        n = X.shape[0]
+        # Matriz por columnas aplanada: el valor (fila, característica) está en característica * n + fila
+        columnas = np.ascontiguousarray(X.T).ravel()
+        # Un par (árbol, fila) por posición: nodos[t * n + i] es el nodo del árbol t para la fila i
+        nodos = np.repeat(self.raices, n)
+        filas = np.tile(np.arange(n), self.n_arboles)
+        activos = np.arange(len(nodos))
+        for _ in range(self.profundidad):
+            actuales = nodos[activos]
+            valores = columnas[self.caracteristica[actuales] * n + filas[activos]]
+            a_la_izquierda = valores <= self.umbral[actuales]
+            siguientes = np.where(a_la_izquierda, self.izquierdo[actuales], self.derecho[actuales])
+            nodos[activos] = siguientes
+            # Solo se siguen evaluando los pares que aún no llegaron a una hoja
+            activos = activos[self.izquierdo[siguientes] != siguientes]
+            if not len(activos):
+                break
+        hojas = self.valor[nodos].reshape(self.n_arboles, n, self.valor.shape[1])
+        return hojas.sum(axis=0) / self.n_arboles
+
+    def predict(self, X):
+        return self.clases[np.argmax(self.predict_proba(X), axis=1)]
+
+    def guardar(self, path):
+        np.savez(path, **{nombre: getattr(self, nombre) for nombre in ARREGLOS})
+
+    @classmethod
+    def cargar(cls, archivo):
+        """Carga un bosque guardado con ``guardar`` (ruta o archivo abierto)."""
+        with np.load(archivo, allow_pickle=False) as datos:
+            return cls(**{nombre: datos[nombre] for nombre in ARREGLOS})
+
+
+def compilar_modelo(modelo):
+    """Devuelve el bosque compilado si ``modelo`` es un Random Forest; si no, el mismo modelo."""
+    estimadores = getattr(modelo, 'estimators_', None)
+    es_bosque = (
+        isinstance(estimadores, list) and estimadores
+        and all(hasattr(e, 'tree_') for e in estimadores)
+        and hasattr(modelo, 'classes_') and getattr(modelo, 'n_outputs_', 1) == 1
+    )
+    return BosqueCompilado.desde_sklearn(modelo) if es_bosque else modelo
@@ -0,0 +1,82 @@
+"""Caché en memoria de probabilidades de celo por vector de características."""
+import threading
+import time
+from collections import OrderedDict
+
+import numpy as np
+
+
+class CachePredicciones:
+    """Caché LRU con tamaño máximo y caducidad, propia de cada proceso.
+
+    La clave es la fila codificada convertida a float32, la misma precisión
+    con la que el bosque compara las características, así que dos entradas
+    con la misma clave producen la misma predicción. Al cambiar la versión
+    del modelo se descarta todo el contenido.
+    """
+
+    def __init__(self, capacidad=10000, ttl=3600):
+        self.capacidad = capacidad
+        self.ttl = ttl
+        self._datos = OrderedDict()
+        self._lock = threading.Lock()
+        self._version = None
+        self.aciertos = 0
+        self.fallos = 0
+
+    @staticmethod
+    def claves(X):
+        # + 0.0 unifica -0.0 y 0.0
+        return [fila.tobytes() for fila in np.asarray(X, dtype=np.float32) + np.float32(0.0)]
+
+    def _comprobar_version(self, version):
+        if version != self._version:
+            self._datos.clear()
+            self._version = version
+
+    def obtener(self, version, claves):
+        """Devuelve el valor guardado para cada clave, o None si no está o caducó."""
+        ahora = time.monotonic()
+        valores = []
+        with self._lock:
+            self._comprobar_version(version)
+            for clave in claves:
+                entrada = self._datos.get(clave)
+                if entrada is not None and entrada[1] < ahora:
+                    del self._datos[clave]
+                    entrada = None
+                if entrada is None:
+                    self.fallos += 1
+                    valores.append(None)
+                else:
+                    self._datos.move_to_end(clave)
+                    self.aciertos += 1
+                    valores.append(entrada[0])
+        return valores
+
+    def guardar(self, version, claves, valores):
+        vence = time.monotonic() + self.ttl
+        with self._lock:
+            self._comprobar_version(version)
+            for clave, valor in zip(claves, valores):
+                self._datos[clave] = (valor, vence)
+                self._datos.move_to_end(clave)
+            while len(self._datos) > self.capacidad:
+                self._datos.popitem(last=False)
+
+    def limpiar(self):
+        with self._lock:
+            self._datos.clear()
+
+    def estadisticas(self):
+        with self._lock:
+            consultas = self.aciertos + self.fallos
+            return {
+                'aciertos': self.aciertos,
+                'fallos': self.fallos,
+                'tasa_aciertos': self.aciertos / consultas if consultas else 0.0,
+                'entradas': len(self._datos),
+                'capacidad': self.capacidad,
+                'ttl': self.ttl,
+                'version_modelo': self._version,
+            }
@@ -0,0 +1,98 @@
+"""Secuencia de cambios de vacas para la sincronización incremental y los ETag.
+
+Cada escritura de ``Vaca`` registra el id de la vaca en ``CambioVaca``: las
+señales cubren ``save()`` y ``delete()``, y las escrituras masivas
+(``bulk_create``, ``bulk_update``, ``update()``) llaman a
+``registrar_cambios`` junto a ``invalidar_resumen``. El último id de
+``CambioVaca`` (de una finca o de todas) identifica así el estado del rebaño:
+sirve de ETag del listado y de cursor ``since`` para pedir solo lo que cambió.
+
+Los ids se asignan al insertar, no al confirmar: en PostgreSQL una
+transacción que confirma después que otra más rápida hace visible un cambio
+con un id menor que el último ya leído, y reemplazar la fila de la vaca en
+cada cambio hace más frecuentes esos huecos. Por eso el cursor que se
+entrega no pasa de los cambios registrados hace menos de
+``MARGEN_CONFIRMACION``: esos se vuelven a enviar hasta que el margen
+transcurre, y un cambio que se confirma dentro de ese tiempo no se pierde.
+Las transacciones que registran cambios (importación por bloques, lotes de
+reevaluación) duran bastante menos.
+"""
+from datetime import timedelta
+
+from django.db import transaction
+from django.db.models import Max
+from django.utils.timezone import now
+
+from .models import CambioVaca
+
+# Cambios procesados por respuesta de ``?since=`` (también limita el ``IN`` de la consulta de vacas)
+LIMITE_CAMBIOS = 500
+
+# Tiempo máximo esperado entre que un cambio recibe su id y se confirma
+MARGEN_CONFIRMACION = timedelta(seconds=10)
+
+# Ids por consulta al reemplazar las filas anteriores (SQLite limita los parámetros)
+_LOTE_BORRADO = 500
+
+
+def registrar_cambios(vacas, eliminadas=False):
+    """Registra un cambio de cada una de ``vacas``, reemplazando su fila anterior."""
+    fincas = {vaca.pk: vaca.finca_id for vaca in vacas}
+    if not fincas:
+        return
+    ids = sorted(fincas)
+    with transaction.atomic():
+        for inicio in range(0, len(ids), _LOTE_BORRADO):
+            CambioVaca.objects.filter(vaca_id__in=ids[inicio:inicio + _LOTE_BORRADO]).delete()
+        CambioVaca.objects.bulk_create(
+            [CambioVaca(vaca_id=pk, finca_id=fincas[pk], eliminada=eliminadas) for pk in ids], batch_size=1000,
+        )
+
+
+def _de_finca(finca_id):
+    cambios = CambioVaca.objects.all()
+    return cambios if finca_id is None else cambios.filter(finca_id=finca_id)
+
+
+def cursor_actual(finca_id=None):
+    """Id del último cambio registrado en la finca (en todas si es None; 0 si no hay ninguno)."""
+    return _de_finca(finca_id).aggregate(ultimo=Max('id'))['ultimo'] or 0
+
+
+def cursor_confirmado(finca_id=None):
+    """Como ``cursor_actual`` pero sin los cambios de los últimos ``MARGEN_CONFIRMACION``.
+
+    Todos los cambios con id menor ya están confirmados, así que ``cursor_confirmado() + 1``
+    es un cursor ``since`` seguro tras una lectura completa.
+    """
+    confirmados = _de_finca(finca_id).filter(registrado__lte=now() - MARGEN_CONFIRMACION)
+    return confirmados.aggregate(ultimo=Max('id'))['ultimo'] or 0
+
+
+def version_vaca(pk):
+    """Id del último cambio de la vaca ``pk`` (0 si no cambió desde que existe el registro)."""
+    return CambioVaca.objects.filter(vaca_id=pk).aggregate(ultimo=Max('id'))['ultimo'] or 0
+
+
+def cambios_desde(cursor, finca_id=None, limite=LIMITE_CAMBIOS):
+    """``(ids de vacas, nuevo cursor, quedan_mas)`` de los cambios desde ``cursor``.
+
+    El cursor es el id del primer cambio aún no leído (``cursor_confirmado() + 1``
+    tras una lectura completa), así que nunca vale 0 aunque no haya cambios.
+    Solo avanza hasta el primer cambio registrado dentro de ``MARGEN_CONFIRMACION``;
+    ese y los siguientes se devuelven igual y se vuelven a devolver en la próxima lectura.
+    """
+    cambios = list(
+        _de_finca(finca_id).filter(id__gte=cursor).order_by('id').values_list('id', 'vaca_id', 'registrado')[:limite]
+    )
+    if not cambios:
+        return set(), cursor, False
+    confirmado = now() - MARGEN_CONFIRMACION
+    nuevo_cursor = cursor
+    for id_cambio, _, registrado in cambios:
+        if registrado > confirmado:
+            break
+        nuevo_cursor = id_cambio + 1
+    # Si el cursor no avanzó, pedir más devolvería lo mismo
+    mas = len(cambios) == limite and nuevo_cursor > cursor
+    return {vaca_id for _, vaca_id, _ in cambios}, nuevo_cursor, mas
@@ -0,0 +1,127 @@
+"""Codificación de las características de entrada del modelo de celo.
+
+El módulo no depende de Django: los scripts de entrenamiento de ``ML-models``
+lo importan directamente, de modo que entrenamiento y API codifican igual.
+"""
+import json
+
+import numpy as np
+
+RAZAS = [
+    ('SIB', 'Siboney de Cuba'),
+    ('MAM', 'Mambi de Cuba'),
+    ('TAI', 'Taino'),
+    ('CRI', 'Criolla'),
+    ('CEB', 'Cebu'),
+    ('CRU', 'Cruzamiento'),
+    ('CHA', 'Chacuba'),
+    ('HOL', 'Holstein'),
+]
+
+CAMPOS_NUMERICOS = ('actividad', 'temperatura', 'dias_posparto', 'condicion', 'parto_asistido')
+
+# Lectura respecto a la línea base de la vaca, en desviaciones estándar. Solo
+# se usan si el modelo tiene esas columnas; si faltan en los datos valen 0 (sin historial)
+CAMPOS_RELATIVOS = ('actividad_relativa', 'temperatura_relativa')
+
+PREFIJO_RAZA = 'raza_'
+
+# Nombres de columna usados por entrenamientos anteriores
+ALIAS_COLUMNAS = {'condicion_corporal': 'condicion'}
+
+
+class CodificadorCaracteristicas:
+    """Convierte datos de vacas en la matriz de entrada del modelo.
+
+    El mapa columna -> índice se calcula una sola vez al construir el
+    codificador; ``transformar`` codifica N filas en una pasada vectorizada.
+    La raza se acepta tanto por código (``'HOL'``) como por nombre
+    (``'Holstein'``). Las columnas que no corresponden a ningún campo quedan
+    en 0.
+    """
+
+    def __init__(self, columnas, razas=RAZAS):
+        self.columnas = list(columnas)
+        self.razas = [tuple(raza) for raza in razas]
+
+        codigo_por_nombre = {nombre: codigo for codigo, nombre in self.razas}
+        self._numericas = []
+        self._indice_raza = {}
+        # Columnas sin campo de entrada correspondiente (siempre valdrían 0)
+        self.desconocidas = []
+        for indice, columna in enumerate(self.columnas):
+            if columna.startswith(PREFIJO_RAZA):
+                nombre = columna[len(PREFIJO_RAZA):]
+                self._indice_raza[nombre] = indice
+                if nombre in codigo_por_nombre:
+                    self._indice_raza[codigo_por_nombre[nombre]] = indice
+                continue
+            campo = ALIAS_COLUMNAS.get(columna, columna)
+            if campo in CAMPOS_NUMERICOS or campo in CAMPOS_RELATIVOS:
+                self._numericas.append((indice, campo))
+            else:
+                self.desconocidas.append(columna)
+
+    @classmethod
+    def para_razas(cls, razas=RAZAS):
+        """Codificador con las columnas canónicas: campos numéricos y una por raza."""
+        columnas = list(CAMPOS_NUMERICOS) + [f'{PREFIJO_RAZA}{nombre}' for _, nombre in razas]
+        return cls(columnas, razas)
+
+    @property
+    def campos(self):
+        """Campos de entrada que necesita ``transformar``."""
+        return tuple(campo for _, campo in self._numericas) + ('raza',)
+
+    def transformar(self, datos, out=None):
+        """Codifica ``datos`` (campo -> secuencia, p. ej. dict de listas o DataFrame).
+
+        Si se pasa ``out`` (de al menos N filas) se reutiliza como salida.
+        """
+        razas = np.asarray(datos['raza'])
+        n = len(razas)
+        if out is None:
+            X = np.zeros((n, len(self.columnas)))
+        else:
+            X = out[:n]
+            X.fill(0)
+
+        for indice, campo in self._numericas:
+            if campo in CAMPOS_RELATIVOS and campo not in datos:
+                continue
+            X[:, indice] = np.asarray(datos[campo], dtype=float)
+
+        # Solo se consulta el mapa una vez por raza distinta del lote
+        valores, inversa = np.unique(razas, return_inverse=True)
+        indices = np.array([self._indice_raza.get(v, -1) for v in valores.tolist()], dtype=np.intp)
+        indices = indices[inversa.reshape(-1)]
+        filas = np.flatnonzero(indices >= 0)
+        X[filas, indices[filas]] = 1.0
+        return X
+
+    def transformar_registros(self, registros, out=None):
+        """Codifica una lista de registros (un dict por vaca)."""
+        datos = {
+            campo: [registro.get(campo, 0.0) if campo in CAMPOS_RELATIVOS else registro[campo] for registro in registros]
+            for campo in self.campos
+        }
+        return self.transformar(datos, out=out)
+
+    def a_dict(self):
+        return {'columnas': self.columnas, 'razas': [list(raza) for raza in self.razas]}
+
+    @classmethod
+    def desde_dict(cls, datos):
+        """Reconstruye el codificador; acepta también la lista simple de columnas."""
+        if isinstance(datos, list):
+            return cls(datos)
+        return cls(datos['columnas'], datos.get('razas', RAZAS))
+
+    def guardar(self, path):
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(self.a_dict(), f, ensure_ascii=False, indent=2)
+
+    @classmethod
+    def cargar(cls, path):
+        with open(path, 'r', encoding='utf-8') as f:
+            return cls.desde_dict(json.load(f))
@@ -0,0 +1,233 @@
+"""Línea base de actividad y temperatura de cada vaca, actualizada lectura a lectura.
+
+Se guarda la media y la varianza con ponderación exponencial (la forma
+incremental de Welford para pesos exponenciales). Cada lectura se incorpora
+en O(1) sin releer el historial, y las lecturas antiguas pierden peso como
+en una ventana móvil de unas ``VENTANA_LECTURAS`` lecturas.
+
+``reconstruir_estadisticas`` recalcula todo desde ``Lectura`` con la misma
+aritmética aplicada a todas las vacas a la vez, así que el resultado coincide
+con el de las actualizaciones sucesivas.
+"""
+import numpy as np
+from django.db import transaction
+from django.utils.timezone import now
+
+from .models import EstadisticaVaca, Lectura, Vaca
+
+VENTANA_LECTURAS = 10
+ALFA = 2 / (VENTANA_LECTURAS + 1)
+
+# Con menos lecturas la línea base no es fiable y el valor relativo es 0
+MIN_LECTURAS = 3
+
+VARIABLES = ('actividad', 'temperatura')
+
+# Vacas por transacción al reconstruir (con ``vacas``, también el límite del ``IN``)
+VACAS_POR_BLOQUE = 500
+
+
+def actualizar(lecturas, media, varianza, valor, alfa=ALFA):
+    """Incorpora ``valor`` a la media y varianza; admite escalares o arreglos.
+
+    ``lecturas`` es la cantidad de lecturas ya incorporadas. Devuelve
+    ``(media, varianza)`` nuevas.
+    """
+    diferencia = valor - media
+    incremento = alfa * diferencia
+    # La primera lectura fija la media y deja la varianza en 0
+    primera = np.asarray(lecturas) == 0
+    media = np.where(primera, valor, media + incremento)
+    varianza = np.where(primera, 0.0, (1 - alfa) * (varianza + diferencia * incremento))
+    return media, varianza
+
+
+def relativo(lecturas, media, varianza, valor):
+    """Desviación de ``valor`` respecto a la media, en desviaciones estándar."""
+    desviacion = np.sqrt(np.asarray(varianza, dtype=float))
+    fiable = (np.asarray(lecturas) >= MIN_LECTURAS) & (desviacion > 0)
+    return np.where(fiable, (valor - media) / np.where(fiable, desviacion, 1.0), 0.0)
+
+
+def caracteristicas_relativas(estadistica, actividad, temperatura):
+    """Campos ``*_relativa`` del codificador para una lectura (0 si no hay estadística)."""
+    if estadistica is None:
+        return {'actividad_relativa': 0.0, 'temperatura_relativa': 0.0}
+    return {
+        f'{variable}_relativa': float(relativo(
+            estadistica.lecturas,
+            getattr(estadistica, f'{variable}_media'),
+            getattr(estadistica, f'{variable}_varianza'),
+            valor,
+        ))
+        for variable, valor in zip(VARIABLES, (actividad, temperatura))
+    }
+
+
+def estadistica_de(vaca):
+    if vaca is None or vaca.pk is None:
+        return None
+    return EstadisticaVaca.objects.filter(vaca=vaca).first()
+
+
+def relativas_por_vaca(ids, actividad, temperatura):
+    """Como ``caracteristicas_relativas`` para muchas vacas; devuelve arreglos por columna."""
+    estadisticas = EstadisticaVaca.objects.in_bulk(list(ids))
+    columnas = {}
+    for variable, valores in zip(VARIABLES, (actividad, temperatura)):
+        lecturas, media, varianza = (
+            np.array([getattr(estadisticas[i], atributo) if i in estadisticas else 0 for i in ids], dtype=float)
+            for atributo in ('lecturas', f'{variable}_media', f'{variable}_varianza')
+        )
+        columnas[f'{variable}_relativa'] = relativo(lecturas, media, varianza, np.asarray(valores, dtype=float))
+    return columnas
+
+
+def relativas_en_orden(claves, actividad, temperatura):
+    """Como ``relativas_por_vaca`` para lecturas en orden cronológico, con varias por vaca.
+
+    ``claves`` indica la vaca de cada lectura. Cada lectura se compara con la
+    línea base que ya incorpora las anteriores de su vaca, como si se hubieran
+    guardado de a una; las claves sin estadística (p. ej. negativas, para
+    vacas aún sin ``pk``) empiezan sin línea base. Igual que en
+    ``reconstruir_estadisticas``, se procesa la k-ésima lectura de todas las
+    vacas a la vez.
+    """
+    claves = np.asarray(claves, dtype=np.int64)
+    unicas, grupo = np.unique(claves, return_inverse=True)
+    grupo = grupo.reshape(-1)
+    estadisticas = EstadisticaVaca.objects.in_bulk([clave for clave in unicas.tolist() if clave > 0])
+    guardadas = np.array([estadisticas[c].lecturas if c in estadisticas else 0 for c in unicas.tolist()], dtype=float)
+
+    # Posición de cada lectura entre las de su vaca
+    conteo = np.bincount(grupo, minlength=len(unicas))
+    inicio = np.repeat(np.cumsum(conteo) - conteo, conteo)
+    posicion = np.empty(len(claves), dtype=np.int64)
+    posicion[np.argsort(grupo, kind='stable')] = np.arange(len(claves)) - inicio
+    orden = np.argsort(posicion, kind='stable')
+    limites = np.searchsorted(posicion[orden], np.arange(conteo.max() + 1 if len(claves) else 0))
+    pasos = [orden[desde:hasta] for desde, hasta in zip(limites, list(limites[1:]) + [len(orden)])]
+
+    columnas = {}
+    for variable, valores in zip(VARIABLES, (actividad, temperatura)):
+        valores = np.asarray(valores, dtype=float)
+        media, varianza = (
+            np.array([getattr(estadisticas[c], atributo) if c in estadisticas else 0 for c in unicas.tolist()],
+                     dtype=float)
+            for atributo in (f'{variable}_media', f'{variable}_varianza')
+        )
+        lecturas = guardadas.copy()
+        relativas = np.zeros(len(claves))
+        for seleccion in pasos:
+            grupos = grupo[seleccion]
+            relativas[seleccion] = relativo(lecturas[grupos], media[grupos], varianza[grupos], valores[seleccion])
+            media[grupos], varianza[grupos] = actualizar(
+                lecturas[grupos], media[grupos], varianza[grupos], valores[seleccion]
+            )
+            lecturas[grupos] += 1
+        columnas[f'{variable}_relativa'] = relativas
+    return columnas
+
+
+def incorporar_lecturas(lecturas):
+    """Actualiza la estadística de cada vaca con sus nuevas ``lecturas`` (en orden)."""
+    if not lecturas:
+        return
+    ahora = now()
+    with transaction.atomic():
+        existentes = EstadisticaVaca.objects.select_for_update().in_bulk({l.vaca_id for l in lecturas})
+        nuevas = {}
+        for lectura in lecturas:
+            estadistica = existentes.get(lectura.vaca_id) or nuevas.get(lectura.vaca_id)
+            if estadistica is None:
+                estadistica = nuevas[lectura.vaca_id] = EstadisticaVaca(vaca_id=lectura.vaca_id)
+            for variable in VARIABLES:
+                media, varianza = actualizar(
+                    estadistica.lecturas,
+                    getattr(estadistica, f'{variable}_media'),
+                    getattr(estadistica, f'{variable}_varianza'),
+                    float(getattr(lectura, variable)),
+                )
+                setattr(estadistica, f'{variable}_media', float(media))
+                setattr(estadistica, f'{variable}_varianza', float(varianza))
+            estadistica.lecturas += 1
+            # bulk_update no asigna auto_now
+            estadistica.actualizada = ahora
+
+        campos = ['lecturas'] + [f'{v}_{s}' for v in VARIABLES for s in ('media', 'varianza')] + ['actualizada']
+        EstadisticaVaca.objects.bulk_create(nuevas.values(), batch_size=1000)
+        EstadisticaVaca.objects.bulk_update(existentes.values(), campos, batch_size=1000)
+
+
+def _bloques_de_vacas(vacas, vacas_por_bloque):
+    """Ids de vacas en orden ascendente, de a ``vacas_por_bloque``; sin ``vacas``, las de todo el rebaño."""
+    if vacas is not None:
+        vacas = sorted(set(vacas))
+        for inicio in range(0, len(vacas), vacas_por_bloque):
+            yield vacas[inicio:inicio + vacas_por_bloque]
+        return
+    ultimo = 0
+    while True:
+        ids = list(Vaca.objects.filter(id__gt=ultimo).order_by('id').values_list('id', flat=True)[:vacas_por_bloque])
+        if not ids:
+            return
+        yield ids
+        ultimo = ids[-1]
+
+
+def _estadisticas_de(filas):
+    """``EstadisticaVaca`` de las lecturas ``filas`` (vaca_id, actividad, temperatura) ordenadas por vaca y fecha."""
+    ids, inicio, conteo = np.unique(filas[:, 0].astype(np.int64), return_index=True, return_counts=True)
+    # Posición de cada lectura dentro del historial de su vaca y grupo (vaca) al que pertenece
+    grupo = np.repeat(np.arange(len(ids)), conteo)
+    posicion = np.arange(len(filas)) - np.repeat(inicio, conteo)
+    orden = np.argsort(posicion, kind='stable')
+    limites = np.searchsorted(posicion[orden], np.arange(conteo.max() + 1 if len(ids) else 0))
+
+    medias = np.zeros((len(VARIABLES), len(ids)))
+    varianzas = np.zeros((len(VARIABLES), len(ids)))
+    for k, (desde, hasta) in enumerate(zip(limites, list(limites[1:]) + [len(orden)])):
+        seleccion = orden[desde:hasta]
+        grupos = grupo[seleccion]
+        for v in range(len(VARIABLES)):
+            medias[v, grupos], varianzas[v, grupos] = actualizar(
+                k, medias[v, grupos], varianzas[v, grupos], filas[seleccion, 1 + v]
+            )
+
+    return [
+        EstadisticaVaca(
+            vaca_id=int(vaca_id),
+            lecturas=int(conteo[g]),
+            **{f'{variable}_media': float(medias[v, g]) for v, variable in enumerate(VARIABLES)},
+            **{f'{variable}_varianza': float(varianzas[v, g]) for v, variable in enumerate(VARIABLES)},
+        )
+        for g, vaca_id in enumerate(ids.tolist())
+    ]
+
+
+def reconstruir_estadisticas(vacas=None, tamano_bloque=10000, vacas_por_bloque=VACAS_POR_BLOQUE):
+    """Recalcula desde el historial la estadística de ``vacas`` (ids) o de todo el rebaño.
+
+    Se recorre por bloques de ``vacas_por_bloque`` vacas, cada uno en su
+    propia transacción, para no cargar el historial completo en memoria. En
+    cada bloque las lecturas se ordenan por vaca y fecha; luego se procesa la
+    k-ésima lectura de todas sus vacas a la vez, de modo que el número de
+    pasos es el largo del historial más extenso y no el total de lecturas.
+    """
+    total = 0
+    for ids in _bloques_de_vacas(vacas, vacas_por_bloque):
+        # Sin lista de vacas, el bloque es el rango completo de ids entre el primero y el último
+        en_bloque = (
+            {'vaca_id__in': ids} if vacas is not None else {'vaca_id__gte': ids[0], 'vaca_id__lte': ids[-1]}
+        )
+        lecturas = Lectura.objects.filter(**en_bloque).order_by('vaca_id', 'fecha', 'id')
+        filas = np.array(
+            list(lecturas.values_list('vaca_id', *VARIABLES).iterator(chunk_size=tamano_bloque)),
+            dtype=float,
+        ).reshape(-1, 1 + len(VARIABLES))
+        estadisticas = _estadisticas_de(filas)
+        with transaction.atomic():
+            EstadisticaVaca.objects.filter(**en_bloque).delete()
+            EstadisticaVaca.objects.bulk_create(estadisticas, batch_size=1000)
+        total += len(estadisticas)
+    return total
@@ -0,0 +1,110 @@
+"""Filtros por parámetros de consulta para el listado de vacas."""
+from datetime import datetime, time, timedelta
+
+from django.conf import settings
+from django.utils import timezone
+from django.utils.dateparse import parse_date, parse_datetime
+from rest_framework.exceptions import ValidationError
+from rest_framework.filters import BaseFilterBackend
+
+from .models import Vaca, ESTADOS_VACA
+
+# Parámetros que interpreta ``filtrar_vacas``
+PARAMETROS_FILTRO = ('finca', 'estado', 'prediccion_min', 'prediccion_max', 'raza', 'desde', 'hasta')
+
+
+def _numero(params, nombre):
+    valor = params.get(nombre)
+    if valor in (None, ''):
+        return None
+    try:
+        return float(valor)
+    except ValueError:
+        raise ValidationError({nombre: 'Debe ser un número.'})
+
+
+def _fecha(params, nombre, fin_del_dia=False):
+    """Convierte ``desde``/``hasta`` en un instante comparable con ``fecha``.
+
+    Devuelve ``(instante, es_dia)``. Con una fecha sin hora el instante es el
+    inicio de ese día (o del día siguiente si ``fin_del_dia``), de modo que el
+    filtro sigue usando el índice sobre ``fecha``.
+    """
+    valor = params.get(nombre)
+    if valor in (None, ''):
+        return None, False
+    try:
+        instante = parse_datetime(valor)
+        es_dia = instante is None
+        if es_dia:
+            dia = parse_date(valor)
+            if dia is None:
+                raise ValueError(valor)
+            if fin_del_dia:
+                dia += timedelta(days=1)
+            instante = datetime.combine(dia, time.min)
+    except ValueError:
+        raise ValidationError({nombre: 'Use el formato AAAA-MM-DD o ISO 8601.'})
+    if settings.USE_TZ and timezone.is_naive(instante):
+        instante = timezone.make_aware(instante)
+    return instante, es_dia
+
+
+def filtrar_vacas(queryset, params):
+    """Aplica a ``queryset`` los filtros de ``params`` (QueryDict o dict de cadenas).
+
+    Parámetros admitidos:
+
+    * ``estado``: ``celo``, ``inseminada`` o ``gestante``.
+    * ``prediccion_min`` / ``prediccion_max``: límites de probabilidad (%).
+    * ``raza``: uno o varios códigos separados por coma (``HOL,SIB``).
+    * ``desde`` / ``hasta``: rango sobre ``fecha`` (fecha o fecha y hora).
+    * ``finca``: id de la finca (dentro de las que ya ve el usuario).
+    """
+    finca = params.get('finca')
+    if finca not in (None, ''):
+        if not str(finca).isdigit():
+            raise ValidationError({'finca': 'Debe ser el id de una finca.'})
+        queryset = queryset.filter(finca_id=int(finca))
+
+    estado = params.get('estado')
+    if estado:
+        if estado not in ESTADOS_VACA:
+            raise ValidationError({'estado': f'Valores posibles: {", ".join(ESTADOS_VACA)}.'})
+        queryset = queryset.filter(ESTADOS_VACA[estado])
+
+    prediccion_min = _numero(params, 'prediccion_min')
+    if prediccion_min is not None:
+        queryset = queryset.filter(prediccion__gte=prediccion_min)
+    prediccion_max = _numero(params, 'prediccion_max')
+    if prediccion_max is not None:
+        queryset = queryset.filter(prediccion__lte=prediccion_max)
+
+    razas = [r.strip() for r in params.get('raza', '').split(',') if r.strip()]
+    if razas:
+        validas = dict(Vaca.RAZAS)
+        invalidas = [r for r in razas if r not in validas]
+        if invalidas:
+            raise ValidationError({'raza': f'Códigos desconocidos: {", ".join(invalidas)}.'})
+        queryset = queryset.filter(raza__in=razas)
+
+    return filtrar_por_fecha(queryset, params)
+
+
+def filtrar_por_fecha(queryset, params):
+    """Aplica ``desde`` / ``hasta`` sobre el campo ``fecha`` de ``queryset``."""
+    desde, _ = _fecha(params, 'desde')
+    if desde is not None:
+        queryset = queryset.filter(fecha__gte=desde)
+    hasta, es_dia = _fecha(params, 'hasta', fin_del_dia=True)
+    if hasta is not None:
+        # ``hasta`` como día incluye el día completo
+        queryset = queryset.filter(fecha__lt=hasta) if es_dia else queryset.filter(fecha__lte=hasta)
+    return queryset
+
+
+class VacaFilterBackend(BaseFilterBackend):
+    """Filtra vacas en la base de datos en lugar de en el navegador (ver ``filtrar_vacas``)."""
+
+    def filter_queryset(self, request, queryset, view):
+        return filtrar_vacas(queryset, request.query_params)
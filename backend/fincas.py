@@ -0,0 +1,66 @@
+"""Separación de los datos por finca.
+
+Cada vaca pertenece a una finca. Los usuarios regulares solo acceden a las
+vacas de la suya; los administradores, a las de todas (``?finca=<id>`` en el
+listado limita a una). Las vistas parten de ``vacas_visibles(usuario)``, de
+modo que cada consulta filtra por finca y usa los índices que empiezan por
+ella, y ``AccesoFinca`` lo exige también sobre cada vaca.
+"""
+from rest_framework.exceptions import ValidationError
+from rest_framework.permissions import BasePermission
+
+from .models import Finca, Vaca
+
+
+def es_administrador(usuario):
+    return usuario.is_superuser or usuario.role == 'admin'
+
+
+def tiene_acceso(usuario):
+    """Administradores y usuarios con finca; un usuario sin finca no accede a ninguna vaca."""
+    return bool(usuario and usuario.is_authenticated and (es_administrador(usuario) or usuario.finca_id))
+
+
+def finca_de(usuario):
+    """Id de la única finca visible para ``usuario``, o None si ve todas."""
+    return None if es_administrador(usuario) else usuario.finca_id
+
+
+def vacas_visibles(usuario, queryset=None):
+    """``queryset`` (por defecto, todas las vacas) limitado a las fincas que ve ``usuario``."""
+    queryset = Vaca.objects.all() if queryset is None else queryset
+    if es_administrador(usuario):
+        return queryset
+    return queryset.filter(finca_id=usuario.finca_id) if usuario.finca_id else queryset.none()
+
+
+def finca_para_alta(usuario, finca=None):
+    """Id de la finca de las vacas que registra ``usuario``.
+
+    Es la finca del usuario; un administrador puede indicar otra con ``finca``
+    (id) y debe hacerlo si no tiene finca propia.
+    """
+    if finca not in (None, '') and es_administrador(usuario):
+        try:
+            return Finca.objects.values_list('pk', flat=True).get(pk=int(finca))
+        except (TypeError, ValueError, Finca.DoesNotExist):
+            raise ValidationError({'finca': 'Finca inexistente.'})
+    if usuario.finca_id is None:
+        raise ValidationError({'finca': 'Indique la finca de las vacas nuevas.'})
+    return usuario.finca_id
+
+
+def finca_por_nombre(nombre):
+    """Finca con ``nombre``, creada si todavía no existe."""
+    return Finca.objects.get_or_create(nombre=nombre.strip())[0]
+
+
+class AccesoFinca(BasePermission):
+    """Exige acceso a alguna finca y, sobre cada vaca, que sea de una finca visible."""
+    message = 'No tiene acceso a las vacas de esta finca.'
+
+    def has_permission(self, request, view):
+        return tiene_acceso(request.user)
+
+    def has_object_permission(self, request, view, obj):
+        return es_administrador(request.user) or obj.finca_id == request.user.finca_id
@@ -0,0 +1,353 @@
+"""Importación masiva de lecturas de sensores (podómetro y temperatura).
+
+El archivo se recorre por bloques sin cargarlo completo en memoria. Cada
+bloque se valida y codifica de forma vectorizada, se evalúa con una sola
+llamada al modelo y se guarda con ``bulk_create`` en su propia transacción.
+
+Cada fila es una lectura de una vaca de la finca. La columna opcional ``id``
+indica la vaca; sin ella se busca por ``nombre`` dentro de la finca (la más
+reciente si hay varias con ese nombre) y, si no existe, se crea. Cada fila se
+agrega al historial de su vaca con la fecha de la columna opcional ``fecha``
+(ISO 8601; sin ella, la de la importación). Dentro de cada bloque las filas se
+procesan por fecha: cada una se compara con la línea base que ya incluye las
+anteriores de su vaca, y la vaca queda con los valores de la más reciente.
+"""
+import csv
+import datetime
+import io
+import itertools
+import os
+import time
+
+import numpy as np
+from django.db import transaction
+from django.utils.dateparse import parse_date, parse_datetime
+from django.utils.timezone import is_naive, make_aware, now
+
+from .cambios import registrar_cambios
+from .estadisticas import relativas_en_orden
+from .lecturas import guardar_lecturas, lectura_de
+from .models import Vaca, RANGOS_LECTURA
+from .prediccion import predecir_columnas
+from .registro_modelo import obtener_modelo
+from .resumen import invalidar_resumen
+
+TAMANO_BLOQUE = 5000
+MAX_ERRORES_REPORTADOS = 100
+
+CAMPOS_OBLIGATORIOS = ('nombre', 'actividad', 'temperatura', 'dias_posparto', 'condicion', 'raza')
+CAMPOS_OPCIONALES = ('parto_asistido', 'id', 'fecha')
+
+# Campos de una vaca existente que reemplaza su última lectura importada
+CAMPOS_ACTUALIZADOS = (
+    'actividad', 'temperatura', 'dias_posparto', 'condicion', 'raza', 'parto_asistido', 'prediccion', 'fecha',
+)
+
+# Valores por consulta al buscar las vacas existentes (SQLite limita los parámetros)
+_LOTE_CONSULTA = 500
+
+# (campo, es entero)
+CAMPOS_NUMERICOS = (
+    ('actividad', True),
+    ('temperatura', False),
+    ('dias_posparto', True),
+    ('condicion', False),
+)
+
+# La raza se acepta por código o por nombre, sin distinguir mayúsculas
+RAZAS_ACEPTADAS = {}
+for _codigo, _nombre in Vaca.RAZAS:
+    RAZAS_ACEPTADAS[_codigo.lower()] = _codigo
+    RAZAS_ACEPTADAS[_nombre.lower()] = _codigo
+
+BOOLEANOS_ACEPTADOS = {
+    '': False, '0': False, '0.0': False, 'false': False, 'no': False,
+    '1': True, '1.0': True, 'true': True, 'si': True, 'sí': True,
+}
+
+
+class ErrorImportacion(Exception):
+    """El archivo no se puede importar (formato, columnas o dependencias)."""
+
+
+def formato_de(nombre_archivo):
+    extension = os.path.splitext(nombre_archivo)[1].lower()
+    if extension in ('.parquet', '.pq'):
+        return 'parquet'
+    return 'csv'
+
+
+def _comprobar_columnas(disponibles):
+    faltantes = [campo for campo in CAMPOS_OBLIGATORIOS if campo not in disponibles]
+    if faltantes:
+        raise ErrorImportacion(f'Faltan columnas: {", ".join(faltantes)}')
+
+
+def bloques_csv(archivo, tamano_bloque=TAMANO_BLOQUE):
+    """Recorre un CSV binario y produce bloques ``campo -> lista de valores``."""
+    lector = csv.reader(io.TextIOWrapper(archivo, encoding='utf-8-sig', newline=''))
+    encabezado = [columna.strip() for columna in next(lector, [])]
+    _comprobar_columnas(encabezado)
+    indices = {
+        campo: encabezado.index(campo)
+        for campo in CAMPOS_OBLIGATORIOS + CAMPOS_OPCIONALES if campo in encabezado
+    }
+    while True:
+        filas = list(itertools.islice(lector, tamano_bloque))
+        if not filas:
+            return
+        yield {
+            campo: [fila[indice] if indice < len(fila) else '' for fila in filas]
+            for campo, indice in indices.items()
+        }
+
+
+def bloques_parquet(archivo, tamano_bloque=TAMANO_BLOQUE):
+    """Recorre un Parquet por lotes de filas (requiere pyarrow)."""
+    try:
+        import pyarrow.parquet as pq
+    except ImportError:
+        raise ErrorImportacion('Para importar archivos Parquet se requiere pyarrow.')
+
+    parquet = pq.ParquetFile(archivo)
+    disponibles = parquet.schema_arrow.names
+    _comprobar_columnas(disponibles)
+    columnas = [campo for campo in CAMPOS_OBLIGATORIOS + CAMPOS_OPCIONALES if campo in disponibles]
+    for lote in parquet.iter_batches(batch_size=tamano_bloque, columns=columnas):
+        yield lote.to_pydict()
+
+
+def leer_bloques(archivo, formato, tamano_bloque=TAMANO_BLOQUE):
+    if formato == 'parquet':
+        return bloques_parquet(archivo, tamano_bloque)
+    if formato == 'csv':
+        return bloques_csv(archivo, tamano_bloque)
+    raise ErrorImportacion(f'Formato no soportado: {formato}')
+
+
+def _texto(valores):
+    return np.char.strip(np.asarray(['' if v is None else v for v in valores]).astype(str))
+
+
+def _numeros(valores, entero, rango=(None, None)):
+    """Convierte una columna a números; devuelve ``(arreglo, máscara de inválidos)``.
+
+    ``rango`` (mínimo, máximo; None es sin límite) invalida los valores fuera de él.
+    """
+    try:
+        arreglo = np.asarray(valores, dtype=float)
+    except (TypeError, ValueError):
+        # Hay algún valor no numérico: solo en ese caso se convierte fila por fila
+        arreglo = np.full(len(valores), np.nan)
+        for i, valor in enumerate(valores):
+            try:
+                arreglo[i] = float(valor)
+            except (TypeError, ValueError):
+                pass
+    invalidos = ~np.isfinite(arreglo)
+    if entero:
+        invalidos |= np.where(invalidos, False, arreglo != np.round(arreglo))
+    minimo, maximo = rango
+    if minimo is not None:
+        invalidos |= arreglo < minimo
+    if maximo is not None:
+        invalidos |= arreglo > maximo
+    return arreglo, invalidos
+
+
+def _categorias(valores, aceptados):
+    """Traduce una columna con ``aceptados``; se consulta una vez por valor distinto."""
+    texto = np.char.lower(_texto(valores))
+    unicos, inversa = np.unique(texto, return_inverse=True)
+    inversa = inversa.reshape(-1)
+    traducidos = np.array([aceptados.get(valor) for valor in unicos.tolist()], dtype=object)
+    validos = np.array([valor in aceptados for valor in unicos.tolist()], dtype=bool)
+    return traducidos[inversa], ~validos[inversa]
+
+
+def _ids(datos, n):
+    """Columna opcional ``id`` como enteros (0 si la fila no lo indica) y máscara de ids inválidos."""
+    if 'id' not in datos:
+        return np.zeros(n, dtype=np.int64), np.zeros(n, dtype=bool)
+    texto = _texto(datos['id'])
+    con_id = texto != ''
+    numeros, invalidos = _numeros(np.where(con_id, texto, '0').tolist(), True)
+    invalidos = con_id & (invalidos | (numeros < 1))
+    return np.where(invalidos, 0, numeros).astype(np.int64), invalidos
+
+
+def _fecha(texto):
+    """Fecha y hora de ``texto`` (ISO 8601, o solo la fecha a las 00:00), o None si no es válida."""
+    try:
+        fecha = parse_datetime(texto)
+        if fecha is None:
+            dia = parse_date(texto)
+            fecha = None if dia is None else datetime.datetime.combine(dia, datetime.time.min)
+    except ValueError:
+        return None
+    if fecha is not None and is_naive(fecha):
+        fecha = make_aware(fecha)
+    return fecha
+
+
+def _fechas(datos, n, ahora):
+    """Columna opcional ``fecha`` (``ahora`` en las filas sin fecha) y máscara de fechas inválidas.
+
+    Sin zona horaria se usa la del proyecto. Se interpreta una vez por valor distinto.
+    """
+    if 'fecha' not in datos:
+        return np.full(n, ahora, dtype=object), np.zeros(n, dtype=bool)
+    # Los valores de Parquet (datetime, date) se leen por su representación ISO
+    unicos, inversa = np.unique(_texto(datos['fecha']), return_inverse=True)
+    inversa = inversa.reshape(-1)
+    traducidas = np.empty(len(unicos), dtype=object)
+    traducidas[:] = [_fecha(texto) if texto else ahora for texto in unicos.tolist()]
+    validas = np.array([fecha is not None for fecha in traducidas], dtype=bool)
+    return np.where(validas, traducidas, ahora)[inversa], ~validas[inversa]
+
+
+def _en_lotes(valores):
+    valores = list(valores)
+    for inicio in range(0, len(valores), _LOTE_CONSULTA):
+        yield valores[inicio:inicio + _LOTE_CONSULTA]
+
+
+def _vacas_de_filas(finca_id, ids, nombres):
+    """Vaca de cada fila (existente o nueva sin guardar) y máscara de ids que no son de la finca.
+
+    Las filas de una misma vaca comparten la instancia.
+    """
+    existentes = {}
+    for lote in _en_lotes(set(ids[ids > 0].tolist())):
+        existentes.update(Vaca.objects.filter(finca_id=finca_id).in_bulk(lote))
+    por_nombre = {}
+    for lote in _en_lotes(set(nombres[ids == 0].tolist())):
+        # Ordenadas por id: con nombres repetidos queda la vaca más reciente
+        for vaca in Vaca.objects.filter(finca_id=finca_id, nombre__in=lote).order_by('id'):
+            por_nombre[vaca.nombre] = existentes.setdefault(vaca.pk, vaca)
+
+    vacas = []
+    desconocidos = np.zeros(len(ids), dtype=bool)
+    for i, (pk, nombre) in enumerate(zip(ids.tolist(), nombres.tolist())):
+        if pk:
+            vaca = existentes.get(pk)
+            desconocidos[i] = vaca is None
+        else:
+            vaca = por_nombre.get(nombre)
+            if vaca is None:
+                vaca = por_nombre[nombre] = Vaca(finca_id=finca_id, nombre=nombre)
+        vacas.append(vaca)
+    return vacas, desconocidos
+
+
+def procesar_bloque(datos, primera_fila, finca_id, ahora=None):
+    """Valida y predice un bloque de lecturas de la finca ``finca_id``.
+
+    Devuelve ``(vacas, lecturas, errores)``: las vacas nuevas quedan sin
+    guardar y las existentes con los valores de su fila más reciente; hay una
+    lectura por fila válida, en orden de fecha (``ahora`` en las filas sin
+    ella; a igual fecha, en el orden del archivo). ``errores`` indica la fila (desde 1,
+    sin contar el encabezado) y los campos inválidos de cada fila descartada;
+    un ``id`` que no es de una vaca de la finca también invalida la fila.
+    """
+    n = len(datos['nombre'])
+    nombres = _texto(datos['nombre'])
+    largo = np.char.str_len(nombres)
+    invalidos = {'nombre': (largo == 0) | (largo > Vaca._meta.get_field('nombre').max_length)}
+
+    columnas = {}
+    for campo, entero in CAMPOS_NUMERICOS:
+        columnas[campo], invalidos[campo] = _numeros(datos[campo], entero, RANGOS_LECTURA.get(campo, (None, None)))
+    columnas['raza'], invalidos['raza'] = _categorias(datos['raza'], RAZAS_ACEPTADAS)
+    columnas['parto_asistido'], invalidos['parto_asistido'] = _categorias(
+        datos.get('parto_asistido', [''] * n), BOOLEANOS_ACEPTADOS
+    )
+    ids, invalidos['id'] = _ids(datos, n)
+    fechas, invalidos['fecha'] = _fechas(datos, n, ahora or now())
+
+    invalida = np.logical_or.reduce(list(invalidos.values()))
+    vacas_filas, desconocidos = _vacas_de_filas(finca_id, ids[~invalida], nombres[~invalida])
+    invalidos['id'][np.flatnonzero(~invalida)[desconocidos]] = True
+    invalida = np.logical_or.reduce(list(invalidos.values()))
+    errores = [
+        {'fila': primera_fila + int(i), 'campos': [campo for campo, mascara in invalidos.items() if mascara[i]]}
+        for i in np.flatnonzero(invalida)
+    ]
+
+    vacas_filas = [vaca for vaca, desconocida in zip(vacas_filas, desconocidos) if not desconocida]
+    validas = ~invalida
+    fechas = fechas[validas]
+    orden = np.argsort(np.array([fecha.timestamp() for fecha in fechas]), kind='stable')
+    vacas_filas = [vacas_filas[i] for i in orden.tolist()]
+    fechas = fechas[orden]
+    columnas = {campo: valores[validas][orden] for campo, valores in columnas.items()}
+    # Cada fila se compara con la línea base de su vaca, que incluye sus filas anteriores;
+    # las vacas nuevas (con clave negativa) empiezan sin línea base
+    nuevas = {}
+    columnas.update(relativas_en_orden(
+        [vaca.pk or nuevas.setdefault(id(vaca), -len(nuevas) - 1) for vaca in vacas_filas],
+        columnas['actividad'], columnas['temperatura'],
+    ))
+    probabilidades = predecir_columnas(columnas, usar_cache=False)
+
+    version = obtener_modelo().version
+    lecturas = []
+    for vaca, fecha, actividad, temperatura, dias_posparto, condicion, raza, parto_asistido, prediccion in zip(
+        vacas_filas, fechas, columnas['actividad'], columnas['temperatura'], columnas['dias_posparto'],
+        columnas['condicion'], columnas['raza'], columnas['parto_asistido'], probabilidades,
+    ):
+        vaca.actividad = int(actividad)
+        vaca.temperatura = float(temperatura)
+        vaca.dias_posparto = int(dias_posparto)
+        vaca.condicion = float(condicion)
+        vaca.raza = raza
+        vaca.parto_asistido = bool(parto_asistido)
+        vaca.prediccion = float(prediccion)
+        lecturas.append(lectura_de(vaca, version, fecha))
+    vacas = list({id(vaca): vaca for vaca in vacas_filas}.values())
+    return vacas, lecturas, errores
+
+
+def importar_lecturas(bloques, finca_id, al_procesar_bloque=None):
+    """Procesa ``bloques`` como lecturas de la finca ``finca_id`` y guarda cada uno en su propia transacción.
+
+    ``al_procesar_bloque`` recibe el resumen parcial después de cada bloque.
+    """
+    inicio = time.perf_counter()
+    resultado = {'procesadas': 0, 'creadas': 0, 'vacas_nuevas': 0, 'con_errores': 0, 'errores': []}
+
+    for datos in bloques:
+        fecha = now()
+        vacas, lecturas, errores = procesar_bloque(datos, resultado['procesadas'] + 1, finca_id, fecha)
+        nuevas = [vaca for vaca in vacas if vaca.pk is None]
+        existentes = [vaca for vaca in vacas if vaca.pk is not None]
+        for vaca in existentes:
+            vaca.fecha = fecha
+        with transaction.atomic():
+            Vaca.objects.bulk_create(nuevas, batch_size=1000)
+            Vaca.objects.bulk_update(existentes, CAMPOS_ACTUALIZADOS, batch_size=1000)
+            # Las lecturas de vacas nuevas toman el pk asignado por bulk_create
+            guardar_lecturas(lecturas, vacas)
+            registrar_cambios(vacas)
+
+        resultado['procesadas'] += len(datos['nombre'])
+        resultado['creadas'] += len(lecturas)
+        resultado['vacas_nuevas'] += len(nuevas)
+        resultado['con_errores'] += len(errores)
+        espacio = MAX_ERRORES_REPORTADOS - len(resultado['errores'])
+        resultado['errores'].extend(errores[:max(espacio, 0)])
+        if al_procesar_bloque is not None:
+            al_procesar_bloque(_con_rendimiento(resultado, inicio))
+
+    if resultado['creadas']:
+        invalidar_resumen()
+    return _con_rendimiento(resultado, inicio)
+
+
+def _con_rendimiento(resultado, inicio):
+    segundos = time.perf_counter() - inicio
+    return dict(
+        resultado,
+        segundos=round(segundos, 3),
+        filas_por_segundo=round(resultado['procesadas'] / segundos, 1) if segundos > 0 else 0.0,
+    )
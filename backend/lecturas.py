@@ -0,0 +1,45 @@
+"""Registro de lecturas en el historial de cada vaca y de las alertas que generan."""
+from django.utils.timezone import now
+
+from .alertas import crear_alertas
+from .estadisticas import incorporar_lecturas
+from .models import Lectura
+
+# Valores de la vaca que se copian a cada lectura
+CAMPOS_LECTURA = ('actividad', 'temperatura', 'dias_posparto', 'condicion', 'prediccion')
+
+
+def lectura_de(vaca, version_modelo, fecha=None):
+    """Lectura (sin guardar) con los valores actuales de ``vaca``."""
+    return Lectura(
+        vaca=vaca,
+        fecha=fecha or now(),
+        version_modelo=version_modelo,
+        **{campo: getattr(vaca, campo) for campo in CAMPOS_LECTURA},
+    )
+
+
+def guardar_lectura(vaca, version_modelo, fecha=None):
+    """Guarda una lectura de ``vaca``, la incorpora a su línea base y crea su alerta si corresponde."""
+    lectura = lectura_de(vaca, version_modelo, fecha)
+    lectura.save()
+    incorporar_lecturas([lectura])
+    crear_alertas([vaca])
+    return lectura
+
+
+def registrar_lecturas(vacas, version_modelo, fecha=None):
+    """Agrega al historial una lectura por vaca con una sola consulta por lote.
+
+    Las vacas ya deben tener ``pk`` (``bulk_create`` lo asigna en PostgreSQL y SQLite).
+    """
+    fecha = fecha or now()
+    return guardar_lecturas([lectura_de(vaca, version_modelo, fecha) for vaca in vacas], vacas)
+
+
+def guardar_lecturas(lecturas, vacas):
+    """Guarda ``lecturas`` ya armadas (varias pueden ser de una misma vaca) y crea las alertas de ``vacas``."""
+    lecturas = Lectura.objects.bulk_create(lecturas, batch_size=1000)
+    incorporar_lecturas(lecturas)
+    crear_alertas(vacas)
+    return lecturas
@@ -0,0 +1,140 @@
+import json
+import platform
+import tempfile
+from datetime import datetime
+
+from django.contrib.auth import get_user_model
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection
+
+from backend import benchmark
+from backend.fincas import finca_por_nombre
+from backend.importacion import importar_lecturas
+from backend.models import Vaca
+from backend.sintetico import generar_bloques, lecturas_sinteticas
+
+
+def _porcentaje(cambio):
+    return 'n/d' if cambio is None else f'{cambio:+}%'
+
+
+def _mezcla(texto):
+    mezcla = {}
+    for parte in filter(None, (p.strip() for p in texto.split(','))):
+        escenario, _, peso = parte.partition('=')
+        if escenario not in benchmark.ESCENARIOS:
+            raise CommandError(f'Escenario desconocido: {escenario} (posibles: {", ".join(benchmark.ESCENARIOS)})')
+        try:
+            mezcla[escenario] = float(peso)
+        except ValueError:
+            raise CommandError(f'Peso inválido en --mezcla: {parte}')
+    return mezcla
+
+
+class Command(BaseCommand):
+    help = ('Mide latencia (p50/p95/p99) y peticiones por segundo de /predecir/, reevaluar y el listado de '
+            'vacas. Por defecto usa una base de datos de prueba temporal y el cliente en proceso.')
+
+    def add_arguments(self, parser):
+        parser.add_argument('--vacas', type=int, default=1000, help='Vacas sintéticas a crear antes de medir')
+        parser.add_argument('--peticiones', type=int, default=1000)
+        parser.add_argument('--concurrencia', type=int, default=8)
+        parser.add_argument('--mezcla', default='predecir=6,reevaluar=2,listar=2')
+        parser.add_argument('--semilla', type=int, default=42)
+        parser.add_argument('--url', help='Servidor en marcha (p. ej. http://127.0.0.1:8000); no crea vacas')
+        parser.add_argument('--token', help='Token JWT de acceso para --url')
+        parser.add_argument('--salida', help='Archivo JSON de resultados (por defecto benchmark-<fecha>.json)')
+        parser.add_argument('--comparar', help='Resultado JSON anterior con el que comparar')
+
+    def handle(self, *args, **options):
+        mezcla = _mezcla(options['mezcla'])
+        if options['url']:
+            resultado = self._medir(benchmark.ClienteHTTP(options['url'], options['token']), options, mezcla)
+        else:
+            # Base de datos de prueba: no toca los datos reales y se elimina al terminar
+            nombre_original = connection.settings_dict['NAME']
+            opciones_originales = connection.settings_dict['OPTIONS']
+            if connection.vendor == 'sqlite':
+                # En archivo: la base en memoria compartida bloquea tablas entre hilos
+                temporal = tempfile.NamedTemporaryFile(suffix='.sqlite3', delete=False)
+                temporal.close()
+                connection.settings_dict['TEST']['NAME'] = temporal.name
+                # SQLite admite un solo escritor. Con transacciones IMMEDIATE cada hilo espera el
+                # bloqueo al empezar (hasta ``timeout`` s) en vez de fallar con "database is locked"
+                # al pasar de lectura a escritura dentro de la transacción
+                connection.settings_dict['OPTIONS'] = {
+                    **opciones_originales, 'transaction_mode': 'IMMEDIATE', 'timeout': 60,
+                }
+                if options['concurrencia'] > 1:
+                    self.stderr.write(self.style.WARNING(
+                        'SQLite serializa las escrituras: con --concurrencia mayor que 1 la latencia incluye '
+                        'la espera del bloqueo de la base de datos.'
+                    ))
+            connection.creation.create_test_db(verbosity=0, autoclobber=True)
+            try:
+                finca = finca_por_nombre('benchmark')
+                usuario = get_user_model().objects.create_user('benchmark', password=None, role='user', finca=finca)
+                bloques = generar_bloques(options['vacas'], semilla=options['semilla'], tamano_bloque=5000)
+                sembradas = importar_lecturas(lecturas_sinteticas(bloques), finca.pk)['vacas_nuevas']
+                self.stdout.write(f'{sembradas} vacas sintéticas creadas')
+                resultado = self._medir(benchmark.ClienteLocal(usuario), options, mezcla)
+            finally:
+                connection.creation.destroy_test_db(nombre_original, verbosity=0)
+                connection.settings_dict['OPTIONS'] = opciones_originales
+
+        fallidas = resultado['total']['errores']
+        if fallidas:
+            # Los percentiles mezclarían peticiones fallidas (p. ej. bloqueos) con las válidas
+            detalle = ', '.join(f"{e}: {d['errores']}" for e, d in resultado['endpoints'].items() if d['errores'])
+            raise CommandError(
+                f"{fallidas} de {resultado['total']['peticiones']} peticiones fallaron ({detalle}); "
+                'no se genera el informe.'
+            )
+
+        anterior = None
+        if options['comparar']:
+            with open(options['comparar'], encoding='utf-8') as f:
+                anterior = json.load(f)
+            resultado['comparacion'] = {'archivo': options['comparar'], 'commit': anterior.get('commit'),
+                                        'cambios_pct': benchmark.comparar(resultado, anterior)}
+
+        salida = options['salida'] or f"benchmark-{datetime.now():%Y%m%d-%H%M%S}.json"
+        with open(salida, 'w', encoding='utf-8') as f:
+            json.dump(resultado, f, ensure_ascii=False, indent=2)
+        self._imprimir(resultado)
+        self.stdout.write(self.style.SUCCESS(f'Resultados en {salida}'))
+
+    def _medir(self, cliente, options, mezcla):
+        ids = list(Vaca.objects.values_list('id', flat=True)[:10000]) if not options['url'] else []
+        if options['url'] and mezcla.get('reevaluar'):
+            # Contra un servidor externo las vacas se toman del listado
+            raise CommandError('Con --url use una mezcla sin reevaluar (p. ej. --mezcla predecir=8,listar=2)')
+        try:
+            mediciones, errores, segundos = benchmark.ejecutar(
+                cliente, ids, mezcla, options['peticiones'], options['concurrencia'], semilla=options['semilla'],
+            )
+        except ValueError as e:
+            raise CommandError(str(e))
+        return {
+            'fecha': datetime.now().isoformat(timespec='seconds'),
+            'commit': benchmark.commit_actual(),
+            'entorno': {'python': platform.python_version(), 'base_de_datos': connection.vendor,
+                        'destino': options['url'] or 'en proceso'},
+            'parametros': {campo: options[campo] for campo in ('vacas', 'peticiones', 'concurrencia', 'semilla')},
+            'mezcla': mezcla,
+            **benchmark.resumir(mediciones, errores, segundos),
+        }
+
+    def _imprimir(self, resultado):
+        self.stdout.write(f"{'endpoint':<12}{'n':>7}{'err':>6}{'p50 ms':>10}{'p95 ms':>10}{'p99 ms':>10}{'req/s':>10}")
+        filas = list(resultado['endpoints'].items()) + [('total', resultado['total'])]
+        for nombre, datos in filas:
+            self.stdout.write(
+                f"{nombre:<12}{datos['peticiones']:>7}{datos['errores']:>6}{datos['p50_ms']:>10}"
+                f"{datos['p95_ms']:>10}{datos['p99_ms']:>10}{datos['peticiones_por_segundo']:>10}"
+            )
+        for endpoint, cambios in resultado.get('comparacion', {}).get('cambios_pct', {}).items():
+            self.stdout.write(
+                f"  {endpoint}: p95 {_porcentaje(cambios['p95_ms'])}  "
+                f"req/s {_porcentaje(cambios['peticiones_por_segundo'])}"
+            )
@@ -0,0 +1,49 @@
+import time
+
+from django.core.management.base import BaseCommand, CommandError
+
+from backend.models import Vaca
+from backend.serializers import VacaListaSerializer, VacaSerializer
+
+
+def _mejor_tiempo(funcion, repeticiones):
+    mejor, resultado = None, None
+    for _ in range(repeticiones):
+        inicio = time.perf_counter()
+        resultado = funcion()
+        segundos = time.perf_counter() - inicio
+        mejor = segundos if mejor is None else min(mejor, segundos)
+    return mejor, resultado
+
+
+class Command(BaseCommand):
+    help = ('Compara VacaSerializer (ModelSerializer sobre instancias) con VacaListaSerializer (sobre values()) '
+            'en el listado de vacas, incluida la consulta. Solo lee las vacas existentes.')
+
+    def add_arguments(self, parser):
+        parser.add_argument('--filas', type=int, default=5000, help='Vacas a serializar en cada medición')
+        parser.add_argument('--repeticiones', type=int, default=5, help='Se informa el mejor tiempo')
+        parser.add_argument('--campos', help='Campos separados por coma, como ?fields= del listado')
+
+    def handle(self, *args, **options):
+        campos = options['campos'].split(',') if options['campos'] else None
+        filas = options['filas']
+        queryset = Vaca.objects.order_by('-fecha', '-id')[:filas]
+        disponibles = queryset.count()
+        if not disponibles:
+            raise CommandError('No hay vacas: genere datos con generar_rebano o importar_lecturas')
+
+        ligero = VacaListaSerializer(campos)
+        modelo_serializer = lambda: VacaSerializer(list(queryset), many=True, fields=campos).data
+        lista_serializer = lambda: ligero.serializar(queryset.values(*ligero.columnas))
+
+        t_modelo, esperado = _mejor_tiempo(modelo_serializer, options['repeticiones'])
+        t_lista, obtenido = _mejor_tiempo(lista_serializer, options['repeticiones'])
+        if [dict(fila) for fila in esperado] != obtenido:
+            raise CommandError('VacaListaSerializer no devuelve lo mismo que VacaSerializer')
+
+        self.stdout.write(f'{disponibles} vacas, mejor de {options["repeticiones"]} repeticiones')
+        self.stdout.write(f"{'serializador':<22}{'ms':>10}{'filas/s':>12}")
+        for nombre, segundos in (('VacaSerializer', t_modelo), ('VacaListaSerializer', t_lista)):
+            self.stdout.write(f'{nombre:<22}{segundos * 1000:>10.1f}{disponibles / segundos:>12.0f}')
+        self.stdout.write(self.style.SUCCESS(f'Aceleración: x{t_modelo / t_lista:.1f} con resultados idénticos'))
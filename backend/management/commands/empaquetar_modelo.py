@@ -0,0 +1,59 @@
+import time
+
+import joblib
+from django.core.management.base import BaseCommand, CommandError
+
+from backend.bosque import compilar_modelo
+from backend.codificador import CodificadorCaracteristicas
+from backend.paquete_modelo import PaqueteInvalido, escribir_paquete, leer_paquete
+from backend.registro_modelo import COLUMNAS_PATH, MODELO_PATH, PAQUETE_PATH
+
+
+class Command(BaseCommand):
+    help = ('Convierte el modelo .pkl y columnas_rf.json en el paquete versionado que carga la API, '
+            'o verifica un paquete existente.')
+
+    def add_arguments(self, parser):
+        parser.add_argument('--modelo', default=MODELO_PATH, help='Modelo de sklearn (.pkl) a convertir')
+        parser.add_argument('--columnas', default=COLUMNAS_PATH, help='Codificador (columnas_rf.json)')
+        parser.add_argument('--salida', default=PAQUETE_PATH, help='Ruta del paquete')
+        parser.add_argument('--verificar', action='store_true',
+                            help='Solo comprueba el checksum y el esquema del paquete de --salida')
+
+    def handle(self, *args, **options):
+        if not options['verificar']:
+            self._empaquetar(options)
+
+        inicio = time.perf_counter()
+        try:
+            paquete = leer_paquete(options['salida'])
+        except (OSError, PaqueteInvalido) as e:
+            raise CommandError(f'Paquete inválido: {e}')
+        self.stdout.write(self.style.SUCCESS(
+            f'Paquete válido: versión {paquete.checksum[:12]}, {len(paquete.codificador.columnas)} columnas, '
+            f'{paquete.bosque.n_arboles} árboles, cargado en {(time.perf_counter() - inicio) * 1000:.1f} ms'
+        ))
+
+    def _empaquetar(self, options):
+        # El pickle solo se lee aquí, una vez y desde un archivo propio; la API ya no lo deserializa
+        modelo = joblib.load(options['modelo'])
+        bosque = compilar_modelo(modelo)
+        if bosque is modelo:
+            raise CommandError('Solo los Random Forest de sklearn pueden empaquetarse')
+        codificador = CodificadorCaracteristicas.cargar(options['columnas'])
+        metadatos = {
+            'origen': 'empaquetar_modelo',
+            'estimador': type(modelo).__name__,
+            'parametros': {k: v for k, v in modelo.get_params().items() if isinstance(v, (int, float, str, bool, type(None)))},
+            'n_caracteristicas': int(getattr(modelo, 'n_features_in_', len(codificador.columnas))),
+        }
+        if metadatos['n_caracteristicas'] != len(codificador.columnas):
+            raise CommandError(
+                f'El modelo espera {metadatos["n_caracteristicas"]} características '
+                f'y el codificador tiene {len(codificador.columnas)} columnas'
+            )
+        try:
+            checksum = escribir_paquete(options['salida'], bosque, codificador, metadatos)
+        except PaqueteInvalido as e:
+            raise CommandError(str(e))
+        self.stdout.write(f'Paquete escrito en {options["salida"]} (sha256 {checksum})')
@@ -0,0 +1,73 @@
+import time
+
+from django.core.management.base import BaseCommand, CommandError
+
+from backend import importacion
+from backend.fincas import finca_por_nombre
+from backend.sintetico import (
+    COLUMNAS, COLUMNAS_LECTURAS, TAMANO_BLOQUE, escribir_csv, escribir_parquet, generar_bloques, lecturas_sinteticas,
+)
+
+
+def _mezcla(texto):
+    """``"Holstein=3,Criolla=1"`` -> ``{'Holstein': 3.0, 'Criolla': 1.0}``."""
+    mezcla = {}
+    for parte in filter(None, (p.strip() for p in texto.split(','))):
+        nombre, _, peso = parte.partition('=')
+        try:
+            mezcla[nombre.strip()] = float(peso)
+        except ValueError:
+            raise CommandError(f'Peso inválido en --razas: {parte}')
+    return mezcla
+
+
+class Command(BaseCommand):
+    help = 'Genera un rebaño sintético y lo escribe en CSV, Parquet o directamente en la base de datos.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('filas', type=int)
+        parser.add_argument('--formato', choices=['csv', 'parquet', 'db'], default='csv')
+        parser.add_argument('--salida', help='Archivo de salida (csv/parquet)')
+        parser.add_argument(
+            '--columnas', choices=['entrenamiento', 'lecturas'], default='entrenamiento',
+            help='csv/parquet: columnas de entrenamiento (con celo_posparto) o de lecturas, '
+                 'importables con importar_lecturas (nombre, condicion, actividad entera)',
+        )
+        parser.add_argument('--semilla', type=int, default=42)
+        parser.add_argument('--razas', default='', help='Mezcla de razas por nombre, p. ej. "Holstein=3,Criolla=1"')
+        parser.add_argument('--ruido', type=float, default=0.0, help='Probabilidad de invertir cada etiqueta')
+        parser.add_argument('--bloque', type=int, default=None, help='Filas por bloque')
+        parser.add_argument('--finca', help='Finca de las vacas con --formato db (se crea si no existe)')
+
+    def handle(self, *args, **options):
+        formato = options['formato']
+        if formato != 'db' and not options['salida']:
+            raise CommandError('Indique --salida para los formatos csv y parquet')
+        if formato == 'db' and not options['finca']:
+            raise CommandError('Indique --finca para el formato db')
+
+        # En la base de datos se usa el mismo tamaño de bloque que la importación de archivos
+        tamano_bloque = options['bloque'] or (importacion.TAMANO_BLOQUE if formato == 'db' else TAMANO_BLOQUE)
+        try:
+            bloques = generar_bloques(
+                options['filas'], semilla=options['semilla'], mezcla_razas=_mezcla(options['razas']),
+                ruido=options['ruido'], tamano_bloque=tamano_bloque,
+            )
+            columnas = COLUMNAS
+            if options['columnas'] == 'lecturas':
+                bloques, columnas = lecturas_sinteticas(bloques), COLUMNAS_LECTURAS
+            inicio = time.perf_counter()
+            if formato == 'csv':
+                filas = escribir_csv(options['salida'], bloques, columnas)
+            elif formato == 'parquet':
+                filas = escribir_parquet(options['salida'], bloques, columnas)
+            else:
+                finca_id = finca_por_nombre(options['finca']).pk
+                filas = importacion.importar_lecturas(lecturas_sinteticas(bloques), finca_id)['creadas']
+        except ValueError as e:
+            raise CommandError(str(e))
+
+        segundos = time.perf_counter() - inicio
+        self.stdout.write(self.style.SUCCESS(
+            f'{filas} filas ({formato}) en {segundos:.1f} s ({filas / segundos if segundos else 0:.0f} filas/s)'
+        ))
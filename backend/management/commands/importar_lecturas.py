@@ -0,0 +1,40 @@
+from django.core.management.base import BaseCommand, CommandError
+
+from backend.fincas import finca_por_nombre
+from backend.importacion import TAMANO_BLOQUE, ErrorImportacion, formato_de, importar_lecturas, leer_bloques
+
+
+class Command(BaseCommand):
+    help = ('Importa por bloques un archivo CSV o Parquet de lecturas de sensores y predice cada fila. '
+            'Cada fila se agrega al historial (con la fecha de la columna opcional fecha) de la vaca de la '
+            'finca indicada por la columna opcional id '
+            'o, sin ella, por nombre; si no existe se crea.')
+
+    def add_arguments(self, parser):
+        parser.add_argument('ruta', help='Archivo CSV o Parquet con las lecturas')
+        parser.add_argument('--finca', required=True, help='Nombre de la finca de las vacas (se crea si no existe)')
+        parser.add_argument('--formato', choices=['csv', 'parquet'], help='Por defecto se deduce de la extensión')
+        parser.add_argument('--bloque', type=int, default=TAMANO_BLOQUE, help='Filas por bloque y transacción')
+
+    def handle(self, *args, **options):
+        formato = options['formato'] or formato_de(options['ruta'])
+        try:
+            with open(options['ruta'], 'rb') as archivo:
+                resultado = importar_lecturas(
+                    leer_bloques(archivo, formato, options['bloque']),
+                    finca_por_nombre(options['finca']).pk,
+                    al_procesar_bloque=self._mostrar_progreso,
+                )
+        except (OSError, ErrorImportacion) as e:
+            raise CommandError(str(e))
+
+        for error in resultado['errores']:
+            self.stderr.write(f"Fila {error['fila']}: campos inválidos {', '.join(error['campos'])}")
+        self.stdout.write(self.style.SUCCESS(
+            f"{resultado['creadas']} lecturas importadas ({resultado['vacas_nuevas']} vacas nuevas), "
+            f"{resultado['con_errores']} con errores, "
+            f"{resultado['segundos']} s ({resultado['filas_por_segundo']} filas/s)"
+        ))
+
+    def _mostrar_progreso(self, parcial):
+        self.stdout.write(f"  {parcial['procesadas']} filas procesadas ({parcial['filas_por_segundo']} filas/s)")
@@ -0,0 +1,28 @@
+import time
+
+from django.core.management.base import BaseCommand
+
+from backend.tareas import TAMANO_LOTE, ejecutar_tarea, tomar_siguiente_tarea
+
+
+class Command(BaseCommand):
+    help = 'Trabajador local que procesa las tareas de reevaluación encoladas en la base de datos.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--una-vez', action='store_true', help='Procesa las tareas pendientes y termina')
+        parser.add_argument('--intervalo', type=float, default=5.0, help='Segundos entre consultas a la cola')
+        parser.add_argument('--lote', type=int, default=TAMANO_LOTE, help='Vacas por lote')
+
+    def handle(self, *args, **options):
+        while True:
+            tarea = tomar_siguiente_tarea()
+            if tarea is None:
+                if options['una_vez']:
+                    return
+                time.sleep(options['intervalo'])
+                continue
+
+            self.stdout.write(f'Procesando tarea {tarea.pk} ({tarea.total} vacas, desde id {tarea.ultimo_id})')
+            tarea = ejecutar_tarea(tarea, options['lote'])
+            estilo = self.style.SUCCESS if tarea.estado == 'completada' else self.style.ERROR
+            self.stdout.write(estilo(str(tarea)))
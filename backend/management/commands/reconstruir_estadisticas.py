@@ -0,0 +1,19 @@
+import time
+
+from django.core.management.base import BaseCommand
+
+from backend.estadisticas import reconstruir_estadisticas
+
+
+class Command(BaseCommand):
+    help = 'Recalcula desde el historial de lecturas la línea base de actividad y temperatura de cada vaca.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('vacas', nargs='*', type=int, help='Ids de vacas (por defecto, todo el rebaño)')
+
+    def handle(self, *args, **options):
+        inicio = time.perf_counter()
+        total = reconstruir_estadisticas(options['vacas'] or None)
+        self.stdout.write(self.style.SUCCESS(
+            f'{total} vacas recalculadas en {time.perf_counter() - inicio:.2f} s'
+        ))
@@ -0,0 +1,50 @@
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection, transaction
+
+from backend.models import Finca, Vaca, ESTADOS_VACA
+
+
+def consultas_frecuentes(finca_id):
+    """Consultas de VacaViewSet y el índice que debe resolver cada una.
+
+    Las de un usuario regular filtran por su finca (``finca_id``); el listado
+    de todas las fincas es el de los administradores.
+    """
+    de_finca = Vaca.objects.filter(finca_id=finca_id)
+    return [
+        ('listado por fecha (administrador)', Vaca.objects.order_by('-fecha', '-id'), 'vaca_fecha_idx'),
+        ('listado por fecha', de_finca.order_by('-fecha', '-id'), 'vaca_finca_fecha_idx'),
+        ('filtro por raza', de_finca.filter(raza='HOL').order_by('-fecha'), 'vaca_finca_raza_idx'),
+        ('posible celo', de_finca.filter(ESTADOS_VACA['celo']).order_by('-fecha'), 'vaca_finca_celo_idx'),
+        ('inseminadas', de_finca.filter(ESTADOS_VACA['inseminada']).order_by('-fecha'), 'vaca_finca_inseminada_idx'),
+        ('gestantes', de_finca.filter(ESTADOS_VACA['gestante']).order_by('-fecha'), 'vaca_finca_gestante_idx'),
+    ]
+
+
+class Command(BaseCommand):
+    help = 'Muestra el plan de las consultas frecuentes sobre Vaca y comprueba que usan sus índices (SQLite y PostgreSQL).'
+
+    def handle(self, *args, **options):
+        if connection.vendor not in ('sqlite', 'postgresql'):
+            raise CommandError(f'Base de datos no soportada: {connection.vendor}')
+
+        fallos = []
+        with transaction.atomic():
+            if connection.vendor == 'postgresql':
+                # Con pocas filas el planificador prefiere recorrer la tabla; aquí interesa si el índice es utilizable
+                with connection.cursor() as cursor:
+                    cursor.execute('SET LOCAL enable_seqscan = off')
+
+            # Cualquier finca sirve para el plan; sin fincas, un id cualquiera
+            finca_id = Finca.objects.values_list('pk', flat=True).first() or 1
+            for nombre, queryset, indice in consultas_frecuentes(finca_id):
+                plan = queryset.explain()
+                if indice in plan:
+                    self.stdout.write(self.style.SUCCESS(f'[OK] {nombre}: usa {indice}'))
+                else:
+                    fallos.append(nombre)
+                    self.stdout.write(self.style.ERROR(f'[FALLO] {nombre}: no usa {indice}'))
+                self.stdout.write(f'    {plan}'.replace('\n', '\n    '))
+
+        if fallos:
+            raise CommandError(f'Consultas sin índice: {", ".join(fallos)}')
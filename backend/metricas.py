@@ -0,0 +1,190 @@
+"""Métricas de inferencia en memoria, exportadas en formato de texto de Prometheus.
+
+No requiere ``prometheus_client`` ni ningún servicio externo: cada proceso
+acumula sus propios histogramas y ``/metrics`` los devuelve en el formato
+que Prometheus sabe leer. Con varios procesos (gunicorn) cada uno expone los
+suyos; Prometheus los distingue por instancia.
+"""
+import bisect
+import contextvars
+import threading
+import time
+from contextlib import contextmanager
+
+# Límites superiores de los buckets (segundos)
+LIMITES_DURACION = (0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+# Límites de los buckets de filas por llamada al modelo
+LIMITES_LOTE = (1, 2, 5, 10, 50, 100, 200, 500, 1000, 5000, 10000, 50000)
+
+
+def _etiquetas(nombres, valores):
+    if not nombres:
+        return ''
+    pares = ','.join(f'{n}="{_escapar(v)}"' for n, v in zip(nombres, valores))
+    return '{' + pares + '}'
+
+
+def _escapar(valor):
+    return str(valor).replace('\\', '\\\\').replace('\n', '\\n').replace('"', '\\"')
+
+
+def _numero(valor):
+    if valor == float('inf'):
+        return '+Inf'
+    return repr(float(valor)) if isinstance(valor, float) else str(valor)
+
+
+class Histograma:
+    """Histograma con etiquetas; ``observar`` cuesta una búsqueda binaria y un lock."""
+
+    tipo = 'histogram'
+
+    def __init__(self, nombre, ayuda, limites, etiquetas=()):
+        self.nombre = nombre
+        self.ayuda = ayuda
+        self.limites = tuple(limites)
+        self.etiquetas = tuple(etiquetas)
+        self._series = {}
+        self._lock = threading.Lock()
+
+    def observar(self, valor, *valores_etiquetas):
+        indice = bisect.bisect_left(self.limites, valor)
+        with self._lock:
+            serie = self._series.get(valores_etiquetas)
+            if serie is None:
+                # Conteos por bucket (el último es +Inf), suma y total
+                serie = self._series[valores_etiquetas] = [[0] * (len(self.limites) + 1), 0.0, 0]
+            serie[0][indice] += 1
+            serie[1] += valor
+            serie[2] += 1
+
+    def muestras(self):
+        with self._lock:
+            series = {clave: ([*conteos], suma, total) for clave, (conteos, suma, total) in self._series.items()}
+        for valores, (conteos, suma, total) in sorted(series.items()):
+            acumulado = 0
+            for limite, conteo in zip(self.limites + (float('inf'),), conteos):
+                acumulado += conteo
+                yield (f'{self.nombre}_bucket', self.etiquetas + ('le',), valores + (_numero(limite),), acumulado)
+            yield f'{self.nombre}_sum', self.etiquetas, valores, suma
+            yield f'{self.nombre}_count', self.etiquetas, valores, total
+
+    def limpiar(self):
+        with self._lock:
+            self._series.clear()
+
+
+class Contador:
+    """Contador que solo crece; ``nombre`` termina en ``_total``.
+
+    El formato de exposición exige que ``# HELP``/``# TYPE`` y las muestras
+    usen el mismo nombre, así que el sufijo forma parte de él.
+    """
+    tipo = 'counter'
+
+    def __init__(self, nombre, ayuda, etiquetas=()):
+        if not nombre.endswith('_total'):
+            raise ValueError(f'El nombre de un contador debe terminar en _total: {nombre}')
+        self.nombre = nombre
+        self.ayuda = ayuda
+        self.etiquetas = tuple(etiquetas)
+        self._valores = {}
+        self._lock = threading.Lock()
+
+    def incrementar(self, *valores_etiquetas, cantidad=1):
+        with self._lock:
+            self._valores[valores_etiquetas] = self._valores.get(valores_etiquetas, 0) + cantidad
+
+    def muestras(self):
+        with self._lock:
+            valores = dict(self._valores)
+        for clave, valor in sorted(valores.items()):
+            yield self.nombre, self.etiquetas, clave, valor
+
+    def limpiar(self):
+        with self._lock:
+            self._valores.clear()
+
+
+class Medidor:
+    """Valor leído al exportar (``funcion`` devuelve ``{valores_etiquetas: valor}``).
+
+    Sirve para exponer contadores que ya lleva otro componente (``tipo='counter'``).
+    """
+
+    def __init__(self, nombre, ayuda, funcion, etiquetas=(), tipo='gauge'):
+        self.tipo = tipo
+        self.nombre = nombre
+        self.ayuda = ayuda
+        self.etiquetas = tuple(etiquetas)
+        self.funcion = funcion
+
+    def muestras(self):
+        for clave, valor in sorted(self.funcion().items()):
+            yield self.nombre, self.etiquetas, clave, valor
+
+    def limpiar(self):
+        pass
+
+
+class Registro:
+    def __init__(self):
+        self._metricas = []
+
+    def registrar(self, metrica):
+        self._metricas.append(metrica)
+        return metrica
+
+    def exportar(self):
+        """Texto en el formato de exposición de Prometheus (versión 0.0.4)."""
+        lineas = []
+        for metrica in self._metricas:
+            lineas.append(f'# HELP {metrica.nombre} {metrica.ayuda}')
+            lineas.append(f'# TYPE {metrica.nombre} {metrica.tipo}')
+            for nombre, etiquetas, valores, valor in metrica.muestras():
+                lineas.append(f'{nombre}{_etiquetas(etiquetas, valores)} {_numero(valor)}')
+        return '\n'.join(lineas) + '\n'
+
+    def limpiar(self):
+        for metrica in self._metricas:
+            metrica.limpiar()
+
+
+registro = Registro()
+
+duracion_etapas = registro.registrar(Histograma(
+    'celo_etapa_segundos', 'Duración de cada etapa de la predicción (segundos).',
+    LIMITES_DURACION, etiquetas=('vista', 'etapa'),
+))
+filas_por_llamada = registro.registrar(Histograma(
+    'celo_filas_por_prediccion', 'Filas evaluadas por el modelo en cada llamada (tras la caché).',
+    LIMITES_LOTE, etiquetas=('motor',),
+))
+predicciones = registro.registrar(Contador(
+    'celo_predicciones_total', 'Filas cuya probabilidad se devolvió, incluidas las servidas por la caché.',
+))
+
+# Vista a la que se atribuyen las etapas medidas (por hilo o tarea asíncrona)
+_vista = contextvars.ContextVar('vista_metricas', default='otra')
+
+
+@contextmanager
+def vista_actual(nombre):
+    """Atribuye a ``nombre`` las etapas medidas dentro del bloque (y mide el total)."""
+    token = _vista.set(nombre)
+    try:
+        with medir('total'):
+            yield
+    finally:
+        _vista.reset(token)
+
+
+@contextmanager
+def medir(etapa):
+    """Registra la duración del bloque como ``etapa`` de la vista en curso."""
+    inicio = time.perf_counter()
+    try:
+        yield
+    finally:
+        duracion_etapas.observar(time.perf_counter() - inicio, _vista.get(), etapa)
@@ -0,0 +1,66 @@
+# Generated by Django 5.2.1 on 2026-10-18 10:50
+
+import django.contrib.auth.models
+import django.contrib.auth.validators
+import django.utils.timezone
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = [
+        ('auth', '0012_alter_user_first_name_max_length'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='Vaca',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('nombre', models.CharField(max_length=50, verbose_name='Nombre de la vaca')),
+                ('actividad', models.IntegerField(verbose_name='Actividad física (pasos/día)')),
+                ('temperatura', models.FloatField(verbose_name='Temperatura corporal (°C)')),
+                ('dias_posparto', models.IntegerField(verbose_name='Días posparto')),
+                ('condicion', models.FloatField(verbose_name='Condición corporal (1-5)')),
+                ('raza', models.CharField(choices=[('SIB', 'Siboney de Cuba'), ('MAM', 'Mambi de Cuba'), ('TAI', 'Taino'), ('CRI', 'Criolla'), ('CEB', 'Cebu'), ('CRU', 'Cruzamiento'), ('CHA', 'Chacuba'), ('HOL', 'Holstein')], max_length=3)),
+                ('parto_asistido', models.BooleanField(verbose_name='¿Tuvo parto asistido previo?')),
+                ('prediccion', models.FloatField(verbose_name='Probabilidad de celo (%)')),
+                ('fecha', models.DateTimeField(auto_now_add=True)),
+                ('inseminada', models.BooleanField(default=False)),
+                ('fecha_inseminacion', models.DateTimeField(blank=True, null=True)),
+                ('gestante', models.BooleanField(default=False, verbose_name='¿Está gestante?')),
+                ('fecha_gestacion', models.DateTimeField(blank=True, null=True)),
+            ],
+        ),
+        migrations.CreateModel(
+            name='CustomUser',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('password', models.CharField(max_length=128, verbose_name='password')),
+                ('last_login', models.DateTimeField(blank=True, null=True, verbose_name='last login')),
+                ('is_superuser', models.BooleanField(default=False, help_text='Designates that this user has all permissions without explicitly assigning them.', verbose_name='superuser status')),
+                ('username', models.CharField(error_messages={'unique': 'A user with that username already exists.'}, help_text='Required. 150 characters or fewer. Letters, digits and @/./+/-/_ only.', max_length=150, unique=True, validators=[django.contrib.auth.validators.UnicodeUsernameValidator()], verbose_name='username')),
+                ('first_name', models.CharField(blank=True, max_length=150, verbose_name='first name')),
+                ('last_name', models.CharField(blank=True, max_length=150, verbose_name='last name')),
+                ('email', models.EmailField(blank=True, max_length=254, verbose_name='email address')),
+                ('is_staff', models.BooleanField(default=False, help_text='Designates whether the user can log into this admin site.', verbose_name='staff status')),
+                ('is_active', models.BooleanField(default=True, help_text='Designates whether this user should be treated as active. Unselect this instead of deleting accounts.', verbose_name='active')),
+                ('date_joined', models.DateTimeField(default=django.utils.timezone.now, verbose_name='date joined')),
+                ('role', models.CharField(choices=[('admin', 'Administrador'), ('user', 'Usuario Regular')], default='user', max_length=20)),
+                ('farm', models.CharField(blank=True, max_length=100)),
+                ('phone', models.CharField(blank=True, max_length=20)),
+                ('groups', models.ManyToManyField(blank=True, help_text='The groups this user belongs to. A user will get all permissions granted to each of their groups.', related_name='user_set', related_query_name='user', to='auth.group', verbose_name='groups')),
+                ('user_permissions', models.ManyToManyField(blank=True, help_text='Specific permissions for this user.', related_name='user_set', related_query_name='user', to='auth.permission', verbose_name='user permissions')),
+            ],
+            options={
+                'verbose_name': 'user',
+                'verbose_name_plural': 'users',
+                'abstract': False,
+            },
+            managers=[
+                ('objects', django.contrib.auth.models.UserManager()),
+            ],
+        ),
+    ]
@@ -0,0 +1,33 @@
+# Generated by Django 5.2.1 on 2026-10-18 10:50
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('backend', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='vaca',
+            index=models.Index(fields=['-fecha', '-id'], name='vaca_fecha_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='vaca',
+            index=models.Index(fields=['raza', '-fecha'], name='vaca_raza_fecha_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='vaca',
+            index=models.Index(condition=models.Q(('inseminada', False), ('prediccion__gt', 70)), fields=['-fecha'], name='vaca_celo_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='vaca',
+            index=models.Index(condition=models.Q(('gestante', False), ('inseminada', True)), fields=['-fecha'], name='vaca_inseminada_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='vaca',
+            index=models.Index(condition=models.Q(('gestante', True)), fields=['-fecha'], name='vaca_gestante_idx'),
+        ),
+    ]
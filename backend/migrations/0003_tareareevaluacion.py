@@ -0,0 +1,36 @@
+# Generated by Django 5.2.1 on 2026-10-18 10:50
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('backend', '0002_indices_vaca'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='TareaReevaluacion',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('estado', models.CharField(choices=[('pendiente', 'Pendiente'), ('en_curso', 'En curso'), ('completada', 'Completada'), ('fallida', 'Fallida')], default='pendiente', max_length=20)),
+                ('filtros', models.JSONField(blank=True, default=dict, verbose_name='Filtros del listado de vacas')),
+                ('total', models.IntegerField(default=0)),
+                ('procesadas', models.IntegerField(default=0)),
+                ('ultimo_id', models.IntegerField(default=0)),
+                ('version_modelo', models.CharField(blank=True, max_length=64)),
+                ('error', models.TextField(blank=True)),
+                ('creada', models.DateTimeField(auto_now_add=True)),
+                ('actualizada', models.DateTimeField(auto_now=True)),
+                ('iniciada', models.DateTimeField(blank=True, null=True)),
+                ('finalizada', models.DateTimeField(blank=True, null=True)),
+                ('creada_por', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, to=settings.AUTH_USER_MODEL)),
+            ],
+            options={
+                'indexes': [models.Index(fields=['estado', 'creada'], name='tarea_estado_creada_idx')],
+            },
+        ),
+    ]
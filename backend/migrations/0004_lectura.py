@@ -0,0 +1,32 @@
+# Generated by Django 5.2.1 on 2026-10-18 10:50
+
+import django.db.models.deletion
+import django.utils.timezone
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('backend', '0003_tareareevaluacion'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='Lectura',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('fecha', models.DateTimeField(default=django.utils.timezone.now)),
+                ('actividad', models.PositiveIntegerField(verbose_name='Actividad física (pasos/día)')),
+                ('temperatura', models.FloatField(verbose_name='Temperatura corporal (°C)')),
+                ('dias_posparto', models.PositiveSmallIntegerField(verbose_name='Días posparto')),
+                ('condicion', models.FloatField(verbose_name='Condición corporal (1-5)')),
+                ('prediccion', models.FloatField(verbose_name='Probabilidad de celo (%)')),
+                ('version_modelo', models.CharField(blank=True, max_length=12)),
+                ('vaca', models.ForeignKey(db_index=False, on_delete=django.db.models.deletion.CASCADE, related_name='lecturas', to='backend.vaca')),
+            ],
+            options={
+                'indexes': [models.Index(fields=['vaca', '-fecha', '-id'], name='lectura_vaca_fecha_idx'), models.Index(fields=['fecha'], name='lectura_fecha_idx')],
+            },
+        ),
+    ]
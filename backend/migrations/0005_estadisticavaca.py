@@ -0,0 +1,26 @@
+# Generated by Django 5.2.1 on 2026-10-18 10:50
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('backend', '0004_lectura'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='EstadisticaVaca',
+            fields=[
+                ('vaca', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, primary_key=True, related_name='estadistica', serialize=False, to='backend.vaca')),
+                ('lecturas', models.PositiveIntegerField(default=0)),
+                ('actividad_media', models.FloatField(default=0)),
+                ('actividad_varianza', models.FloatField(default=0)),
+                ('temperatura_media', models.FloatField(default=0)),
+                ('temperatura_varianza', models.FloatField(default=0)),
+                ('actualizada', models.DateTimeField(auto_now=True)),
+            ],
+        ),
+    ]
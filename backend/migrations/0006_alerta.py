@@ -0,0 +1,25 @@
+# Generated by Django 5.2.1 on 2026-10-18 10:50
+
+import django.db.models.deletion
+import django.utils.timezone
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('backend', '0005_estadisticavaca'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='Alerta',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('prediccion', models.FloatField(verbose_name='Probabilidad de celo (%)')),
+                ('umbral', models.FloatField(verbose_name='Umbral vigente al generar la alerta (%)')),
+                ('creada', models.DateTimeField(default=django.utils.timezone.now)),
+                ('vaca', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='alertas', to='backend.vaca')),
+            ],
+        ),
+    ]
@@ -0,0 +1,21 @@
+# Generated by Django 5.2.1 on 2026-10-18 10:50
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('backend', '0006_alerta'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='CambioVaca',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('vaca_id', models.IntegerField(db_index=True)),
+                ('eliminada', models.BooleanField(default=False)),
+            ],
+        ),
+    ]
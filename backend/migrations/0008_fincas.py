@@ -0,0 +1,41 @@
+# Generated by Django 5.2.1 on 2026-10-18 10:50
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('backend', '0007_cambiovaca'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='Finca',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('nombre', models.CharField(max_length=100, unique=True)),
+            ],
+        ),
+        migrations.AddField(
+            model_name='cambiovaca',
+            name='finca_id',
+            field=models.IntegerField(null=True),
+        ),
+        migrations.AddField(
+            model_name='alerta',
+            name='finca',
+            field=models.ForeignKey(db_index=False, null=True, on_delete=django.db.models.deletion.CASCADE, related_name='+', to='backend.finca'),
+        ),
+        migrations.AddField(
+            model_name='customuser',
+            name='finca',
+            field=models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='usuarios', to='backend.finca'),
+        ),
+        migrations.AddField(
+            model_name='vaca',
+            name='finca',
+            field=models.ForeignKey(db_index=False, null=True, on_delete=django.db.models.deletion.PROTECT, related_name='vacas', to='backend.finca'),
+        ),
+    ]
@@ -0,0 +1,54 @@
+# Generated by Django 5.2.1 on 2026-10-18 10:50
+
+from django.db import migrations
+
+# Finca de los datos existentes cuando los usuarios no indican una única finca
+FINCA_POR_DEFECTO = 'Finca principal'
+
+
+def asignar_fincas(apps, schema_editor):
+    """Crea una Finca por cada ``farm`` de los usuarios y asigna una finca a los datos existentes."""
+    Finca = apps.get_model('backend', 'Finca')
+    CustomUser = apps.get_model('backend', 'CustomUser')
+    Vaca = apps.get_model('backend', 'Vaca')
+    Alerta = apps.get_model('backend', 'Alerta')
+    CambioVaca = apps.get_model('backend', 'CambioVaca')
+
+    fincas = {}
+    for farm in CustomUser.objects.exclude(farm='').values_list('farm', flat=True).distinct():
+        nombre = farm.strip()
+        if not nombre:
+            continue
+        if nombre not in fincas:
+            fincas[nombre] = Finca.objects.get_or_create(nombre=nombre)[0]
+        CustomUser.objects.filter(farm=farm).update(finca=fincas[nombre])
+
+    if not (Vaca.objects.exists() or Alerta.objects.exists() or CambioVaca.objects.exists()):
+        return
+    # Hasta ahora el rebaño era uno solo: si los usuarios indican una única finca, es la suya
+    if len(fincas) == 1:
+        finca = next(iter(fincas.values()))
+    else:
+        finca = Finca.objects.get_or_create(nombre=FINCA_POR_DEFECTO)[0]
+    Vaca.objects.filter(finca__isnull=True).update(finca=finca)
+    Alerta.objects.filter(finca__isnull=True).update(finca=finca)
+    CambioVaca.objects.filter(finca_id__isnull=True).update(finca_id=finca.pk)
+
+
+def restaurar_nombres(apps, schema_editor):
+    """Al revertir, devuelve a ``farm`` el nombre de la finca de cada usuario."""
+    Finca = apps.get_model('backend', 'Finca')
+    CustomUser = apps.get_model('backend', 'CustomUser')
+    for finca in Finca.objects.all():
+        CustomUser.objects.filter(finca=finca).update(farm=finca.nombre)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('backend', '0008_fincas'),
+    ]
+
+    operations = [
+        migrations.RunPython(asignar_fincas, restaurar_nombres),
+    ]
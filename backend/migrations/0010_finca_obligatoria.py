@@ -0,0 +1,77 @@
+# Generated by Django 5.2.1 on 2026-10-18 10:52
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('backend', '0009_asignar_fincas'),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='vaca',
+            name='vaca_raza_fecha_idx',
+        ),
+        migrations.RemoveIndex(
+            model_name='vaca',
+            name='vaca_celo_idx',
+        ),
+        migrations.RemoveIndex(
+            model_name='vaca',
+            name='vaca_inseminada_idx',
+        ),
+        migrations.RemoveIndex(
+            model_name='vaca',
+            name='vaca_gestante_idx',
+        ),
+        migrations.RemoveField(
+            model_name='customuser',
+            name='farm',
+        ),
+        migrations.AlterField(
+            model_name='alerta',
+            name='finca',
+            field=models.ForeignKey(db_index=False, on_delete=django.db.models.deletion.CASCADE, related_name='+', to='backend.finca'),
+        ),
+        migrations.AlterField(
+            model_name='cambiovaca',
+            name='finca_id',
+            field=models.IntegerField(),
+        ),
+        migrations.AlterField(
+            model_name='vaca',
+            name='finca',
+            field=models.ForeignKey(db_index=False, on_delete=django.db.models.deletion.PROTECT, related_name='vacas', to='backend.finca'),
+        ),
+        migrations.AddIndex(
+            model_name='alerta',
+            index=models.Index(fields=['finca', 'id'], name='alerta_finca_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='cambiovaca',
+            index=models.Index(fields=['finca_id', 'id'], name='cambio_finca_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='vaca',
+            index=models.Index(fields=['finca', '-fecha', '-id'], name='vaca_finca_fecha_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='vaca',
+            index=models.Index(fields=['finca', 'raza', '-fecha'], name='vaca_finca_raza_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='vaca',
+            index=models.Index(condition=models.Q(('inseminada', False), ('prediccion__gt', 70)), fields=['finca', '-fecha'], name='vaca_finca_celo_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='vaca',
+            index=models.Index(condition=models.Q(('gestante', False), ('inseminada', True)), fields=['finca', '-fecha'], name='vaca_finca_inseminada_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='vaca',
+            index=models.Index(condition=models.Q(('gestante', True)), fields=['finca', '-fecha'], name='vaca_finca_gestante_idx'),
+        ),
+    ]
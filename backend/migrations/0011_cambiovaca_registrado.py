@@ -0,0 +1,20 @@
+# Generated by Django 5.2.1 on 2026-10-18 11:42
+
+import django.utils.timezone
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('backend', '0010_finca_obligatoria'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='cambiovaca',
+            name='registrado',
+            field=models.DateTimeField(auto_now_add=True, default=django.utils.timezone.now),
+            preserve_default=False,
+        ),
+    ]
@@ -1,40 +1,203 @@
-from django.db import models
-from django.contrib.auth.models import AbstractUser
-
-class Vaca(models.Model):
-    RAZAS = [
-        ('SIB', 'Siboney de Cuba'),
-        ('MAM', 'Mambi de Cuba'),
-        ('TAI', 'Taino'),
-        ('CRI', 'Criolla'),
-        ('CEB', 'Cebu'),
-        ('CRU', 'Cruzamiento'),
-        ('CHA', 'Chacuba'),
-        ('HOL', 'Holstein'),
-    ]
-    nombre = models.CharField(max_length=50, verbose_name="Nombre de la vaca")
-    actividad = models.IntegerField(verbose_name="Actividad física (pasos/día)")
-    temperatura = models.FloatField(verbose_name="Temperatura corporal (°C)")
-    dias_posparto = models.IntegerField(verbose_name="Días posparto")
-    condicion = models.FloatField(verbose_name="Condición corporal (1-5)")
-    raza = models.CharField(max_length=3, choices=RAZAS)
-    parto_asistido = models.BooleanField(verbose_name="¿Tuvo parto asistido previo?")
-    prediccion = models.FloatField(verbose_name="Probabilidad de celo (%)")
-    fecha = models.DateTimeField(auto_now_add=True)
-    inseminada = models.BooleanField(default=False)
-    fecha_inseminacion = models.DateTimeField(null=True, blank=True)
-    gestante = models.BooleanField(default=False, verbose_name="¿Está gestante?")
-    fecha_gestacion = models.DateTimeField(null=True, blank=True)
-
-
-    def __str__(self):
-        return f"Vaca {self.id} - {self.get_raza_display()} ({self.fecha.strftime('%d/%m/%Y %H:%M')})"
-
-class CustomUser(AbstractUser):
-    ROLES = (
-        ('admin', 'Administrador'),
-        ('user', 'Usuario Regular'),
-    )
-    role = models.CharField(max_length=20, choices=ROLES, default='user')
-    farm = models.CharField(max_length=100, blank=True)
-    phone = models.CharField(max_length=20, blank=True)
+from django.conf import settings
+from django.db import models
+from django.db.models import OuterRef, Q, Subquery
+from django.contrib.auth.models import AbstractUser
+from django.utils import timezone
+
+from .codificador import RAZAS
+
+# Probabilidad (%) a partir de la cual una vaca se considera en posible celo
+UMBRAL_CELO = 70
+
+# Estados reproductivos, con los mismos criterios que muestra el frontend
+ESTADOS_VACA = {
+    'celo': Q(prediccion__gt=UMBRAL_CELO, inseminada=False),
+    'inseminada': Q(inseminada=True, gestante=False),
+    'gestante': Q(gestante=True),
+}
+
+# (mínimo, máximo) de los campos enteros de Lectura; None es sin máximo propio
+RANGOS_LECTURA = {
+    'actividad': (0, None),
+    'dias_posparto': (0, 32767),
+}
+
+class Finca(models.Model):
+    """Explotación a la que pertenecen vacas y usuarios; cada usuario solo ve las vacas de su finca."""
+    nombre = models.CharField(max_length=100, unique=True)
+
+    def __str__(self):
+        return self.nombre
+
+
+class Vaca(models.Model):
+    RAZAS = RAZAS
+    # Sin índice propio: lo cubren los índices que empiezan por finca
+    finca = models.ForeignKey(Finca, on_delete=models.PROTECT, related_name='vacas', db_index=False)
+    nombre = models.CharField(max_length=50, verbose_name="Nombre de la vaca")
+    actividad = models.IntegerField(verbose_name="Actividad física (pasos/día)")
+    temperatura = models.FloatField(verbose_name="Temperatura corporal (°C)")
+    dias_posparto = models.IntegerField(verbose_name="Días posparto")
+    condicion = models.FloatField(verbose_name="Condición corporal (1-5)")
+    raza = models.CharField(max_length=3, choices=RAZAS)
+    parto_asistido = models.BooleanField(verbose_name="¿Tuvo parto asistido previo?")
+    prediccion = models.FloatField(verbose_name="Probabilidad de celo (%)")
+    fecha = models.DateTimeField(auto_now_add=True)
+    inseminada = models.BooleanField(default=False)
+    fecha_inseminacion = models.DateTimeField(null=True, blank=True)
+    gestante = models.BooleanField(default=False, verbose_name="¿Está gestante?")
+    fecha_gestacion = models.DateTimeField(null=True, blank=True)
+
+    class Meta:
+        # Índices según los accesos de VacaViewSet: listado por -fecha, filtros por estado y raza.
+        # Empiezan por finca para que cada consulta recorra solo el rebaño de una finca
+        indexes = [
+            models.Index(fields=['finca', '-fecha', '-id'], name='vaca_finca_fecha_idx'),
+            models.Index(fields=['finca', 'raza', '-fecha'], name='vaca_finca_raza_idx'),
+            models.Index(fields=['finca', '-fecha'], condition=ESTADOS_VACA['celo'], name='vaca_finca_celo_idx'),
+            models.Index(fields=['finca', '-fecha'], condition=ESTADOS_VACA['inseminada'],
+                         name='vaca_finca_inseminada_idx'),
+            models.Index(fields=['finca', '-fecha'], condition=ESTADOS_VACA['gestante'],
+                         name='vaca_finca_gestante_idx'),
+            # Listado de todas las fincas (administradores)
+            models.Index(fields=['-fecha', '-id'], name='vaca_fecha_idx'),
+        ]
+
+    def __str__(self):
+        return f"Vaca {self.id} - {self.get_raza_display()} ({self.fecha.strftime('%d/%m/%Y %H:%M')})"
+
+class LecturaQuerySet(models.QuerySet):
+    def ultimas(self):
+        """Solo la lectura más reciente de cada vaca (resuelta con ``lectura_vaca_fecha_idx``)."""
+        ultima = Lectura.objects.filter(vaca=OuterRef('vaca')).order_by('-fecha', '-id').values('pk')[:1]
+        return self.filter(pk=Subquery(ultima))
+
+
+class Lectura(models.Model):
+    """Historial de lecturas de sensores de una vaca y la predicción obtenida con cada una.
+
+    Las filas solo se agregan. ``Vaca`` conserva los valores de su última
+    lectura, así que el listado y los filtros por estado no consultan esta tabla.
+    """
+    # Sin índice propio: lo cubre lectura_vaca_fecha_idx, que empieza por vaca
+    vaca = models.ForeignKey(Vaca, on_delete=models.CASCADE, related_name='lecturas', db_index=False)
+    fecha = models.DateTimeField(default=timezone.now)
+    actividad = models.PositiveIntegerField(verbose_name="Actividad física (pasos/día)")
+    temperatura = models.FloatField(verbose_name="Temperatura corporal (°C)")
+    dias_posparto = models.PositiveSmallIntegerField(verbose_name="Días posparto")
+    condicion = models.FloatField(verbose_name="Condición corporal (1-5)")
+    prediccion = models.FloatField(verbose_name="Probabilidad de celo (%)")
+    version_modelo = models.CharField(max_length=12, blank=True)
+
+    objects = LecturaQuerySet.as_manager()
+
+    class Meta:
+        indexes = [
+            # Historial y última lectura de cada vaca
+            models.Index(fields=['vaca', '-fecha', '-id'], name='lectura_vaca_fecha_idx'),
+            # Consultas por rango de fechas de todo el rebaño
+            models.Index(fields=['fecha'], name='lectura_fecha_idx'),
+        ]
+
+    def __str__(self):
+        return f"Lectura {self.id} - Vaca {self.vaca_id} ({self.fecha.strftime('%d/%m/%Y %H:%M')})"
+
+
+class CambioVaca(models.Model):
+    """Secuencia de cambios de ``Vaca`` para la sincronización incremental (ver ``cambios.py``).
+
+    Cada alta, modificación o baja de una vaca reemplaza su fila por una nueva,
+    así que el ``id`` crece con cada cambio y queda una sola fila por vaca. La
+    fila de una vaca eliminada es su lápida: ``vaca_id`` no es una clave
+    foránea para que sobreviva a la vaca.
+    """
+    vaca_id = models.IntegerField(db_index=True)
+    # Copia de la finca de la vaca, para leer los cambios de una sola finca
+    finca_id = models.IntegerField()
+    eliminada = models.BooleanField(default=False)
+    # Los cambios recientes pueden tener ids menores aún sin confirmar (ver ``cambios.MARGEN_CONFIRMACION``)
+    registrado = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        indexes = [models.Index(fields=['finca_id', 'id'], name='cambio_finca_idx')]
+
+    def __str__(self):
+        return f"Cambio {self.id} - Vaca {self.vaca_id}{' (eliminada)' if self.eliminada else ''}"
+
+
+class Alerta(models.Model):
+    """Predicción que superó el umbral de alerta de celo (ver ``alertas.py``).
+
+    Los clientes reciben solo las alertas posteriores a su cursor (el ``id``
+    de la última que vieron), en lugar de volver a descargar el rebaño.
+    """
+    vaca = models.ForeignKey(Vaca, on_delete=models.CASCADE, related_name='alertas')
+    # La de la vaca, repetida para leer las alertas de una finca sin unir con Vaca
+    finca = models.ForeignKey(Finca, on_delete=models.CASCADE, related_name='+', db_index=False)
+    prediccion = models.FloatField(verbose_name="Probabilidad de celo (%)")
+    umbral = models.FloatField(verbose_name="Umbral vigente al generar la alerta (%)")
+    creada = models.DateTimeField(default=timezone.now)
+
+    class Meta:
+        indexes = [models.Index(fields=['finca', 'id'], name='alerta_finca_idx')]
+
+    def __str__(self):
+        return f"Alerta {self.id} - Vaca {self.vaca_id} ({self.prediccion:.1f}%)"
+
+
+class EstadisticaVaca(models.Model):
+    """Línea base móvil de actividad y temperatura de una vaca (ver ``estadisticas.py``)."""
+    vaca = models.OneToOneField(Vaca, on_delete=models.CASCADE, primary_key=True, related_name='estadistica')
+    lecturas = models.PositiveIntegerField(default=0)
+    actividad_media = models.FloatField(default=0)
+    actividad_varianza = models.FloatField(default=0)
+    temperatura_media = models.FloatField(default=0)
+    temperatura_varianza = models.FloatField(default=0)
+    actualizada = models.DateTimeField(auto_now=True)
+
+    def __str__(self):
+        return f"Estadística de vaca {self.vaca_id} ({self.lecturas} lecturas)"
+
+
+class CustomUser(AbstractUser):
+    ROLES = (
+        ('admin', 'Administrador'),
+        ('user', 'Usuario Regular'),
+    )
+    role = models.CharField(max_length=20, choices=ROLES, default='user')
+    # Sin finca, un usuario regular no ve ninguna vaca; los administradores ven todas
+    finca = models.ForeignKey(Finca, null=True, blank=True, on_delete=models.SET_NULL, related_name='usuarios')
+    phone = models.CharField(max_length=20, blank=True)
+
+
+class TareaReevaluacion(models.Model):
+    """Reevaluación en segundo plano de un conjunto de vacas (cola en la base de datos).
+
+    La procesa ``manage.py procesar_tareas`` en un proceso aparte. ``ultimo_id``
+    marca hasta dónde se avanzó, de modo que una tarea interrumpida continúa
+    donde quedó.
+    """
+    ESTADOS = (
+        ('pendiente', 'Pendiente'),
+        ('en_curso', 'En curso'),
+        ('completada', 'Completada'),
+        ('fallida', 'Fallida'),
+    )
+    estado = models.CharField(max_length=20, choices=ESTADOS, default='pendiente')
+    filtros = models.JSONField(default=dict, blank=True, verbose_name="Filtros del listado de vacas")
+    total = models.IntegerField(default=0)
+    procesadas = models.IntegerField(default=0)
+    ultimo_id = models.IntegerField(default=0)
+    version_modelo = models.CharField(max_length=64, blank=True)
+    error = models.TextField(blank=True)
+    creada_por = models.ForeignKey(settings.AUTH_USER_MODEL, null=True, blank=True, on_delete=models.SET_NULL)
+    creada = models.DateTimeField(auto_now_add=True)
+    actualizada = models.DateTimeField(auto_now=True)
+    iniciada = models.DateTimeField(null=True, blank=True)
+    finalizada = models.DateTimeField(null=True, blank=True)
+
+    class Meta:
+        indexes = [models.Index(fields=['estado', 'creada'], name='tarea_estado_creada_idx')]
+
+    def __str__(self):
+        return f"Tarea {self.id} - {self.get_estado_display()} ({self.procesadas}/{self.total})"
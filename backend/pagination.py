@@ -0,0 +1,35 @@
+from rest_framework.pagination import CursorPagination
+
+
+class VacaCursorPagination(CursorPagination):
+    """Paginación por cursor sobre ``-fecha``.
+
+    Solo se activa cuando el cliente envía ``page_size`` o ``cursor``; sin
+    ellos el listado se devuelve completo, como antes.
+    """
+    ordering = ('-fecha', '-id')
+    page_size = 100
+    page_size_query_param = 'page_size'
+    max_page_size = 1000
+
+    def paginate_queryset(self, queryset, request, view=None):
+        params = request.query_params
+        if self.page_size_query_param not in params and self.cursor_query_param not in params:
+            return None
+        return super().paginate_queryset(queryset, request, view)
+
+
+class UsuarioCursorPagination(CursorPagination):
+    """Usuarios por nombre, de a 100."""
+    ordering = ('username',)
+    page_size = 100
+    page_size_query_param = 'page_size'
+    max_page_size = 1000
+
+
+class LecturaCursorPagination(CursorPagination):
+    """Historial de lecturas de una vaca, de la más reciente a la más antigua."""
+    ordering = ('-fecha', '-id')
+    page_size = 100
+    page_size_query_param = 'page_size'
+    max_page_size = 1000
@@ -0,0 +1,195 @@
+"""Paquete versionado del modelo de celo: un solo archivo con todo lo necesario.
+
+Reemplaza al trío ``.pkl`` + ``.npz`` + ``columnas_rf.json``. El archivo
+contiene los arreglos del bosque compilado, el codificador de
+características, los metadatos del entrenamiento y un SHA-256 del contenido::
+
+    CELOPAQ\\0 | versión (uint32) | largo de la cabecera (uint32) | cabecera JSON | arreglos
+
+Cada arreglo empieza en un múltiplo de 64 bytes, de modo que al leer el
+paquete se mapea en memoria y los arreglos se usan sin copiarlos: los
+workers de gunicorn comparten las mismas páginas físicas y la carga no
+deserializa nada. No hay pickle, así que leer un paquete no ejecuta código.
+
+Como ``bosque.py`` y ``codificador.py``, no depende de Django: el script de
+entrenamiento lo usa para escribir el paquete.
+"""
+import hashlib
+import json
+import mmap
+import os
+import struct
+import tempfile
+from collections import namedtuple
+
+import numpy as np
+
+from .bosque import ARREGLOS, BosqueCompilado
+from .codificador import CodificadorCaracteristicas
+
+MAGICO = b'CELOPAQ\x00'
+VERSION_FORMATO = 1
+ALINEACION = 64
+_PREAMBULO = struct.Struct('<II')
+
+PaqueteModelo = namedtuple('PaqueteModelo', ['bosque', 'codificador', 'metadatos', 'checksum'])
+
+
+class PaqueteInvalido(ValueError):
+    """El archivo no es un paquete válido, está dañado o no coincide con el esquema esperado."""
+
+
+def _alinear(posicion):
+    return posicion + (-posicion % ALINEACION)
+
+
+def _checksum(contenido, datos):
+    # La cabecera se serializa de forma canónica para que el hash no dependa del orden de las claves
+    h = hashlib.sha256(json.dumps(contenido, sort_keys=True, separators=(',', ':')).encode())
+    h.update(datos)
+    return h.hexdigest()
+
+
+def validar_esquema(bosque, codificador):
+    """Comprueba que bosque y codificador encajan entre sí y con los campos de entrada de la API."""
+    if codificador.desconocidas:
+        raise PaqueteInvalido(f'Columnas sin campo de entrada: {", ".join(codificador.desconocidas)}')
+    n_nodos = len(bosque.umbral)
+    if not all(len(getattr(bosque, nombre)) == n_nodos for nombre in ('caracteristica', 'izquierdo', 'derecho', 'valor')):
+        raise PaqueteInvalido('Los arreglos de nodos del bosque no tienen el mismo largo')
+    if bosque.valor.ndim != 2 or bosque.valor.shape[1] != len(bosque.clases):
+        raise PaqueteInvalido('El valor de los nodos no coincide con el número de clases')
+    for nombre in ('izquierdo', 'derecho', 'raices'):
+        indices = getattr(bosque, nombre)
+        if len(indices) and (indices.min() < 0 or indices.max() >= n_nodos):
+            raise PaqueteInvalido(f'Índices de nodo fuera de rango en {nombre}')
+    if n_nodos and bosque.caracteristica.max() >= len(codificador.columnas):
+        raise PaqueteInvalido(
+            f'El modelo usa la característica {int(bosque.caracteristica.max())} '
+            f'pero el codificador solo tiene {len(codificador.columnas)} columnas'
+        )
+
+
+def escribir_paquete(ruta, bosque, codificador, metadatos=None):
+    """Escribe el paquete de forma atómica y devuelve su checksum.
+
+    Se escribe en un temporal del mismo directorio y se renombra: los
+    procesos que tienen mapeado el paquete anterior siguen leyendo el
+    archivo viejo hasta que lo recargan.
+    """
+    validar_esquema(bosque, codificador)
+    arreglos, partes, desplazamiento = {}, [], 0
+    for nombre in ARREGLOS:
+        arreglo = np.ascontiguousarray(getattr(bosque, nombre))
+        if arreglo.dtype.hasobject:
+            raise PaqueteInvalido(f'{nombre} no puede guardarse sin pickle (dtype {arreglo.dtype})')
+        relleno = -desplazamiento % ALINEACION
+        partes.append(b'\0' * relleno)
+        desplazamiento += relleno
+        arreglos[nombre] = {
+            'dtype': arreglo.dtype.str,
+            'forma': list(arreglo.shape),
+            'desplazamiento': desplazamiento,
+            'bytes': arreglo.nbytes,
+        }
+        partes.append(arreglo.tobytes())
+        desplazamiento += arreglo.nbytes
+    datos = b''.join(partes)
+
+    contenido = {
+        'codificador': codificador.a_dict(),
+        'metadatos': metadatos or {},
+        'arreglos': arreglos,
+        'profundidad': bosque.profundidad,
+    }
+    checksum = _checksum(contenido, datos)
+    cabecera = json.dumps({**contenido, 'sha256': checksum}, ensure_ascii=False).encode()
+    inicio = len(MAGICO) + _PREAMBULO.size + len(cabecera)
+
+    directorio = os.path.dirname(os.path.abspath(ruta))
+    descriptor, temporal = tempfile.mkstemp(dir=directorio, prefix='.paquete-')
+    try:
+        with os.fdopen(descriptor, 'wb') as f:
+            f.write(MAGICO)
+            f.write(_PREAMBULO.pack(VERSION_FORMATO, len(cabecera)))
+            f.write(cabecera)
+            f.write(b'\0' * (_alinear(inicio) - inicio))
+            f.write(datos)
+            f.flush()
+            os.fsync(f.fileno())
+        os.chmod(temporal, 0o644)
+        os.replace(temporal, ruta)
+    except BaseException:
+        if os.path.exists(temporal):
+            os.unlink(temporal)
+        raise
+    return checksum
+
+
+def _leer_cabecera(buffer):
+    if bytes(buffer[:len(MAGICO)]) != MAGICO:
+        raise PaqueteInvalido('No es un paquete de modelo')
+    version, largo = _PREAMBULO.unpack_from(buffer, len(MAGICO))
+    if version > VERSION_FORMATO:
+        raise PaqueteInvalido(f'Formato de paquete {version} no soportado (máximo {VERSION_FORMATO})')
+    inicio = len(MAGICO) + _PREAMBULO.size
+    try:
+        cabecera = json.loads(bytes(buffer[inicio:inicio + largo]))
+    except ValueError as e:
+        raise PaqueteInvalido(f'Cabecera ilegible: {e}') from None
+    return cabecera, _alinear(inicio + largo)
+
+
+def leer_checksum(ruta):
+    """Checksum declarado en la cabecera, sin leer ni verificar los arreglos."""
+    with open(ruta, 'rb') as f:
+        inicio = f.read(len(MAGICO) + _PREAMBULO.size)
+        if len(inicio) < len(MAGICO) + _PREAMBULO.size:
+            raise PaqueteInvalido('No es un paquete de modelo')
+        _, largo = _PREAMBULO.unpack_from(inicio, len(MAGICO))
+        cabecera, _ = _leer_cabecera(inicio + f.read(largo))
+    return cabecera['sha256']
+
+
+def leer_paquete(ruta, verificar=True):
+    """Mapea el paquete en memoria y devuelve un ``PaqueteModelo``.
+
+    Con ``verificar`` se recalcula el SHA-256 (lee el archivo completo una
+    vez, del orden de milisegundos); los arreglos del bosque son vistas de
+    solo lectura sobre el mapeo.
+    """
+    with open(ruta, 'rb') as f:
+        try:
+            mapeo = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            raise PaqueteInvalido('No es un paquete de modelo') from None
+    cabecera, inicio = _leer_cabecera(mapeo)
+    try:
+        contenido = {clave: cabecera[clave] for clave in ('codificador', 'metadatos', 'arreglos', 'profundidad')}
+        checksum = cabecera['sha256']
+    except KeyError as e:
+        raise PaqueteInvalido(f'Falta {e} en la cabecera') from None
+
+    datos = memoryview(mapeo)[inicio:]
+    try:
+        if verificar and _checksum(contenido, datos) != checksum:
+            raise PaqueteInvalido('El checksum no coincide: el paquete está dañado o incompleto')
+
+        arreglos = {}
+        for nombre in ARREGLOS:
+            descripcion = contenido['arreglos'][nombre]
+            dtype = np.dtype(descripcion['dtype'])
+            fin = descripcion['desplazamiento'] + descripcion['bytes']
+            if dtype.hasobject or fin > len(datos) or descripcion['bytes'] != dtype.itemsize * int(np.prod(descripcion['forma'])):
+                raise PaqueteInvalido(f'Descripción inválida del arreglo {nombre}')
+            arreglos[nombre] = np.frombuffer(
+                mapeo, dtype=dtype, count=descripcion['bytes'] // dtype.itemsize,
+                offset=inicio + descripcion['desplazamiento'],
+            ).reshape(descripcion['forma'])
+    finally:
+        datos.release()
+
+    bosque = BosqueCompilado(**arreglos, profundidad=contenido['profundidad'])
+    codificador = CodificadorCaracteristicas.desde_dict(contenido['codificador'])
+    validar_esquema(bosque, codificador)
+    return PaqueteModelo(bosque=bosque, codificador=codificador, metadatos=contenido['metadatos'], checksum=checksum)
@@ -0,0 +1,105 @@
+"""Cálculo de la probabilidad de celo a partir de los datos de una o varias vacas."""
+import numpy as np
+from django.conf import settings
+
+from .cache_prediccion import CachePredicciones
+from .metricas import Medidor, filas_por_llamada, medir, predicciones, registro as registro_metricas
+from .registro_modelo import obtener_modelo, registro as registro_modelos
+
+# Techo aplicado a la probabilidad que se muestra al usuario (%)
+PROBABILIDAD_MAXIMA = 96.0
+
+# Hasta este tamaño de lote el bosque compilado es más rápido que sklearn; en
+# lotes mayores rinde más el recorrido en Cython de sklearn pese a su costo fijo
+LOTE_MAXIMO_BOSQUE = 200
+
+# Caché de resultados por vector de entrada (opciones: capacidad, ttl en segundos)
+cache_predicciones = CachePredicciones(**getattr(settings, 'CACHE_PREDICCIONES', {}))
+
+registro_metricas.registrar(Medidor(
+    'celo_modelo_info', 'Versión del modelo cargado en el proceso.',
+    lambda: {(cargado.version,): 1} if (cargado := registro_modelos.actual()) else {},
+    etiquetas=('version',),
+))
+registro_metricas.registrar(Medidor(
+    'celo_cache_aciertos_total', 'Consultas a la caché de predicciones resueltas sin el modelo.',
+    lambda: {(): cache_predicciones.estadisticas()['aciertos']}, tipo='counter',
+))
+registro_metricas.registrar(Medidor(
+    'celo_cache_fallos_total', 'Consultas a la caché de predicciones que requirieron el modelo.',
+    lambda: {(): cache_predicciones.estadisticas()['fallos']}, tipo='counter',
+))
+registro_metricas.registrar(Medidor(
+    'celo_cache_tasa_aciertos', 'Proporción de aciertos de la caché desde el inicio del proceso.',
+    lambda: {(): cache_predicciones.estadisticas()['tasa_aciertos']},
+))
+registro_metricas.registrar(Medidor(
+    'celo_cache_entradas', 'Entradas guardadas en la caché de predicciones.',
+    lambda: {(): cache_predicciones.estadisticas()['entradas']},
+))
+
+# Campos de Vaca que usa el modelo
+CAMPOS_ENTRADA = ('actividad', 'temperatura', 'dias_posparto', 'condicion', 'raza', 'parto_asistido')
+
+
+def datos_de_vaca(vaca):
+    """Extrae de una instancia de Vaca los datos de entrada del modelo."""
+    return {campo: getattr(vaca, campo) for campo in CAMPOS_ENTRADA}
+
+
+def _motor(cargado, n_filas):
+    """Elige entre el bosque compilado y el estimador de sklearn según el tamaño del lote."""
+    if cargado.bosque is not None and (cargado.modelo is None or n_filas <= LOTE_MAXIMO_BOSQUE):
+        return cargado.bosque
+    return cargado.modelo
+
+
+def predecir_probabilidades(registros, usar_cache=True):
+    """Devuelve la probabilidad de celo (%) de cada registro con una sola llamada al modelo.
+
+    Con ``usar_cache`` solo se evalúan las filas que no están en la caché;
+    las cargas masivas lo desactivan para no desplazar las entradas frecuentes.
+    """
+    if not registros:
+        return np.empty(0)
+    with medir('modelo'):
+        cargado = obtener_modelo()
+    with medir('codificacion'):
+        X = cargado.codificador.transformar_registros(registros)
+    return _predecir_con_cache(cargado, X, usar_cache)
+
+
+def predecir_columnas(datos, usar_cache=True):
+    """Como ``predecir_probabilidades``, con los datos por columnas (campo -> arreglo)."""
+    with medir('modelo'):
+        cargado = obtener_modelo()
+    with medir('codificacion'):
+        X = cargado.codificador.transformar(datos)
+    if not len(X):
+        return np.empty(0)
+    return _predecir_con_cache(cargado, X, usar_cache)
+
+
+def _predecir_con_cache(cargado, X, usar_cache):
+    predicciones.incrementar(cantidad=len(X))
+    if not usar_cache:
+        return _predecir(cargado, X)
+
+    with medir('cache'):
+        claves = cache_predicciones.claves(X)
+        guardadas = cache_predicciones.obtener(cargado.version, claves)
+    faltantes = [i for i, valor in enumerate(guardadas) if valor is None]
+    probabilidades = np.array([np.nan if valor is None else valor for valor in guardadas])
+    if faltantes:
+        nuevas = _predecir(cargado, X[faltantes])
+        probabilidades[faltantes] = nuevas
+        cache_predicciones.guardar(cargado.version, [claves[i] for i in faltantes], nuevas.tolist())
+    return probabilidades
+
+
+def _predecir(cargado, X):
+    motor = _motor(cargado, len(X))
+    filas_por_llamada.observar(len(X), 'bosque_compilado' if motor is cargado.bosque else 'sklearn')
+    with medir('prediccion'):
+        probabilidades = motor.predict_proba(X)[:, 1] * 100
+    return np.minimum(probabilidades, PROBABILIDAD_MAXIMA)
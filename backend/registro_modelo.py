@@ -0,0 +1,158 @@
+"""Registro en memoria del modelo de predicción de celo.
+
+El modelo y su codificador de características se cargan una sola vez por
+proceso y solo se vuelven a leer cuando cambian los archivos en disco.
+
+Si existe el paquete versionado (``.paquete``, ver ``paquete_modelo.py``) se
+usa solo ese archivo: se mapea en memoria, se verifica su checksum y se valida
+contra el esquema de entrada. Sin paquete se cargan los artefactos anteriores:
+el bosque compilado (``.npz``) si es al menos tan reciente como el ``.pkl``, y
+el codificador de ``columnas_rf.json``.
+"""
+import hashlib
+import io
+import json
+import os
+import threading
+from collections import namedtuple
+
+import joblib
+
+from .bosque import BosqueCompilado, compilar_modelo
+from .codificador import CodificadorCaracteristicas
+from .paquete_modelo import leer_checksum, leer_paquete
+
+DIRECTORIO_MODELO = os.path.dirname(__file__)
+MODELO_PATH = os.path.join(DIRECTORIO_MODELO, 'modelo_celo_posparto_rf.pkl')
+MODELO_COMPILADO_PATH = os.path.join(DIRECTORIO_MODELO, 'modelo_celo_posparto_rf.npz')
+COLUMNAS_PATH = os.path.join(DIRECTORIO_MODELO, 'columnas_rf.json')
+PAQUETE_PATH = os.path.join(DIRECTORIO_MODELO, 'modelo_celo_posparto_rf.paquete')
+
+# ``modelo`` es el estimador de sklearn (None si solo hay bosque compilado) y
+# ``bosque`` su versión compilada (None si el modelo no es un Random Forest).
+# ``metadatos`` son los del entrenamiento (solo en paquetes)
+ModeloCargado = namedtuple(
+    'ModeloCargado', ['modelo', 'bosque', 'codificador', 'columnas', 'version', 'metadatos'], defaults=(None,),
+)
+
+
+class RegistroModelo:
+    """Mantiene el modelo cargado y lo recarga si su archivo cambia.
+
+    La comprobación por petición se limita a un ``os.stat`` de cada archivo;
+    el contenido solo se lee (y se calcula su hash) cuando cambia la fecha de
+    modificación o el tamaño.
+    """
+
+    def __init__(self, modelo_path=MODELO_PATH, columnas_path=COLUMNAS_PATH,
+                 modelo_compilado_path=MODELO_COMPILADO_PATH, paquete_path=PAQUETE_PATH):
+        self.modelo_path = modelo_path
+        self.columnas_path = columnas_path
+        self.modelo_compilado_path = modelo_compilado_path
+        self.paquete_path = paquete_path
+        self._lock = threading.Lock()
+        # (firma de los archivos, ModeloCargado); se reemplaza de forma atómica
+        self._estado = (None, None)
+
+    def _firma(self):
+        """Devuelve ``(ruta del modelo a usar, mtime y tamaño de los archivos)``."""
+        try:
+            paquete = os.stat(self.paquete_path)
+        except FileNotFoundError:
+            pass
+        else:
+            return self.paquete_path, (paquete.st_mtime_ns, paquete.st_size)
+
+        try:
+            compilado = os.stat(self.modelo_compilado_path)
+        except FileNotFoundError:
+            compilado = None
+        try:
+            pickle = os.stat(self.modelo_path)
+        except FileNotFoundError:
+            if compilado is None:
+                raise
+            pickle = None
+
+        if compilado is not None and (pickle is None or compilado.st_mtime_ns >= pickle.st_mtime_ns):
+            ruta_modelo, st_modelo = self.modelo_compilado_path, compilado
+        else:
+            ruta_modelo, st_modelo = self.modelo_path, pickle
+        st_columnas = os.stat(self.columnas_path)
+        return (
+            ruta_modelo,
+            (st_modelo.st_mtime_ns, st_modelo.st_size),
+            (st_columnas.st_mtime_ns, st_columnas.st_size),
+        )
+
+    def actual(self):
+        """El ``ModeloCargado`` vigente sin comprobar ni cargar archivos (None si aún no se cargó)."""
+        return self._estado[1]
+
+    def obtener(self):
+        """Devuelve el ``ModeloCargado`` vigente, recargándolo si hace falta."""
+        firma = self._firma()
+        firma_actual, cargado = self._estado
+        if cargado is not None and firma == firma_actual:
+            return cargado
+
+        with self._lock:
+            firma_actual, cargado = self._estado
+            if cargado is None or firma != firma_actual:
+                cargado = self._cargar(firma[0], cargado)
+                self._estado = (firma, cargado)
+            return cargado
+
+    def _cargar(self, ruta_modelo, anterior):
+        if ruta_modelo == self.paquete_path:
+            return self._cargar_paquete(anterior)
+
+        with open(ruta_modelo, 'rb') as f:
+            contenido_modelo = f.read()
+        with open(self.columnas_path, 'rb') as f:
+            contenido_columnas = f.read()
+
+        version = hashlib.sha256(contenido_modelo + contenido_columnas).hexdigest()[:12]
+        # Un cambio de mtime sin cambio de contenido no obliga a deserializar
+        if anterior is not None and anterior.version == version:
+            return anterior
+
+        if ruta_modelo == self.modelo_compilado_path:
+            modelo, bosque = None, BosqueCompilado.cargar(io.BytesIO(contenido_modelo))
+        else:
+            modelo = joblib.load(io.BytesIO(contenido_modelo))
+            bosque = compilar_modelo(modelo)
+            if bosque is modelo:
+                bosque = None
+        # columnas_rf.json guarda el codificador (o, en artefactos antiguos, solo la lista de columnas)
+        codificador = CodificadorCaracteristicas.desde_dict(json.loads(contenido_columnas))
+        return ModeloCargado(
+            modelo=modelo,
+            bosque=bosque,
+            codificador=codificador,
+            columnas=codificador.columnas,
+            version=version,
+        )
+
+    def _cargar_paquete(self, anterior):
+        # La versión es el checksum declarado; si no cambió no hace falta releer los arreglos
+        version = leer_checksum(self.paquete_path)[:12]
+        if anterior is not None and anterior.version == version:
+            return anterior
+        paquete = leer_paquete(self.paquete_path)
+        return ModeloCargado(
+            modelo=None,
+            bosque=paquete.bosque,
+            codificador=paquete.codificador,
+            columnas=paquete.codificador.columnas,
+            version=paquete.checksum[:12],
+            metadatos=paquete.metadatos,
+        )
+
+
+registro = RegistroModelo()
+
+
+def obtener_modelo():
+    """Acceso compartido al modelo del proceso actual."""
+    return registro.obtener()
@@ -0,0 +1,353 @@
+"""Reportes exportables (CSV, XLSX y PDF) generados fila a fila.
+
+Las filas se leen con ``values_list(...).iterator()`` en lotes de
+``TAMANO_LOTE`` y cada formato las escribe a medida que llegan, de modo que
+la memoria no depende del tamaño del rebaño y la descarga empieza con las
+primeras filas. Los tres formatos se escriben con la biblioteca estándar:
+
+* XLSX: el ZIP se genera en flujo (``zipfile`` sobre un destino no
+  posicionable) con la hoja en XML y cadenas en línea.
+* PDF: texto en Courier, páginas A4 apaisadas y comprimidas una a una; la
+  tabla de referencias se escribe al final con las posiciones acumuladas de
+  cada objeto.
+"""
+import csv
+import io
+import re
+import zipfile
+import zlib
+from collections import namedtuple
+from xml.sax.saxutils import escape
+
+from django.utils import timezone
+
+from .models import CustomUser, ESTADOS_VACA, Vaca
+
+# Filas pedidas a la base de datos por consulta
+TAMANO_LOTE = 2000
+
+# Filas escritas en cada fragmento de la respuesta
+FILAS_POR_FRAGMENTO = 500
+
+# ``formato(valor)`` convierte el valor de la base de datos; ``ancho`` son caracteres en el PDF
+Columna = namedtuple('Columna', ['titulo', 'campo', 'formato', 'ancho'], defaults=(None, 14))
+
+# ``consulta()`` devuelve el queryset base; ``vacas`` indica si admite los filtros del listado
+Reporte = namedtuple('Reporte', ['titulo', 'columnas', 'consulta', 'vacas', 'solo_admin'])
+
+_RAZAS = dict(Vaca.RAZAS)
+_ROLES = dict(CustomUser.ROLES)
+
+
+def _si_no(valor):
+    return 'Sí' if valor else 'No'
+
+
+def _fecha(valor):
+    return timezone.localtime(valor).strftime('%d/%m/%Y %H:%M') if valor else ''
+
+
+def _raza(valor):
+    return _RAZAS.get(valor, valor)
+
+
+def _vacas(estado=None):
+    queryset = Vaca.objects.all() if estado is None else Vaca.objects.filter(ESTADOS_VACA[estado])
+    return queryset.order_by('-fecha', '-id')
+
+
+_NOMBRE = Columna('Nombre', 'nombre', ancho=20)
+_RAZA = Columna('Raza', 'raza', _raza, ancho=16)
+
+REPORTES = {
+    'usuarios': Reporte('Usuarios', [
+        Columna('Usuario', 'username', ancho=20),
+        Columna('Email', 'email', ancho=30),
+        Columna('Rol', 'role', lambda v: _ROLES.get(v, v), ancho=18),
+        Columna('Finca', 'finca__nombre', ancho=24),
+        Columna('Teléfono', 'phone', ancho=16),
+    ], lambda: CustomUser.objects.order_by('username'), vacas=False, solo_admin=True),
+    'vacas_general': Reporte('Vacas (todas)', [
+        _NOMBRE,
+        _RAZA,
+        Columna('Temperatura corporal', 'temperatura'),
+        Columna('Condición corporal', 'condicion'),
+        Columna('Gestante', 'gestante', _si_no, ancho=9),
+        Columna('Inseminada', 'inseminada', _si_no, ancho=11),
+        Columna('Probabilidad de celo (%)', 'prediccion', lambda v: round(v, 2), ancho=14),
+        Columna('Fecha', 'fecha', _fecha, ancho=17),
+    ], _vacas, vacas=True, solo_admin=False),
+    'vacas_celo': Reporte('Vacas en posible celo', [
+        _NOMBRE,
+        Columna('Probabilidad (%)', 'prediccion', lambda v: round(v, 2), ancho=14),
+        Columna('Fecha', 'fecha', _fecha, ancho=17),
+        Columna('Actividad física', 'actividad', ancho=16),
+        Columna('Temperatura corporal', 'temperatura'),
+    ], lambda: _vacas('celo'), vacas=True, solo_admin=False),
+    'vacas_gestantes': Reporte('Vacas gestantes', [
+        _NOMBRE,
+        Columna('Fecha inseminación', 'fecha_inseminacion', _fecha, ancho=17),
+        Columna('Fecha gestación', 'fecha_gestacion', _fecha, ancho=17),
+        Columna('Días posparto', 'dias_posparto'),
+        Columna('Condición', 'condicion'),
+        _RAZA,
+    ], lambda: _vacas('gestante'), vacas=True, solo_admin=False),
+    'vacas_inseminadas': Reporte('Vacas inseminadas', [
+        _NOMBRE,
+        Columna('Fecha inseminación', 'fecha_inseminacion', _fecha, ancho=17),
+        Columna('Días posparto', 'dias_posparto'),
+        Columna('Condición', 'condicion'),
+        _RAZA,
+    ], lambda: _vacas('inseminada'), vacas=True, solo_admin=False),
+}
+
+
+def filas(reporte, queryset):
+    """Valores ya formateados de cada fila, leídos por lotes."""
+    columnas = reporte.columnas
+    formatos = [(i, c.formato) for i, c in enumerate(columnas) if c.formato is not None]
+    for fila in queryset.values_list(*(c.campo for c in columnas)).iterator(chunk_size=TAMANO_LOTE):
+        if formatos:
+            fila = list(fila)
+            for i, formato in formatos:
+                fila[i] = formato(fila[i])
+        yield fila
+
+
+def _fragmentos(iterable, tamano=FILAS_POR_FRAGMENTO):
+    bloque = []
+    for elemento in iterable:
+        bloque.append(elemento)
+        if len(bloque) >= tamano:
+            yield bloque
+            bloque = []
+    if bloque:
+        yield bloque
+
+
+# --- CSV ---------------------------------------------------------------------
+
+class _Eco:
+    """Destino de ``csv.writer`` que devuelve la línea en lugar de guardarla."""
+
+    def write(self, valor):
+        return valor
+
+
+def generar_csv(reporte, filas):
+    escritor = csv.writer(_Eco())
+    # BOM para que Excel reconozca UTF-8
+    yield ('\ufeff' + escritor.writerow([c.titulo for c in reporte.columnas])).encode('utf-8')
+    for bloque in _fragmentos(filas):
+        yield ''.join(escritor.writerow(fila) for fila in bloque).encode('utf-8')
+
+
+# --- XLSX --------------------------------------------------------------------
+
+class _Tubo(io.RawIOBase):
+    """Destino no posicionable para ``zipfile``: acumula lo escrito hasta que se vacía."""
+
+    def __init__(self):
+        self._partes = []
+        self._posicion = 0
+
+    def writable(self):
+        return True
+
+    def write(self, datos):
+        self._partes.append(bytes(datos))
+        self._posicion += len(datos)
+        return len(datos)
+
+    def tell(self):
+        return self._posicion
+
+    def vaciar(self):
+        datos = b''.join(self._partes)
+        self._partes = []
+        return datos
+
+
+_XLSX_TIPOS = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+    '<Types xmlns="http://schemas.openxmlformats.org/package/2006/content-types">'
+    '<Default Extension="rels" ContentType="application/vnd.openxmlformats-package.relationships+xml"/>'
+    '<Default Extension="xml" ContentType="application/xml"/>'
+    '<Override PartName="/xl/workbook.xml" '
+    'ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet.main+xml"/>'
+    '<Override PartName="/xl/worksheets/sheet1.xml" '
+    'ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.worksheet+xml"/>'
+    '</Types>'
+)
+_XLSX_RELACIONES = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+    '<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">'
+    '<Relationship Id="rId1" '
+    'Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/officeDocument" '
+    'Target="xl/workbook.xml"/>'
+    '</Relationships>'
+)
+_XLSX_LIBRO = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+    '<workbook xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main" '
+    'xmlns:r="http://schemas.openxmlformats.org/officeDocument/2006/relationships">'
+    '<sheets><sheet name="{hoja}" sheetId="1" r:id="rId1"/></sheets>'
+    '</workbook>'
+)
+_XLSX_RELACIONES_LIBRO = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+    '<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">'
+    '<Relationship Id="rId1" '
+    'Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/worksheet" '
+    'Target="worksheets/sheet1.xml"/>'
+    '</Relationships>'
+)
+
+# Caracteres de control que XML no admite
+_NO_XML = re.compile('[\x00-\x08\x0b\x0c\x0e-\x1f]')
+
+
+def _celda(valor):
+    if valor is None or valor == '':
+        return '<c/>'
+    if isinstance(valor, (int, float)) and not isinstance(valor, bool):
+        return f'<c><v>{valor!r}</v></c>'
+    texto = escape(_NO_XML.sub('', str(valor)))
+    return f'<c t="inlineStr"><is><t xml:space="preserve">{texto}</t></is></c>'
+
+
+def _fila_xml(valores):
+    return '<row>' + ''.join(_celda(v) for v in valores) + '</row>'
+
+
+def generar_xlsx(reporte, filas):
+    tubo = _Tubo()
+    # Nombre de hoja: máximo 31 caracteres y sin []:*?/\
+    hoja = escape(re.sub(r'[\[\]:*?/\\]', ' ', reporte.titulo)[:31])
+    with zipfile.ZipFile(tubo, 'w', compression=zipfile.ZIP_DEFLATED) as libro:
+        libro.writestr('[Content_Types].xml', _XLSX_TIPOS)
+        libro.writestr('_rels/.rels', _XLSX_RELACIONES)
+        libro.writestr('xl/workbook.xml', _XLSX_LIBRO.format(hoja=hoja))
+        libro.writestr('xl/_rels/workbook.xml.rels', _XLSX_RELACIONES_LIBRO)
+        yield tubo.vaciar()
+
+        with libro.open('xl/worksheets/sheet1.xml', 'w', force_zip64=True) as xml:
+            xml.write((
+                '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+                '<worksheet xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main"><sheetData>'
+                + _fila_xml(c.titulo for c in reporte.columnas)
+            ).encode('utf-8'))
+            for bloque in _fragmentos(filas):
+                xml.write(''.join(_fila_xml(fila) for fila in bloque).encode('utf-8'))
+                # El compresor retiene datos hasta llenar su búfer; se envía lo que ya produjo
+                datos = tubo.vaciar()
+                if datos:
+                    yield datos
+            xml.write(b'</sheetData></worksheet>')
+    yield tubo.vaciar()
+
+
+# --- PDF ---------------------------------------------------------------------
+
+# A4 apaisado, en puntos
+_PDF_ANCHO, _PDF_ALTO = 842, 595
+_PDF_MARGEN = 36
+_PDF_CUERPO = 8
+_PDF_INTERLINEA = 10
+# Courier: cada carácter ocupa 0,6 veces el tamaño de la fuente
+_PDF_CARACTERES = int((_PDF_ANCHO - 2 * _PDF_MARGEN) / (0.6 * _PDF_CUERPO))
+_PDF_LINEAS = int((_PDF_ALTO - 2 * _PDF_MARGEN) / _PDF_INTERLINEA)
+
+
+def _texto_pdf(linea):
+    texto = linea.encode('cp1252', errors='replace')
+    return texto.replace(b'\\', b'\\\\').replace(b'(', b'\\(').replace(b')', b'\\)')
+
+
+def _linea_tabla(valores, anchos):
+    celdas = []
+    for valor, ancho in zip(valores, anchos):
+        texto = '' if valor is None else str(valor)
+        celdas.append(texto[:ancho - 1] + '…' if len(texto) > ancho else texto.ljust(ancho))
+    return ' '.join(celdas)[:_PDF_CARACTERES].rstrip()
+
+
+class _EscritorPDF:
+    """Lleva la posición de cada objeto para la tabla de referencias final."""
+
+    def __init__(self):
+        self.posicion = 0
+        self.posiciones = {}
+
+    def bytes(self, datos):
+        self.posicion += len(datos)
+        return datos
+
+    def objeto(self, numero, cuerpo):
+        self.posiciones[numero] = self.posicion
+        return self.bytes(b'%d 0 obj\n' % numero + cuerpo + b'\nendobj\n')
+
+
+def generar_pdf(reporte, filas):
+    pdf = _EscritorPDF()
+    # 1: catálogo y 2: árbol de páginas se escriben al final; 3: fuente
+    yield pdf.bytes(b'%PDF-1.4\n%\xe2\xe3\xcf\xd3\n')
+    yield pdf.objeto(3, b'<< /Type /Font /Subtype /Type1 /BaseFont /Courier /Encoding /WinAnsiEncoding >>')
+
+    anchos = [max(c.ancho, 4) for c in reporte.columnas]
+    encabezado = [
+        f'{reporte.titulo} - {timezone.localtime().strftime("%d/%m/%Y %H:%M")}',
+        '',
+        _linea_tabla([c.titulo for c in reporte.columnas], anchos),
+        '-' * min(sum(anchos) + len(anchos) - 1, _PDF_CARACTERES),
+    ]
+    filas_por_pagina = _PDF_LINEAS - len(encabezado) - 2
+    paginas = []
+    siguiente = 4
+
+    def pagina(lineas):
+        nonlocal siguiente
+        contenido = zlib.compress(b''.join([
+            b'BT /F1 %d Tf %d TL %d %d Td\n' % (_PDF_CUERPO, _PDF_INTERLINEA, _PDF_MARGEN, _PDF_ALTO - _PDF_MARGEN),
+            b''.join(b'(' + _texto_pdf(linea) + b") '\n" for linea in lineas),
+            b'ET',
+        ]))
+        numero_contenido, numero_pagina = siguiente, siguiente + 1
+        siguiente += 2
+        paginas.append(numero_pagina)
+        return (
+            pdf.objeto(numero_contenido, b'<< /Length %d /Filter /FlateDecode >>\nstream\n' % len(contenido) + contenido + b'\nendstream')
+            + pdf.objeto(numero_pagina, (
+                b'<< /Type /Page /Parent 2 0 R /MediaBox [0 0 %d %d] '
+                b'/Resources << /Font << /F1 3 0 R >> >> /Contents %d 0 R >>'
+            ) % (_PDF_ANCHO, _PDF_ALTO, numero_contenido))
+        )
+
+    for bloque in _fragmentos(filas, filas_por_pagina):
+        lineas = encabezado + [_linea_tabla(fila, anchos) for fila in bloque]
+        yield pagina(lineas + ['', f'Página {len(paginas) + 1}'])
+    if not paginas:
+        yield pagina(encabezado + ['Sin datos.'])
+
+    kids = b' '.join(b'%d 0 R' % numero for numero in paginas)
+    yield pdf.objeto(2, b'<< /Type /Pages /Kids [%s] /Count %d >>' % (kids, len(paginas)))
+    yield pdf.objeto(1, b'<< /Type /Catalog /Pages 2 0 R >>')
+
+    inicio_xref = pdf.posicion
+    referencias = [b'xref\n0 %d\n' % siguiente, b'0000000000 65535 f \n']
+    referencias += [b'%010d 00000 n \n' % pdf.posiciones[numero] for numero in range(1, siguiente)]
+    referencias.append(b'trailer\n<< /Size %d /Root 1 0 R >>\nstartxref\n%d\n%%%%EOF\n' % (siguiente, inicio_xref))
+    yield pdf.bytes(b''.join(referencias))
+
+
+FORMATOS = {
+    'csv': ('text/csv; charset=utf-8', generar_csv),
+    'xlsx': ('application/vnd.openxmlformats-officedocument.spreadsheetml.sheet', generar_xlsx),
+    'pdf': ('application/pdf', generar_pdf),
+}
+
+
+def exportar(reporte, formato, queryset):
+    """``(content_type, generador de bytes)`` del reporte en ``formato``."""
+    tipo, generar = FORMATOS[formato]
+    return tipo, generar(reporte, filas(reporte, queryset))
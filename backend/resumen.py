@@ -0,0 +1,87 @@
+"""Resumen agregado del rebaño para el panel principal.
+
+La clave de la caché incluye el cursor de ``CambioVaca`` de la finca
+(``cambios.cursor_actual``), que avanza con cada escritura de vacas y está en
+la base de datos: todos los procesos ven el mismo. La generación que cambia
+``invalidar_resumen`` solo la ve quien comparte la caché; con una caché por
+proceso (``LocMemCache``) los demás dejan de servir conteos viejos por el
+cursor, no por la generación.
+"""
+import time
+
+from django.core.cache import cache
+from django.db.models import Avg, Count, Q
+
+from .cambios import cursor_actual
+from .fincas import finca_de
+from .models import Vaca, ESTADOS_VACA
+
+CLAVE_GENERACION = 'vacas:resumen:generacion'
+
+# Las señales invalidan el resumen; el TTL solo acota entradas olvidadas
+RESUMEN_TTL = 300
+
+# Límites (%) de los intervalos del histograma de predicción
+LIMITES_HISTOGRAMA = list(range(0, 101, 10))
+
+
+def calcular_resumen(queryset=None):
+    """Calcula conteos por estado, por raza e histograma con una sola consulta agregada."""
+    if queryset is None:
+        queryset = Vaca.objects.all()
+
+    agregados = {
+        'total': Count('id'),
+        'promedio_prediccion': Avg('prediccion'),
+    }
+    for estado, condicion in ESTADOS_VACA.items():
+        agregados[f'estado_{estado}'] = Count('id', filter=condicion)
+    for codigo, _ in Vaca.RAZAS:
+        agregados[f'raza_{codigo}'] = Count('id', filter=Q(raza=codigo))
+    for i, (desde, hasta) in enumerate(zip(LIMITES_HISTOGRAMA, LIMITES_HISTOGRAMA[1:])):
+        rango = Q(prediccion__gte=desde, prediccion__lt=hasta)
+        if hasta == LIMITES_HISTOGRAMA[-1]:
+            rango = Q(prediccion__gte=desde, prediccion__lte=hasta)
+        agregados[f'histograma_{i}'] = Count('id', filter=rango)
+
+    fila = queryset.order_by().aggregate(**agregados)
+
+    total = fila['total']
+    estados = {estado: fila[f'estado_{estado}'] for estado in ESTADOS_VACA}
+    return {
+        'total': total,
+        'posible_celo': estados['celo'],
+        'inseminadas': estados['inseminada'],
+        'gestantes': estados['gestante'],
+        'otras': total - sum(estados.values()),
+        'promedio_prediccion': round(fila['promedio_prediccion'] or 0.0, 2),
+        'por_raza': [
+            {'raza': codigo, 'nombre': nombre, 'cantidad': fila[f'raza_{codigo}']}
+            for codigo, nombre in Vaca.RAZAS
+        ],
+        'histograma': [
+            {'desde': desde, 'hasta': hasta, 'cantidad': fila[f'histograma_{i}']}
+            for i, (desde, hasta) in enumerate(zip(LIMITES_HISTOGRAMA, LIMITES_HISTOGRAMA[1:]))
+        ],
+    }
+
+
+def _clave(usuario):
+    # La generación cambia con cada invalidación; las claves anteriores dejan de leerse
+    generacion = cache.get_or_set(CLAVE_GENERACION, time.time_ns, None)
+    finca = finca_de(usuario)
+    return f'vacas:resumen:{generacion}:{cursor_actual(finca)}:{usuario.pk}:{usuario.finca_id}'
+
+
+def obtener_resumen(usuario, queryset=None):
+    """Resumen de ``queryset`` (las vacas que ve ``usuario``) cacheado por usuario."""
+    clave = _clave(usuario)
+    resumen = cache.get(clave)
+    if resumen is None:
+        resumen = calcular_resumen(queryset)
+        cache.set(clave, resumen, RESUMEN_TTL)
+    return resumen
+
+
+def invalidar_resumen():
+    cache.set(CLAVE_GENERACION, time.time_ns(), None)
@@ -1,46 +1,204 @@
-# predictor/serializers.py
-from rest_framework import serializers
-from .models import Vaca
-from .models import CustomUser
-from rest_framework_simplejwt.serializers import TokenObtainPairSerializer
-
-
-class VacaSerializer(serializers.ModelSerializer):
-    class Meta:
-        model = Vaca
-        fields = '__all__'
-
-
-class UserSerializer(serializers.ModelSerializer):
-    class Meta:
-        model = CustomUser
-        fields = ('id', 'username', 'email', 'role', 'farm', 'phone')
-
-class RegisterSerializer(serializers.ModelSerializer):
-    password = serializers.CharField(write_only=True)
-
-    class Meta:
-        model = CustomUser
-        fields = ('username', 'password', 'email', 'role', 'farm', 'phone')
-
-    def create(self, validated_data):
-        user = CustomUser.objects.create_user(
-            username=validated_data['username'],
-            password=validated_data['password'],
-            email=validated_data.get('email', ''),
-            role=validated_data.get('role', 'user'),
-            farm=validated_data.get('farm', ''),
-            phone=validated_data.get('phone', '')
-        )
-        return user
-
-class CustomTokenObtainPairSerializer(TokenObtainPairSerializer):
-    @classmethod
-    def get_token(cls, user):
-        token = super().get_token(user)
-        return token
-
-    def validate(self, attrs):
-        data = super().validate(attrs)
-        data['user'] = UserSerializer(self.user).data
+# predictor/serializers.py
+from django.conf import settings
+from django.utils import timezone
+from rest_framework import serializers
+from .models import Vaca, Lectura, TareaReevaluacion, RANGOS_LECTURA
+from .models import CustomUser, Finca
+from .filters import PARAMETROS_FILTRO
+from .fincas import finca_por_nombre
+from .transiciones import TRANSICIONES
+from rest_framework_simplejwt.serializers import TokenObtainPairSerializer
+
+
+def _validar_campos(campos, disponibles):
+    desconocidos = set(campos) - set(disponibles)
+    if desconocidos:
+        raise serializers.ValidationError({'fields': f'Campos desconocidos: {", ".join(sorted(desconocidos))}.'})
+
+
+class VacaSerializer(serializers.ModelSerializer):
+    raza_nombre = serializers.CharField(source='get_raza_display', read_only=True)
+
+    class Meta:
+        model = Vaca
+        fields = '__all__'
+        # La asigna la vista según el usuario (ver ``fincas.finca_para_alta``)
+        read_only_fields = ('finca',)
+        # Cada cambio agrega una Lectura, cuyos campos no admiten negativos
+        extra_kwargs = {
+            campo: {'min_value': minimo, 'max_value': maximo} for campo, (minimo, maximo) in RANGOS_LECTURA.items()
+        }
+
+    def __init__(self, *args, **kwargs):
+        # ``fields`` limita los campos devueltos (p. ej. ?fields=id,nombre,prediccion)
+        campos = kwargs.pop('fields', None)
+        super().__init__(*args, **kwargs)
+        if campos is not None:
+            _validar_campos(campos, self.fields)
+            for nombre in set(self.fields) - set(campos):
+                self.fields.pop(nombre)
+
+
+# Etiquetas de las razas calculadas una sola vez (en lugar de get_raza_display por fila)
+ETIQUETAS_RAZA = dict(Vaca.RAZAS)
+
+# Campos de fecha y hora de Vaca, que se convierten igual que DateTimeField de DRF
+_FECHAS_VACA = ('fecha', 'fecha_inseminacion', 'fecha_gestacion')
+
+
+def fecha_iso(valor):
+    """Misma representación que ``DateTimeField`` de DRF: zona horaria actual y ``Z`` para UTC."""
+    if valor is None:
+        return None
+    if settings.USE_TZ and timezone.is_aware(valor):
+        valor = timezone.localtime(valor)
+    texto = valor.isoformat()
+    return texto[:-6] + 'Z' if texto.endswith('+00:00') else texto
+
+
+class VacaListaSerializer:
+    """Serialización de solo lectura para listados de vacas a partir de ``values()``.
+
+    Devuelve lo mismo que ``VacaSerializer`` pero sin crear instancias de
+    Vaca ni pasar cada valor por los campos de DRF; ``manage.py
+    benchmark_serializadores`` compara ambos. ``columnas`` incluye siempre
+    ``id`` y ``fecha``, que necesita la paginación por cursor.
+    """
+
+    campos_disponibles = ('id', 'raza_nombre') + tuple(f.name for f in Vaca._meta.concrete_fields if f.name != 'id')
+
+    def __init__(self, campos=None):
+        if campos is not None:
+            _validar_campos(campos, self.campos_disponibles)
+        self.campos = [c for c in self.campos_disponibles if campos is None or c in campos]
+        columnas = {'id', 'fecha', *self.campos} - {'raza_nombre'}
+        if 'raza_nombre' in self.campos:
+            columnas.add('raza')
+        self.columnas = tuple(c for c in self.campos_disponibles if c in columnas)
+        self._fechas = [c for c in _FECHAS_VACA if c in self.campos]
+
+    def serializar(self, filas):
+        """Convierte los diccionarios de ``values(*columnas)`` sin modificarlos.
+
+        La paginación por cursor vuelve a leer ``fecha`` e ``id`` de las filas
+        originales al armar el enlace siguiente.
+        """
+        campos, fechas, con_nombre = self.campos, self._fechas, 'raza_nombre' in self.campos
+        resultado = []
+        for fila in filas:
+            salida = {campo: fila.get(campo) for campo in campos}
+            for campo in fechas:
+                salida[campo] = fecha_iso(salida[campo])
+            if con_nombre:
+                salida['raza_nombre'] = ETIQUETAS_RAZA.get(fila['raza'], fila['raza'])
+            resultado.append(salida)
+        return resultado
+
+
+class LecturaSerializer(serializers.ModelSerializer):
+    class Meta:
+        model = Lectura
+        fields = ('id', 'vaca', 'fecha', 'actividad', 'temperatura', 'dias_posparto', 'condicion', 'prediccion',
+                  'version_modelo')
+
+
+class EntradaPrediccionSerializer(serializers.Serializer):
+    # Datos de una vaca recibidos para predecir (p. ej. una fila de la predicción por lote)
+    nombre = serializers.CharField(max_length=50)
+    actividad = serializers.IntegerField(min_value=0)
+    temperatura = serializers.FloatField()
+    dias_posparto = serializers.IntegerField(min_value=0, max_value=RANGOS_LECTURA['dias_posparto'][1])
+    condicion = serializers.FloatField()
+    raza = serializers.ChoiceField(choices=Vaca.RAZAS)
+    parto_asistido = serializers.BooleanField(default=False)
+
+
+class TransicionSerializer(serializers.Serializer):
+    # Cambio de estado reproductivo de varias vacas (POST vacas/transicion/)
+    transicion = serializers.ChoiceField(choices=list(TRANSICIONES))
+    ids = serializers.ListField(child=serializers.IntegerField(min_value=1), allow_empty=False, max_length=5000)
+
+
+class TareaReevaluacionSerializer(serializers.ModelSerializer):
+    porcentaje = serializers.SerializerMethodField()
+
+    class Meta:
+        model = TareaReevaluacion
+        fields = ('id', 'estado', 'filtros', 'total', 'procesadas', 'porcentaje', 'ultimo_id', 'version_modelo',
+                  'error', 'creada', 'actualizada', 'iniciada', 'finalizada')
+        read_only_fields = [campo for campo in fields if campo != 'filtros']
+
+    def validate_filtros(self, filtros):
+        """Los filtros se aplican como parámetros del listado: un objeto de valores simples."""
+        if filtros is None:
+            return {}
+        if not isinstance(filtros, dict):
+            raise serializers.ValidationError('Debe ser un objeto con los parámetros del listado de vacas.')
+        desconocidos = sorted(set(filtros) - set(PARAMETROS_FILTRO))
+        if desconocidos:
+            raise serializers.ValidationError(
+                f'Parámetros desconocidos: {", ".join(desconocidos)}. Admitidos: {", ".join(PARAMETROS_FILTRO)}.'
+            )
+        compuestos = sorted(
+            nombre for nombre, valor in filtros.items()
+            if isinstance(valor, bool) or not isinstance(valor, (str, int, float))
+        )
+        if compuestos:
+            raise serializers.ValidationError(f'Deben ser texto o números: {", ".join(compuestos)}.')
+        return {nombre: str(valor) for nombre, valor in filtros.items()}
+
+    def get_porcentaje(self, tarea):
+        if tarea.estado == 'completada':
+            return 100.0
+        return round(100.0 * tarea.procesadas / tarea.total, 1) if tarea.total else 0.0
+
+
+class FincaPorNombre(serializers.SlugRelatedField):
+    """La finca de un usuario por nombre; al asignar un nombre nuevo se crea la finca."""
+
+    def __init__(self, **kwargs):
+        super().__init__(slug_field='nombre', queryset=Finca.objects.all(), allow_null=True, required=False,
+                         **kwargs)
+
+    def to_internal_value(self, data):
+        nombre = str(data).strip()
+        return finca_por_nombre(nombre) if nombre else None
+
+
+class UserSerializer(serializers.ModelSerializer):
+    # Se conserva ``farm`` (el nombre) en la API
+    farm = FincaPorNombre(source='finca')
+
+    class Meta:
+        model = CustomUser
+        fields = ('id', 'username', 'email', 'role', 'farm', 'phone')
+
+class RegisterSerializer(serializers.ModelSerializer):
+    password = serializers.CharField(write_only=True)
+    farm = FincaPorNombre(source='finca')
+
+    class Meta:
+        model = CustomUser
+        fields = ('username', 'password', 'email', 'role', 'farm', 'phone')
+
+    def create(self, validated_data):
+        user = CustomUser.objects.create_user(
+            username=validated_data['username'],
+            password=validated_data['password'],
+            email=validated_data.get('email', ''),
+            role=validated_data.get('role', 'user'),
+            finca=validated_data.get('finca'),
+            phone=validated_data.get('phone', '')
+        )
+        return user
+
+class CustomTokenObtainPairSerializer(TokenObtainPairSerializer):
+    @classmethod
+    def get_token(cls, user):
+        token = super().get_token(user)
+        return token
+
+    def validate(self, attrs):
+        data = super().validate(attrs)
+        data['user'] = UserSerializer(self.user).data
         return data
\ No newline at end of file
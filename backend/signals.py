@@ -0,0 +1,18 @@
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from .cambios import registrar_cambios
+from .models import Vaca
+from .resumen import invalidar_resumen
+
+
+@receiver(post_save, sender=Vaca)
+def vaca_modificada(sender, instance, **kwargs):
+    registrar_cambios([instance])
+    invalidar_resumen()
+
+
+@receiver(post_delete, sender=Vaca)
+def vaca_eliminada(sender, instance, **kwargs):
+    registrar_cambios([instance], eliminadas=True)
+    invalidar_resumen()
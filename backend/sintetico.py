@@ -0,0 +1,169 @@
+"""Generación de rebaños sintéticos para entrenamiento y pruebas de carga.
+
+Como ``codificador.py``, no depende de Django: lo usan tanto los scripts de
+``ML-models`` como el comando ``generar_rebano``. Las etiquetas se calculan
+con operaciones vectorizadas sobre columnas completas, y las salidas grandes
+se generan por bloques para que la memoria no crezca con el número de filas.
+Cada bloque es un dict ``columna -> arreglo de NumPy``; pandas solo se usa en
+``generar_rebano`` (para los scripts de ``ML-models``) y pyarrow en
+``escribir_parquet``.
+"""
+import csv
+
+import numpy as np
+
+from .codificador import RAZAS
+
+TAMANO_BLOQUE = 500_000
+
+# Columnas de cada bloque, en el orden de los archivos generados
+COLUMNAS = (
+    'actividad', 'temperatura', 'dias_posparto', 'condicion_corporal', 'raza', 'parto_asistido', 'celo_posparto',
+)
+
+# Columnas de ``como_lecturas``: el formato de ``importacion.importar_lecturas``, sin la etiqueta
+COLUMNAS_LECTURAS = ('nombre', 'actividad', 'temperatura', 'dias_posparto', 'condicion', 'raza', 'parto_asistido')
+
+# Razas que suman medio punto en la regla de celo
+RAZAS_FAVORABLES = ('Holstein', 'Siboney de Cuba')
+
+
+def _entre(valores, minimo, maximo):
+    valores = np.asarray(valores)
+    return ((valores >= minimo) & (valores <= maximo)).astype(float)
+
+
+def calcular_celo(datos):
+    """Etiqueta de celo posparto (0/1) de cada fila con la regla de puntos del dataset sintético.
+
+    ``datos`` es un bloque o un DataFrame con las mismas columnas.
+    """
+    puntos = (
+        _entre(datos['temperatura'], 38.0, 39.5)
+        + _entre(datos['condicion_corporal'], 2.5, 3.5)
+        + (np.asarray(datos['actividad']) > 110)
+        + (np.asarray(datos['dias_posparto']) > 40)
+        + (np.asarray(datos['parto_asistido']) == 0)
+        + 0.5 * np.isin(np.asarray(datos['raza']), RAZAS_FAVORABLES)
+    )
+    return (puntos >= 3).astype(int)
+
+
+def _normalizar_mezcla(mezcla_razas):
+    """``{nombre: peso}`` -> (nombres, probabilidades); sin mezcla, todas las razas por igual."""
+    if not mezcla_razas:
+        return [nombre for _, nombre in RAZAS], None
+    nombres = list(mezcla_razas)
+    desconocidas = set(nombres) - {nombre for _, nombre in RAZAS}
+    if desconocidas:
+        raise ValueError(f'Razas desconocidas: {", ".join(sorted(desconocidas))}')
+    pesos = np.array([mezcla_razas[nombre] for nombre in nombres], dtype=float)
+    if (pesos < 0).any() or pesos.sum() <= 0:
+        raise ValueError('Los pesos de la mezcla de razas deben ser positivos')
+    return nombres, pesos / pesos.sum()
+
+
+def _muestra(rng, n, razas, probabilidades, actividad_media, actividad_std):
+    # Mismo orden de sorteos que el script de entrenamiento original: con la
+    # semilla 42 se obtiene exactamente el mismo dataset
+    return {
+        'actividad': np.clip(rng.normal(actividad_media, actividad_std, n), 60, 160),
+        'temperatura': np.round(rng.uniform(37.5, 40.5, n), 1),
+        'dias_posparto': rng.randint(20, 150, n),
+        'condicion_corporal': np.round(rng.uniform(1, 5, n), 1),
+        'raza': rng.choice(razas, n, p=probabilidades),
+        'parto_asistido': rng.choice([0, 1], n, p=[0.8, 0.2]),
+    }
+
+
+def generar_bloques(n, semilla=42, mezcla_razas=None, ruido=0.0, actividad_media=100, actividad_std=20,
+                    tamano_bloque=TAMANO_BLOQUE):
+    """Produce ``n`` vacas sintéticas en bloques (columna -> arreglo) de hasta ``tamano_bloque`` filas.
+
+    ``ruido`` es la probabilidad de invertir cada etiqueta. El resultado es
+    reproducible para la misma semilla y el mismo ``tamano_bloque``.
+    """
+    if not 0 <= ruido <= 1:
+        raise ValueError('ruido debe estar entre 0 y 1')
+    razas, probabilidades = _normalizar_mezcla(mezcla_razas)
+    rng = np.random.RandomState(semilla)
+    for inicio in range(0, n, tamano_bloque):
+        filas = min(tamano_bloque, n - inicio)
+        bloque = _muestra(rng, filas, razas, probabilidades, actividad_media, actividad_std)
+        celo = calcular_celo(bloque)
+        if ruido:
+            celo = np.where(rng.random_sample(filas) < ruido, 1 - celo, celo)
+        bloque['celo_posparto'] = celo
+        yield bloque
+
+
+def filas_de(bloque):
+    return len(bloque['raza'])
+
+
+def generar_rebano(n, **opciones):
+    """Como ``generar_bloques``, en un solo DataFrame (requiere pandas, como los scripts de ``ML-models``)."""
+    import pandas as pd
+
+    return pd.concat([pd.DataFrame(bloque) for bloque in generar_bloques(n, **opciones)], ignore_index=True)
+
+
+def _lista(valores):
+    # Los bloques de ``como_lecturas`` ya son listas
+    return valores.tolist() if isinstance(valores, np.ndarray) else valores
+
+
+def escribir_csv(ruta, bloques, columnas=COLUMNAS):
+    """Escribe ``columnas`` de cada bloque (``COLUMNAS_LECTURAS`` para los de ``lecturas_sinteticas``)."""
+    filas = 0
+    with open(ruta, 'w', newline='') as archivo:
+        escritor = csv.writer(archivo, lineterminator='\n')
+        escritor.writerow(columnas)
+        for bloque in bloques:
+            escritor.writerows(zip(*(_lista(bloque[columna]) for columna in columnas)))
+            filas += filas_de(bloque)
+    return filas
+
+
+def escribir_parquet(ruta, bloques, columnas=COLUMNAS):
+    """Escribe cada bloque como un grupo de filas (requiere pyarrow); ``columnas`` como en ``escribir_csv``."""
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+    filas = 0
+    escritor = None
+    try:
+        for bloque in bloques:
+            tabla = pa.Table.from_pydict({columna: bloque[columna] for columna in columnas})
+            if escritor is None:
+                escritor = pq.ParquetWriter(ruta, tabla.schema)
+            escritor.write_table(tabla)
+            filas += filas_de(bloque)
+    finally:
+        if escritor is not None:
+            escritor.close()
+    return filas
+
+
+def como_lecturas(bloque, inicio=0, prefijo='Sintética'):
+    """Convierte un bloque al formato de ``importacion.importar_lecturas`` (campo -> lista).
+
+    ``inicio`` es la posición de la primera fila en el rebaño, que numera los nombres.
+    """
+    return {
+        'nombre': [f'{prefijo} {i}' for i in range(inicio, inicio + filas_de(bloque))],
+        'actividad': np.rint(bloque['actividad']).astype(int).tolist(),
+        'temperatura': bloque['temperatura'].tolist(),
+        'dias_posparto': bloque['dias_posparto'].tolist(),
+        'condicion': bloque['condicion_corporal'].tolist(),
+        'raza': bloque['raza'].tolist(),
+        'parto_asistido': bloque['parto_asistido'].astype(bool).tolist(),
+    }
+
+
+def lecturas_sinteticas(bloques, prefijo='Sintética'):
+    """``como_lecturas`` de cada bloque, con los nombres numerados en todo el rebaño."""
+    inicio = 0
+    for bloque in bloques:
+        yield como_lecturas(bloque, inicio, prefijo)
+        inicio += filas_de(bloque)
@@ -0,0 +1,112 @@
+"""Ejecución de las tareas de reevaluación encoladas en ``TareaReevaluacion``.
+
+No requiere un broker externo: la cola es la propia tabla y el trabajador es
+``manage.py procesar_tareas``, un proceso independiente de los que atienden
+las peticiones.
+"""
+import logging
+from datetime import timedelta
+
+from django.db import transaction
+from django.db.models import Max, Q
+from django.utils.timezone import now
+
+from .alertas import OPCIONES as OPCIONES_ALERTAS, crear_alertas
+from .cambios import registrar_cambios
+from .estadisticas import relativas_por_vaca
+from .filters import filtrar_vacas
+from .fincas import finca_de
+from .models import Vaca, TareaReevaluacion
+from .prediccion import CAMPOS_ENTRADA, predecir_columnas
+from .registro_modelo import obtener_modelo
+from .resumen import invalidar_resumen
+
+logger = logging.getLogger(__name__)
+
+TAMANO_LOTE = 1000
+
+# Una tarea en curso sin avances durante este tiempo se considera abandonada
+TIEMPO_ABANDONO = timedelta(minutes=10)
+
+
+def encolar_reevaluacion(filtros=None, usuario=None):
+    """Crea una tarea para reevaluar las vacas que cumplen ``filtros`` (mismos parámetros que el listado).
+
+    Si ``usuario`` solo ve su finca, la tarea queda limitada a ella. ``total``
+    es una estimación hasta que el trabajador toma la tarea y vuelve a contar.
+    """
+    filtros = dict(filtros or {})
+    finca = finca_de(usuario) if usuario is not None else None
+    if finca is not None:
+        filtros['finca'] = str(finca)
+    # Valida los filtros antes de encolar
+    total = filtrar_vacas(Vaca.objects.all(), filtros).count()
+    return TareaReevaluacion.objects.create(filtros=filtros, total=total, creada_por=usuario)
+
+
+def tomar_siguiente_tarea():
+    """Reserva la tarea más antigua disponible; devuelve None si no hay ninguna."""
+    disponibles = TareaReevaluacion.objects.filter(
+        Q(estado='pendiente') | Q(estado='en_curso', actualizada__lt=now() - TIEMPO_ABANDONO)
+    ).order_by('creada')
+    for tarea in disponibles[:10]:
+        # UPDATE condicionado: solo un trabajador logra reservar cada tarea
+        reservada = TareaReevaluacion.objects.filter(
+            pk=tarea.pk, estado=tarea.estado, actualizada=tarea.actualizada
+        ).update(estado='en_curso', iniciada=tarea.iniciada or now(), actualizada=now())
+        if reservada:
+            tarea.refresh_from_db()
+            return tarea
+    return None
+
+
+def ejecutar_tarea(tarea, tamano_lote=TAMANO_LOTE):
+    """Reevalúa por lotes desde ``tarea.ultimo_id`` y guarda el avance tras cada lote.
+
+    Al empezar (o continuar) fija el último id a reevaluar y recuenta ``total``
+    con las vacas que quedan hasta él: las creadas mientras tanto no se suman
+    al avance, que así no supera el total.
+    """
+    try:
+        vacas = filtrar_vacas(Vaca.objects.all(), tarea.filtros).order_by('id').only('id', 'finca', 'prediccion', 'inseminada', *CAMPOS_ENTRADA)
+        tope = vacas.aggregate(tope=Max('id'))['tope'] or 0
+        vacas = vacas.filter(id__lte=tope)
+        tarea.total = tarea.procesadas + vacas.filter(id__gt=tarea.ultimo_id).count()
+        tarea.save(update_fields=['total', 'actualizada'])
+        while True:
+            lote = list(vacas.filter(id__gt=tarea.ultimo_id)[:tamano_lote])
+            if not lote:
+                break
+
+            datos = {campo: [getattr(vaca, campo) for vaca in lote] for campo in CAMPOS_ENTRADA}
+            # La última lectura ya forma parte de la línea base de cada vaca
+            datos.update(relativas_por_vaca([vaca.id for vaca in lote], datos['actividad'], datos['temperatura']))
+            probabilidades = predecir_columnas(datos, usar_cache=False)
+            # Sin lectura nueva, solo alertan las vacas que pasan a superar el umbral
+            cruzan = []
+            for vaca, probabilidad in zip(lote, probabilidades.tolist()):
+                if vaca.prediccion <= OPCIONES_ALERTAS['umbral']:
+                    cruzan.append(vaca)
+                vaca.prediccion = probabilidad
+
+            with transaction.atomic():
+                Vaca.objects.bulk_update(lote, ['prediccion'], batch_size=500)
+                crear_alertas(cruzan)
+                registrar_cambios(lote)
+                tarea.ultimo_id = lote[-1].id
+                tarea.procesadas += len(lote)
+                # Una vaca que empieza a cumplir los filtros después del recuento también se procesa
+                tarea.total = max(tarea.total, tarea.procesadas)
+                tarea.version_modelo = obtener_modelo().version
+                tarea.save(update_fields=['ultimo_id', 'procesadas', 'total', 'version_modelo', 'actualizada'])
+            # bulk_update no emite post_save
+            invalidar_resumen()
+
+        tarea.estado = 'completada'
+    except Exception as e:
+        logger.exception('Falló la tarea de reevaluación %s', tarea.pk)
+        tarea.estado = 'fallida'
+        tarea.error = str(e)
+    tarea.finalizada = now()
+    tarea.save(update_fields=['estado', 'error', 'finalizada', 'actualizada'])
+    return tarea
@@ -0,0 +1,71 @@
+"""El bosque compilado predice lo mismo que el RandomForestClassifier de sklearn."""
+import os
+import tempfile
+
+import numpy as np
+from django.test import SimpleTestCase
+from sklearn.ensemble import RandomForestClassifier
+from sklearn.linear_model import LogisticRegression
+
+from backend.bosque import FILAS_POR_BLOQUE, BosqueCompilado, compilar_modelo
+from backend.codificador import CodificadorCaracteristicas
+from backend.paquete_modelo import escribir_paquete, leer_paquete
+from backend.sintetico import generar_bloques
+
+
+def datos_sinteticos(n, semilla):
+    """Matriz codificada y etiquetas de ``n`` vacas sintéticas."""
+    bloque = next(generar_bloques(n, semilla=semilla, ruido=0.05, tamano_bloque=n))
+    codificador = CodificadorCaracteristicas.para_razas()
+    X = codificador.transformar({**bloque, 'condicion': bloque['condicion_corporal']})
+    return codificador, X, bloque['celo_posparto']
+
+
+class BosqueCompiladoTests(SimpleTestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        cls.codificador, X, y = datos_sinteticos(2000, semilla=1)
+        cls.modelo = RandomForestClassifier(n_estimators=25, random_state=0).fit(X, y)
+        cls.bosque = BosqueCompilado.desde_sklearn(cls.modelo)
+        # Más filas que un bloque de predict_proba, con datos que el modelo no vio
+        cls.X = datos_sinteticos(FILAS_POR_BLOQUE * 2 + 37, semilla=2)[1]
+
+    def assertMismasProbabilidades(self, bosque, X):
+        np.testing.assert_allclose(bosque.predict_proba(X), self.modelo.predict_proba(X), rtol=0, atol=1e-12)
+
+    def test_mismas_probabilidades_por_bloques(self):
+        self.assertMismasProbabilidades(self.bosque, self.X)
+
+    def test_mismas_probabilidades_de_una_fila(self):
+        for fila in (0, 1, len(self.X) - 1):
+            with self.subTest(fila=fila):
+                self.assertMismasProbabilidades(self.bosque, self.X[fila:fila + 1])
+
+    def test_valores_en_los_umbrales(self):
+        # sklearn compara en float32: un valor justo en el umbral (o a un ulp en float64) debe ir al mismo lado
+        internos = self.bosque.izquierdo != np.arange(len(self.bosque.izquierdo))
+        umbrales = self.bosque.umbral[internos][:200]
+        caracteristicas = self.bosque.caracteristica[internos][:200]
+        X = np.repeat(self.X[:1], len(umbrales) * 2, axis=0)
+        filas = np.arange(len(umbrales))
+        X[filas, caracteristicas] = umbrales
+        X[filas + len(umbrales), caracteristicas] = np.nextafter(umbrales, np.inf)
+        self.assertMismasProbabilidades(self.bosque, X)
+
+    def test_mismas_clases_predichas(self):
+        np.testing.assert_array_equal(self.bosque.predict(self.X), self.modelo.predict(self.X))
+
+    def test_paquete_conserva_las_predicciones(self):
+        with tempfile.TemporaryDirectory() as directorio:
+            ruta = os.path.join(directorio, 'modelo.paquete')
+            escribir_paquete(ruta, self.bosque, self.codificador, {'origen': 'pruebas'})
+            paquete = leer_paquete(ruta)
+            self.assertMismasProbabilidades(paquete.bosque, self.X)
+            self.assertEqual(paquete.codificador.columnas, self.codificador.columnas)
+
+    def test_compilar_modelo_solo_aplana_bosques(self):
+        self.assertIsInstance(compilar_modelo(self.modelo), BosqueCompilado)
+        lineal = LogisticRegression().fit([[0.0], [1.0]], [0, 1])
+        self.assertIs(compilar_modelo(lineal), lineal)
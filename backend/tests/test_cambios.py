@@ -0,0 +1,160 @@
+"""Contrato de la sincronización incremental (``?since=``) y de los ETag del listado de vacas."""
+from django.test import TestCase
+from django.urls import reverse
+from rest_framework.test import APIClient
+
+from backend.cambios import cambios_desde
+from backend.models import CambioVaca, Finca
+
+from .utiles import confirmar_cambios, crear_usuario, crear_vaca
+
+
+class SincronizacionTests(TestCase):
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.finca = Finca.objects.create(nombre='Norte')
+        cls.usuario = crear_usuario('norte', cls.finca)
+        cls.vacas = [crear_vaca(cls.finca, nombre=f'Vaca {i}') for i in range(3)]
+
+    def setUp(self):
+        confirmar_cambios()
+        self.cliente = APIClient()
+        self.cliente.force_authenticate(self.usuario)
+
+    def listar(self, **params):
+        return self.cliente.get(reverse('vaca-list'), params)
+
+    def sincronizar(self, cursor, **params):
+        respuesta = self.listar(since=cursor, **params)
+        self.assertEqual(respuesta.status_code, 200)
+        return respuesta.json()
+
+    def nombres(self, datos):
+        return sorted(vaca['nombre'] for vaca in datos['vacas'])
+
+    def test_since_cero_devuelve_el_listado_completo_y_un_cursor(self):
+        datos = self.sincronizar(0)
+        self.assertEqual(self.nombres(datos), ['Vaca 0', 'Vaca 1', 'Vaca 2'])
+        self.assertEqual(datos['eliminadas'], [])
+        self.assertFalse(datos['mas'])
+        self.assertGreater(datos['cursor'], 0)
+
+    def test_sin_cambios_no_devuelve_nada(self):
+        cursor = self.sincronizar(0)['cursor']
+        datos = self.sincronizar(cursor)
+        self.assertEqual((datos['vacas'], datos['eliminadas'], datos['cursor']), ([], [], cursor))
+
+    def test_devuelve_solo_las_vacas_cambiadas(self):
+        cursor = self.sincronizar(0)['cursor']
+        vaca = self.vacas[1]
+        vaca.prediccion = 80.0
+        vaca.save()
+        confirmar_cambios()
+
+        datos = self.sincronizar(cursor)
+        self.assertEqual(self.nombres(datos), ['Vaca 1'])
+        self.assertEqual(datos['vacas'][0]['prediccion'], 80.0)
+        self.assertGreater(datos['cursor'], cursor)
+        self.assertEqual(self.sincronizar(datos['cursor'])['vacas'], [])
+
+    def test_eliminadas_incluye_borradas_y_las_que_dejan_el_filtro(self):
+        cursor = self.sincronizar(0, raza='HOL')['cursor']
+        borrada, cambiada = self.vacas[0], self.vacas[2]
+        borrada_id = borrada.pk
+        borrada.delete()
+        cambiada.raza = 'SIB'
+        cambiada.save()
+        confirmar_cambios()
+
+        datos = self.sincronizar(cursor, raza='HOL')
+        self.assertEqual(datos['vacas'], [])
+        self.assertEqual(datos['eliminadas'], sorted([borrada_id, cambiada.pk]))
+
+    def test_los_cambios_recientes_se_vuelven_a_enviar(self):
+        cursor = self.sincronizar(0)['cursor']
+        self.vacas[0].save()
+
+        # Dentro del margen de confirmación el cursor no pasa del cambio
+        primera = self.sincronizar(cursor)
+        self.assertEqual(self.nombres(primera), ['Vaca 0'])
+        self.assertEqual(primera['cursor'], cursor)
+        self.assertFalse(primera['mas'])
+        self.assertEqual(self.nombres(self.sincronizar(primera['cursor'])), ['Vaca 0'])
+
+        confirmar_cambios()
+        confirmado = self.sincronizar(cursor)
+        self.assertGreater(confirmado['cursor'], cursor)
+        self.assertEqual(self.sincronizar(confirmado['cursor'])['vacas'], [])
+
+    def test_el_listado_completo_no_adelanta_el_cursor_sobre_cambios_recientes(self):
+        self.vacas[2].save()
+        cursor = self.sincronizar(0)['cursor']
+        self.assertLessEqual(cursor, CambioVaca.objects.get(vaca_id=self.vacas[2].pk).pk)
+        self.assertEqual(self.nombres(self.sincronizar(cursor)), ['Vaca 2'])
+
+    def test_cambios_desde_pagina_con_mas(self):
+        for vaca in self.vacas:
+            vaca.save()
+        confirmar_cambios()
+        inicio = CambioVaca.objects.order_by('id').first().pk
+        ids, cursor, mas = cambios_desde(inicio, self.finca.pk, limite=2)
+        self.assertEqual((len(ids), mas), (2, True))
+        ids_resto, cursor_final, mas = cambios_desde(cursor, self.finca.pk, limite=2)
+        self.assertEqual((len(ids_resto), mas), (1, False))
+        self.assertEqual(ids | ids_resto, {vaca.pk for vaca in self.vacas})
+        self.assertEqual(cambios_desde(cursor_final, self.finca.pk, limite=2), (set(), cursor_final, False))
+
+    def test_since_invalido(self):
+        for valor in ('-1', 'abc'):
+            with self.subTest(since=valor):
+                self.assertEqual(self.listar(since=valor).status_code, 400)
+
+
+class EtagTests(TestCase):
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.finca = Finca.objects.create(nombre='Norte')
+        cls.usuario = crear_usuario('norte', cls.finca)
+        cls.vaca = crear_vaca(cls.finca, nombre='Vaca 0')
+
+    def setUp(self):
+        confirmar_cambios()
+        self.cliente = APIClient()
+        self.cliente.force_authenticate(self.usuario)
+
+    def test_listado_sin_cambios_responde_304(self):
+        url = reverse('vaca-list')
+        respuesta = self.cliente.get(url)
+        self.assertEqual(respuesta.status_code, 200)
+        self.assertEqual(self.cliente.get(url, HTTP_IF_NONE_MATCH=respuesta['ETag']).status_code, 304)
+
+    def test_el_etag_depende_de_los_parametros(self):
+        url = reverse('vaca-list')
+        self.assertNotEqual(self.cliente.get(url)['ETag'], self.cliente.get(url, {'raza': 'HOL'})['ETag'])
+
+    def test_un_cambio_invalida_el_etag_del_listado(self):
+        url = reverse('vaca-list')
+        etag = self.cliente.get(url)['ETag']
+        self.vaca.prediccion = 90.0
+        self.vaca.save()
+
+        respuesta = self.cliente.get(url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(respuesta.status_code, 200)
+        self.assertEqual(respuesta.json()[0]['prediccion'], 90.0)
+        # Al confirmarse el cambio el ETag cambia de nuevo (ver cambios.MARGEN_CONFIRMACION)
+        confirmar_cambios()
+        self.assertEqual(self.cliente.get(url, HTTP_IF_NONE_MATCH=respuesta['ETag']).status_code, 200)
+
+    def test_etag_del_detalle_sigue_a_la_vaca(self):
+        url = reverse('vaca-detail', args=[self.vaca.pk])
+        etag = self.cliente.get(url)['ETag']
+        self.assertEqual(self.cliente.get(url, HTTP_IF_NONE_MATCH=etag).status_code, 304)
+
+        # El cambio de otra vaca no invalida el detalle
+        crear_vaca(self.finca, nombre='Vaca 1')
+        self.assertEqual(self.cliente.get(url, HTTP_IF_NONE_MATCH=etag).status_code, 304)
+
+        self.vaca.save()
+        self.assertEqual(self.cliente.get(url, HTTP_IF_NONE_MATCH=etag).status_code, 200)
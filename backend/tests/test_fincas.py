@@ -0,0 +1,89 @@
+"""Cada usuario regular accede solo a las vacas (y sus cambios y alertas) de su finca."""
+from django.test import TestCase
+from django.urls import reverse
+from rest_framework.test import APIClient
+
+from backend.alertas import alertas_desde, crear_alertas
+from backend.models import Finca, TareaReevaluacion, Vaca
+from backend.tareas import encolar_reevaluacion
+
+from .utiles import confirmar_cambios, crear_usuario, crear_vaca
+
+
+class AislamientoFincasTests(TestCase):
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.norte = Finca.objects.create(nombre='Norte')
+        cls.sur = Finca.objects.create(nombre='Sur')
+        cls.usuario_norte = crear_usuario('norte', cls.norte)
+        cls.administrador = crear_usuario('admin', role='admin')
+        cls.vaca_norte = crear_vaca(cls.norte, nombre='Norteña', prediccion=95.0)
+        cls.vaca_sur = crear_vaca(cls.sur, nombre='Sureña', prediccion=95.0)
+
+    def cliente(self, usuario):
+        cliente = APIClient()
+        cliente.force_authenticate(usuario)
+        return cliente
+
+    def nombres(self, vacas):
+        return sorted(vaca['nombre'] for vaca in vacas)
+
+    def test_listado_solo_de_la_finca(self):
+        cliente = self.cliente(self.usuario_norte)
+        self.assertEqual(self.nombres(cliente.get(reverse('vaca-list')).json()), ['Norteña'])
+        self.assertEqual(self.nombres(cliente.get(reverse('vaca-list'), {'since': 0}).json()['vacas']), ['Norteña'])
+        # Pedir otra finca no amplía lo que ve el usuario
+        self.assertEqual(cliente.get(reverse('vaca-list'), {'finca': self.sur.pk}).json(), [])
+
+    def test_vacas_de_otra_finca_no_existen_para_el_usuario(self):
+        cliente = self.cliente(self.usuario_norte)
+        url = reverse('vaca-detail', args=[self.vaca_sur.pk])
+        self.assertEqual(cliente.get(url).status_code, 404)
+        self.assertEqual(cliente.patch(url, {'nombre': 'Robada'}, format='json').status_code, 404)
+        self.assertEqual(cliente.delete(url).status_code, 404)
+        self.vaca_sur.refresh_from_db()
+        self.assertEqual(self.vaca_sur.nombre, 'Sureña')
+
+    def test_alta_en_la_finca_del_usuario(self):
+        datos = {
+            'nombre': 'Nueva', 'actividad': 100, 'temperatura': 38.4, 'dias_posparto': 30, 'condicion': 3.0,
+            'raza': 'HOL', 'parto_asistido': False, 'prediccion': 0.0, 'finca': self.sur.pk,
+        }
+        respuesta = self.cliente(self.usuario_norte).post(reverse('vaca-list'), datos, format='json')
+        self.assertEqual(respuesta.status_code, 201)
+        self.assertEqual(Vaca.objects.get(pk=respuesta.json()['id']).finca_id, self.norte.pk)
+
+    def test_resumen_solo_de_la_finca(self):
+        self.assertEqual(self.cliente(self.usuario_norte).get(reverse('vaca-resumen')).json()['total'], 1)
+        self.assertEqual(self.cliente(self.administrador).get(reverse('vaca-resumen')).json()['total'], 2)
+
+    def test_usuario_sin_finca_no_accede(self):
+        sin_finca = crear_usuario('sin-finca')
+        self.assertEqual(self.cliente(sin_finca).get(reverse('vaca-list')).status_code, 403)
+
+    def test_administrador_ve_todas_y_puede_filtrar_por_finca(self):
+        cliente = self.cliente(self.administrador)
+        self.assertEqual(self.nombres(cliente.get(reverse('vaca-list')).json()), ['Norteña', 'Sureña'])
+        self.assertEqual(self.nombres(cliente.get(reverse('vaca-list'), {'finca': self.sur.pk}).json()), ['Sureña'])
+
+    def test_cambios_de_otra_finca_no_llegan(self):
+        cliente = self.cliente(self.usuario_norte)
+        confirmar_cambios()
+        cursor = cliente.get(reverse('vaca-list'), {'since': 0}).json()['cursor']
+        self.vaca_sur.prediccion = 10.0
+        self.vaca_sur.save()
+        crear_vaca(self.sur, nombre='Otra sureña')
+
+        datos = cliente.get(reverse('vaca-list'), {'since': cursor}).json()
+        self.assertEqual((datos['vacas'], datos['eliminadas']), ([], []))
+
+    def test_alertas_solo_de_la_finca(self):
+        crear_alertas([self.vaca_norte, self.vaca_sur])
+        alertas, _ = alertas_desde(0, finca_id=self.norte.pk)
+        self.assertEqual([alerta['vaca']['nombre'] for alerta in alertas], ['Norteña'])
+
+    def test_reevaluacion_limitada_a_la_finca(self):
+        tarea = encolar_reevaluacion({'finca': str(self.sur.pk)}, usuario=self.usuario_norte)
+        self.assertEqual(TareaReevaluacion.objects.get(pk=tarea.pk).filtros['finca'], str(self.norte.pk))
+        self.assertEqual(tarea.total, 1)
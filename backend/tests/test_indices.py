@@ -0,0 +1,48 @@
+"""Las consultas frecuentes sobre Vaca se resuelven con sus índices."""
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from rest_framework.test import APIClient
+
+from backend.management.commands.verificar_indices import consultas_frecuentes
+from backend.models import Finca
+
+from .utiles import crear_usuario, crear_vaca
+
+
+class IndicesVacaTests(TestCase):
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.finca = Finca.objects.create(nombre='Norte')
+        otra = Finca.objects.create(nombre='Sur')
+        for i in range(20):
+            crear_vaca(cls.finca if i % 2 else otra, nombre=f'Vaca {i}')
+
+    def setUp(self):
+        if connection.vendor not in ('sqlite', 'postgresql'):
+            self.skipTest(f'Plan de consultas no soportado en {connection.vendor}')
+        if connection.vendor == 'postgresql':
+            # Con pocas filas el planificador prefiere recorrer la tabla; aquí interesa si el índice es utilizable
+            with connection.cursor() as cursor:
+                cursor.execute('SET LOCAL enable_seqscan = off')
+
+    def test_consultas_frecuentes_usan_su_indice(self):
+        for nombre, queryset, indice in consultas_frecuentes(self.finca.pk):
+            with self.subTest(nombre):
+                self.assertIn(indice, queryset.explain())
+
+    def test_listado_paginado_de_la_finca_usa_su_indice(self):
+        # El plan de la consulta que envía la vista, no el de una copia armada aquí
+        cliente = APIClient()
+        cliente.force_authenticate(crear_usuario('norte', self.finca))
+        with CaptureQueriesContext(connection) as consultas:
+            respuesta = cliente.get(reverse('vaca-list'), {'page_size': 5})
+        self.assertEqual(respuesta.status_code, 200)
+        sql = next(c['sql'] for c in consultas.captured_queries if 'FROM "backend_vaca"' in c['sql'])
+        explicar = 'EXPLAIN QUERY PLAN ' if connection.vendor == 'sqlite' else 'EXPLAIN '
+        with connection.cursor() as cursor:
+            cursor.execute(explicar + sql)
+            plan = str(cursor.fetchall())
+        self.assertIn('vaca_finca_fecha_idx', plan)
@@ -0,0 +1,25 @@
+"""Datos comunes de las pruebas del backend."""
+from datetime import timedelta
+
+from django.utils.timezone import now
+
+from backend.cambios import MARGEN_CONFIRMACION
+from backend.models import CambioVaca, CustomUser, Vaca
+
+
+def crear_usuario(nombre, finca=None, role='user'):
+    return CustomUser.objects.create_user(username=nombre, password='clave-de-prueba', role=role, finca=finca)
+
+
+def crear_vaca(finca, nombre='Vaca', **campos):
+    """Vaca de ``finca`` con valores de lectura válidos; ``campos`` reemplaza los que se indiquen."""
+    valores = {
+        'actividad': 120, 'temperatura': 38.5, 'dias_posparto': 40, 'condicion': 3.0, 'raza': 'HOL',
+        'parto_asistido': False, 'prediccion': 10.0, **campos,
+    }
+    return Vaca.objects.create(finca=finca, nombre=nombre, **valores)
+
+
+def confirmar_cambios():
+    """Simula que transcurrió el margen de confirmación de todos los cambios registrados."""
+    CambioVaca.objects.update(registrado=now() - MARGEN_CONFIRMACION - timedelta(seconds=1))
@@ -0,0 +1,81 @@
+"""Transiciones de estado reproductivo aplicadas a muchas vacas a la vez.
+
+Cada transición define desde qué estados es válida y qué campos cambia. Se
+aplica con un solo ``UPDATE ... WHERE id IN (...)`` que además repite la
+condición de origen, así que una vaca que cambió de estado entre la lectura
+de la página y la petición no se actualiza. Si alguna vaca no puede pasar al
+nuevo estado no se modifica ninguna, y se informa el motivo de cada rechazo.
+"""
+from collections import namedtuple
+
+from django.db import transaction
+from django.db.models import Q
+from django.utils import timezone
+
+from .cambios import registrar_cambios
+from .models import ESTADOS_VACA, Vaca
+from .resumen import invalidar_resumen
+
+# ``origen``: condición que debe cumplir la vaca; ``cambios(ahora)``: campos a escribir
+Transicion = namedtuple('Transicion', ['origen', 'motivo', 'cambios'])
+
+TRANSICIONES = {
+    # También sirve para volver a inseminar una vaca sin gestación confirmada
+    'inseminar': Transicion(
+        origen=Q(gestante=False),
+        motivo='ya está gestante',
+        cambios=lambda ahora: {'inseminada': True, 'fecha_inseminacion': ahora},
+    ),
+    'confirmar_gestacion': Transicion(
+        origen=ESTADOS_VACA['inseminada'],
+        motivo='no está inseminada pendiente de diagnóstico',
+        cambios=lambda ahora: {'gestante': True, 'fecha_gestacion': ahora},
+    ),
+    # Vaca vacía: se descartan inseminación y gestación
+    'reiniciar': Transicion(
+        origen=Q(inseminada=True) | Q(gestante=True),
+        motivo='no está inseminada ni gestante',
+        cambios=lambda ahora: {
+            'inseminada': False, 'fecha_inseminacion': None, 'gestante': False, 'fecha_gestacion': None,
+        },
+    ),
+}
+
+
+class TransicionInvalida(Exception):
+    def __init__(self, rechazadas):
+        super().__init__(f'{len(rechazadas)} vacas no admiten la transición')
+        # {id: motivo}
+        self.rechazadas = rechazadas
+
+
+def aplicar_transicion(nombre, ids, queryset=None):
+    """Aplica la transición ``nombre`` a las vacas ``ids`` en una transacción.
+
+    ``queryset`` limita las vacas visibles (por defecto, todas). Devuelve los
+    campos escritos; lanza ``TransicionInvalida`` sin modificar nada si
+    alguna vaca no existe o no está en un estado de origen válido.
+    """
+    transicion = TRANSICIONES[nombre]
+    ids = set(ids)
+    vacas = Vaca.objects.all() if queryset is None else queryset
+    cambios = transicion.cambios(timezone.now())
+
+    with transaction.atomic():
+        actualizadas = vacas.filter(transicion.origen, pk__in=ids).update(**cambios)
+        if actualizadas != len(ids):
+            transaction.set_rollback(True)
+        else:
+            registrar_cambios(vacas.filter(pk__in=ids).only('id', 'finca'))
+
+    if actualizadas != len(ids):
+        # Solo en el caso de error se consulta el estado de cada vaca para explicar el rechazo
+        validas = set(vacas.filter(transicion.origen, pk__in=ids).values_list('pk', flat=True))
+        existentes = set(vacas.filter(pk__in=ids).values_list('pk', flat=True))
+        raise TransicionInvalida({
+            pk: 'no existe' if pk not in existentes else transicion.motivo
+            for pk in sorted(ids - validas)
+        })
+    # update() no emite post_save: el cambio se registró dentro de la transacción
+    invalidar_resumen()
+    return cambios
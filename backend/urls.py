@@ -1,19 +1,30 @@
-from django.urls import path, include
-from rest_framework.routers import DefaultRouter
-from .views import VacaViewSet, PrediccionCeloAPIView
-from .views import CustomTokenObtainPairView
-from .views import RegisterView, UserListView, UserDetailView
-from .views import CurrentUserView
-
-router = DefaultRouter()
-router.register(r'vacas', VacaViewSet)
-
-urlpatterns = [
-   path('', include(router.urls)),
-   path('predecir/', PrediccionCeloAPIView.as_view(), name='predecir-celo'),
-   path('login/', CustomTokenObtainPairView.as_view(), name='token_obtain_pair'),
-    path('register/', RegisterView.as_view(), name='register'),
-    path('users/', UserListView.as_view(), name='user-list'),
-    path('users/<int:pk>/', UserDetailView.as_view(), name='user-detail'),
-    path('auth/user/', CurrentUserView.as_view(), name='current-user'),
-]
+from django.urls import path, include
+from rest_framework.routers import DefaultRouter
+from .views import VacaViewSet, PrediccionCeloAPIView, PrediccionLoteAPIView, ModeloEstadoAPIView
+from .views import TareaReevaluacionViewSet
+from .views import CustomTokenObtainPairView
+from .views import RegisterView, UserListView, UserDetailView
+from .views import CurrentUserView, ReporteAPIView, metricas
+from . import vistas_async
+
+router = DefaultRouter()
+router.register(r'vacas', VacaViewSet)
+router.register(r'reevaluaciones', TareaReevaluacionViewSet)
+
+urlpatterns = [
+   path('', include(router.urls)),
+   path('predecir/', PrediccionCeloAPIView.as_view(), name='predecir-celo'),
+   path('predecir/lote/', PrediccionLoteAPIView.as_view(), name='predecir-celo-lote'),
+   path('predecir/async/', vistas_async.predecir, name='predecir-celo-async'),
+   path('vacas/<int:pk>/reevaluar/async/', vistas_async.reevaluar, name='vaca-reevaluar-async'),
+   path('alertas/', vistas_async.alertas, name='alertas'),
+   path('alertas/eventos/', vistas_async.eventos_alertas, name='alertas-eventos'),
+   path('modelo/estado/', ModeloEstadoAPIView.as_view(), name='modelo-estado'),
+   path('reportes/<str:tipo>/', ReporteAPIView.as_view(), name='reporte'),
+   path('login/', CustomTokenObtainPairView.as_view(), name='token_obtain_pair'),
+    path('register/', RegisterView.as_view(), name='register'),
+    path('users/', UserListView.as_view(), name='user-list'),
+    path('users/<int:pk>/', UserDetailView.as_view(), name='user-detail'),
+    path('auth/user/', CurrentUserView.as_view(), name='current-user'),
+    path('metrics', metricas, name='metricas'),
+]
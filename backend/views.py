@@ -1,168 +1,512 @@
-from django.utils.timezone import now
-from rest_framework.views import APIView
-from rest_framework.response import Response
-from rest_framework import status, generics, viewsets
-from rest_framework.decorators import action
-from rest_framework.permissions import IsAuthenticated
-from rest_framework_simplejwt.views import TokenObtainPairView
-import joblib
-import os
-import json
-import numpy as np
-
-from .models import Vaca, CustomUser
-from .serializers import VacaSerializer, UserSerializer, RegisterSerializer, CustomTokenObtainPairSerializer
-from .permissions import IsRoleAdmin
-
-
-class VacaViewSet(viewsets.ModelViewSet):
-    queryset = Vaca.objects.all().order_by('-fecha')
-    serializer_class = VacaSerializer
-
-    @action(detail=True, methods=['put'], permission_classes=[IsAuthenticated])
-    def actualizar_estado(self, request, pk=None):
-        vaca = self.get_object()
-        data = request.data
-
-        inseminada = data.get('inseminada')
-        gestante = data.get('gestante')
-
-        if inseminada is not None:
-            vaca.inseminada = inseminada
-            if inseminada and not vaca.fecha_inseminacion:
-                vaca.fecha_inseminacion = now()
-            elif not inseminada:
-                vaca.fecha_inseminacion = None
-
-        if gestante is not None:
-            vaca.gestante = gestante
-            if gestante and not vaca.fecha_gestacion:
-                vaca.fecha_gestacion = now()
-            elif not gestante:
-                vaca.fecha_gestacion = None
-
-        vaca.save()
-        serializer = self.get_serializer(vaca)
-        return Response(serializer.data, status=status.HTTP_200_OK)
-    @action(detail=True, methods=['put'], permission_classes=[IsAuthenticated])
-    def reevaluar(self, request, pk=None):
-        vaca = self.get_object()
-        serializer = self.get_serializer(vaca, data=request.data, partial=True)
-        serializer.is_valid(raise_exception=True)
-        serializer.save()
-
-        # Cargar modelo y columnas para predicción
-        modelo_path = os.path.join(os.path.dirname(__file__), 'modelo_celo_posparto_rf.pkl')
-        columnas_path = os.path.join(os.path.dirname(__file__), 'columnas_rf.json')
-        modelo = joblib.load(modelo_path)
-        with open(columnas_path, 'r') as f:
-            columnas = json.load(f)
-
-        # Preparar datos para predicción (one-hot encoding de raza)
-        datos_input = {
-            'actividad': vaca.actividad,
-            'temperatura': vaca.temperatura,
-            'dias_posparto': vaca.dias_posparto,
-            'condicion': vaca.condicion,
-            'parto_asistido': int(vaca.parto_asistido),
-        }
-        for code, raza_nombre in Vaca.RAZAS:
-            datos_input[f'raza_{raza_nombre}'] = 1 if vaca.raza == code else 0
-
-        X = np.array([[datos_input.get(col, 0) for col in columnas]])
-
-        # Calcular nueva predicción
-        probabilidad = modelo.predict_proba(X)[0][1] * 100
-        probabilidad = min(probabilidad, 96.0)
-
-        # Actualizar predicción y fecha
-        vaca.prediccion = probabilidad
-        vaca.fecha = now()
-        vaca.save()
-
-        return Response(self.get_serializer(vaca).data, status=status.HTTP_200_OK)
-
-class PrediccionCeloAPIView(APIView):
-    permission_classes = [IsAuthenticated]
-
-    def post(self, request):
-        datos = request.data
-        try:
-            nombre = datos['nombre']
-            actividad = int(datos['actividad'])
-            temperatura = float(datos['temperatura'])
-            dias_posparto = int(datos['dias_posparto'])
-            condicion = float(datos['condicion'])
-            raza = datos['raza']  # Debe ser uno de los códigos de RAZAS
-            parto_asistido = bool(int(datos.get('parto_asistido', 0)))  # 0 o 1
-
-            # Carga el modelo y las columnas usadas en el entrenamiento
-            modelo_path = os.path.join(os.path.dirname(__file__), 'modelo_celo_posparto_rf.pkl')
-            columnas_path = os.path.join(os.path.dirname(__file__), 'columnas_rf.json')
-            modelo = joblib.load(modelo_path)
-            with open(columnas_path, 'r') as f:
-                columnas = json.load(f)
-
-            # One-hot encoding de la raza
-            datos_input = {
-                'actividad': actividad,
-                'temperatura': temperatura,
-                'dias_posparto': dias_posparto,
-                'condicion': condicion,
-                'parto_asistido': int(parto_asistido),
-            }
-            for code, raza_nombre in Vaca.RAZAS:
-                datos_input[f'raza_{raza_nombre}'] = 1 if raza == code else 0
-
-            # Ordena los datos según las columnas del modelo
-            X = np.array([[datos_input.get(col, 0) for col in columnas]])
-
-            # Realiza la predicción
-            probabilidad = modelo.predict_proba(X)[0][1] * 100
-            probabilidad = min(probabilidad, 96.0)
-
-            # Guarda el registro en la base de datos
-            vaca = Vaca.objects.create(
-                nombre=nombre,
-                actividad=actividad,
-                temperatura=temperatura,
-                dias_posparto=dias_posparto,
-                condicion=condicion,
-                raza=raza,
-                parto_asistido=parto_asistido,
-                prediccion=probabilidad
-            )
-            serializer = VacaSerializer(vaca)
-            return Response({'prediccion': probabilidad, 'registro': serializer.data}, status=status.HTTP_201_CREATED)
-
-        except Exception as e:
-            return Response({'error': str(e)}, status=status.HTTP_400_BAD_REQUEST)
-
-
-class RegisterView(generics.CreateAPIView):
-    permission_classes = [IsRoleAdmin]
-    serializer_class = RegisterSerializer
-
-
-class UserListView(generics.ListCreateAPIView):
-    permission_classes = [IsRoleAdmin]
-    queryset = CustomUser.objects.all()
-    serializer_class = UserSerializer
-
-
-class UserDetailView(generics.RetrieveUpdateDestroyAPIView):
-    permission_classes = [IsRoleAdmin]
-    queryset = CustomUser.objects.all()
-    serializer_class = UserSerializer
-
-
-class CustomTokenObtainPairView(TokenObtainPairView):
-    serializer_class = CustomTokenObtainPairSerializer
-
-
-class CurrentUserView(APIView):
-    permission_classes = [IsAuthenticated]
-
-    def get(self, request):
-        serializer = UserSerializer(request.user)
-        return Response(serializer.data)
+import csv
+import hashlib
+import io
+
+from django.conf import settings
+from django.db import transaction
+from django.db.models import F
+from django.http import HttpResponse, StreamingHttpResponse
+from django.shortcuts import get_object_or_404
+from django.utils.cache import get_conditional_response, patch_vary_headers
+from django.utils.timezone import now
+from rest_framework.views import APIView
+from rest_framework.response import Response
+from rest_framework import status, generics, viewsets, mixins
+from rest_framework.decorators import action
+from rest_framework.exceptions import ValidationError
+from rest_framework.permissions import IsAuthenticated
+from rest_framework_simplejwt.views import TokenObtainPairView
+
+from .models import Vaca, Lectura, CustomUser, TareaReevaluacion, RANGOS_LECTURA
+from .serializers import VacaSerializer, UserSerializer, RegisterSerializer, CustomTokenObtainPairSerializer
+from .serializers import EntradaPrediccionSerializer, LecturaSerializer, TareaReevaluacionSerializer
+from .serializers import TransicionSerializer, VacaListaSerializer
+from .permissions import IsRoleAdmin
+from .filters import VacaFilterBackend, filtrar_por_fecha, filtrar_vacas
+from .pagination import VacaCursorPagination, LecturaCursorPagination, UsuarioCursorPagination
+from .prediccion import datos_de_vaca, predecir_probabilidades, cache_predicciones, LOTE_MAXIMO_BOSQUE
+from .registro_modelo import obtener_modelo
+from .resumen import obtener_resumen, invalidar_resumen
+from .cambios import cambios_desde, cursor_actual, cursor_confirmado, registrar_cambios, version_vaca
+from .fincas import AccesoFinca, finca_de, finca_para_alta, vacas_visibles
+from .importacion import ErrorImportacion, formato_de, importar_lecturas, leer_bloques
+from .tareas import encolar_reevaluacion
+from .transiciones import TransicionInvalida, aplicar_transicion
+from .reportes import FORMATOS, REPORTES, exportar
+from .lecturas import guardar_lectura, registrar_lecturas
+from .estadisticas import caracteristicas_relativas, estadistica_de
+from .metricas import medir, vista_actual, registro as registro_metricas
+
+
+def _etag(*partes):
+    return '"%s"' % hashlib.md5('|'.join(map(str, partes)).encode()).hexdigest()
+
+
+def _con_etag(respuesta, etag):
+    respuesta['ETag'] = etag
+    # El navegador revalida siempre con If-None-Match; la respuesta depende del usuario
+    respuesta['Cache-Control'] = 'private, no-cache'
+    patch_vary_headers(respuesta, ['Authorization'])
+    return respuesta
+
+
+class VacaViewSet(viewsets.ModelViewSet):
+    """Vacas de las fincas visibles para el usuario (ver ``fincas.py``) en todas las acciones."""
+    queryset = Vaca.objects.all().order_by('-fecha')
+    serializer_class = VacaSerializer
+    permission_classes = [IsAuthenticated, AccesoFinca]
+    filter_backends = [VacaFilterBackend]
+    pagination_class = VacaCursorPagination
+
+    def _campos_solicitados(self):
+        campos = self.request.query_params.get('fields')
+        if not campos or self.action not in ('list', 'retrieve'):
+            return None
+        return [campo.strip() for campo in campos.split(',') if campo.strip()]
+
+    def get_queryset(self):
+        queryset = vacas_visibles(self.request.user, super().get_queryset())
+        campos = self._campos_solicitados()
+        if campos:
+            # Solo se leen de la base de datos las columnas pedidas
+            columnas = {f.name for f in Vaca._meta.concrete_fields}
+            queryset = queryset.only(*(set(campos) & columnas))
+        return queryset
+
+    def get_serializer(self, *args, **kwargs):
+        campos = self._campos_solicitados()
+        if campos:
+            kwargs['fields'] = campos
+        return super().get_serializer(*args, **kwargs)
+
+    def list(self, request, *args, **kwargs):
+        """Listado completo, paginado o, con ``?since=<cursor>``, solo lo que cambió.
+
+        El ETag es el último cambio registrado (y el último confirmado, ver
+        ``cambios.py``) junto con los parámetros: si no hubo cambios se
+        responde 304 sin consultar ni serializar las vacas.
+        """
+        # El cursor se lee antes que las vacas: un cambio concurrente se vuelve a enviar, no se pierde
+        finca = finca_de(request.user)
+        ultimo = cursor_confirmado(finca)
+        etag = _etag('vacas', finca, cursor_actual(finca), ultimo, request.get_full_path())
+        no_modificado = get_conditional_response(request, etag=etag)
+        if no_modificado is not None:
+            return no_modificado
+
+        # Los listados pueden tener miles de filas: values() y VacaListaSerializer
+        # en lugar de instancias de Vaca y ModelSerializer
+        serializador = VacaListaSerializer(self._campos_solicitados())
+        queryset = self.filter_queryset(self.get_queryset())
+        if 'since' in request.query_params:
+            return _con_etag(self._cambios(serializador, queryset, finca, ultimo), etag)
+        queryset = queryset.values(*serializador.columnas)
+        pagina = self.paginate_queryset(queryset)
+        if pagina is not None:
+            return _con_etag(self.get_paginated_response(serializador.serializar(pagina)), etag)
+        return _con_etag(Response(serializador.serializar(queryset)), etag)
+
+    def _cambios(self, serializador, queryset, finca, ultimo):
+        """Sincronización incremental: vacas cambiadas desde ``since`` y las que hay que quitar.
+
+        ``since=0`` devuelve todas las vacas del listado. ``eliminadas`` incluye
+        las vacas borradas y las que dejaron de cumplir los filtros; con
+        ``mas`` el cliente repite la petición con el nuevo ``cursor``.
+        """
+        try:
+            desde = int(self.request.query_params['since'])
+        except ValueError:
+            desde = -1
+        if desde < 0:
+            raise ValidationError({'since': 'Debe ser un cursor devuelto por el servidor (0 para empezar).'})
+        if desde == 0:
+            vacas = serializador.serializar(queryset.values(*serializador.columnas))
+            return Response({'cursor': ultimo + 1, 'mas': False, 'vacas': vacas, 'eliminadas': []})
+
+        ids, cursor, mas = cambios_desde(desde, finca)
+        vacas = serializador.serializar(queryset.filter(id__in=ids).values(*serializador.columnas)) if ids else []
+        eliminadas = sorted(ids - {vaca['id'] for vaca in vacas})
+        return Response({'cursor': cursor, 'mas': mas, 'vacas': vacas, 'eliminadas': eliminadas})
+
+    def perform_create(self, serializer):
+        serializer.save(finca_id=finca_para_alta(self.request.user, self.request.data.get('finca')))
+
+    def retrieve(self, request, *args, **kwargs):
+        vaca = self.get_object()
+        etag = _etag('vaca', vaca.pk, version_vaca(vaca.pk), request.query_params.get('fields', ''))
+        no_modificado = get_conditional_response(request, etag=etag)
+        if no_modificado is not None:
+            return no_modificado
+        return _con_etag(Response(self.get_serializer(vaca).data), etag)
+
+    @action(detail=False, methods=['get'], permission_classes=[IsAuthenticated, AccesoFinca])
+    def resumen(self, request):
+        return Response(obtener_resumen(request.user, self.get_queryset()), status=status.HTTP_200_OK)
+
+    @action(detail=False, methods=['post'], permission_classes=[IsAuthenticated, AccesoFinca])
+    def importar(self, request):
+        """Importa un archivo CSV o Parquet de lecturas (campo ``archivo``) por bloques.
+
+        Cada fila se asigna a la vaca de la finca con su ``id`` o, sin él, con su ``nombre``; si no existe se crea.
+        La columna opcional ``fecha`` (ISO 8601) fecha cada lectura; sin ella se usa la de la importación.
+        """
+        archivo = request.FILES.get('archivo')
+        if archivo is None:
+            return Response({'error': 'Adjunte el archivo en el campo "archivo"'}, status=status.HTTP_400_BAD_REQUEST)
+        formato = request.data.get('formato') or formato_de(archivo.name)
+        finca = finca_para_alta(request.user, request.data.get('finca'))
+        try:
+            # Los archivos grandes quedan en un temporal de Django; se leen por bloques desde ahí
+            resultado = importar_lecturas(leer_bloques(archivo.file, formato), finca)
+        except ErrorImportacion as e:
+            return Response({'error': str(e)}, status=status.HTTP_400_BAD_REQUEST)
+        return Response(resultado, status=status.HTTP_201_CREATED)
+
+    @action(detail=True, methods=['get'], permission_classes=[IsAuthenticated, AccesoFinca])
+    def lecturas(self, request, pk=None):
+        """Historial de lecturas de la vaca, paginado por cursor (``?desde=`` / ``?hasta=``)."""
+        vaca = self.get_object()
+        lecturas = filtrar_por_fecha(Lectura.objects.filter(vaca=vaca), request.query_params)
+        paginador = LecturaCursorPagination()
+        pagina = paginador.paginate_queryset(lecturas, request, view=self)
+        return paginador.get_paginated_response(LecturaSerializer(pagina, many=True).data)
+
+    @action(detail=False, methods=['post'], permission_classes=[IsAuthenticated, AccesoFinca])
+    def transicion(self, request):
+        """Cambia el estado reproductivo de varias vacas: ``{"transicion": ..., "ids": [...]}``.
+
+        Todo o nada: si alguna vaca no admite la transición no se modifica
+        ninguna y la respuesta lista los motivos en ``rechazadas``.
+        """
+        entrada = TransicionSerializer(data=request.data)
+        entrada.is_valid(raise_exception=True)
+        nombre, ids = entrada.validated_data['transicion'], entrada.validated_data['ids']
+        try:
+            cambios = aplicar_transicion(nombre, ids, self.get_queryset())
+        except TransicionInvalida as e:
+            return Response({'error': str(e), 'rechazadas': e.rechazadas}, status=status.HTTP_409_CONFLICT)
+        return Response(
+            {'transicion': nombre, 'actualizadas': len(set(ids)), 'ids': sorted(set(ids)), 'cambios': cambios},
+            status=status.HTTP_200_OK,
+        )
+
+    @action(detail=True, methods=['put'], permission_classes=[IsAuthenticated, AccesoFinca])
+    def actualizar_estado(self, request, pk=None):
+        vaca = self.get_object()
+        data = request.data
+
+        inseminada = data.get('inseminada')
+        gestante = data.get('gestante')
+        # Solo se escriben los campos de estado, no la fila completa
+        campos = []
+
+        if inseminada is not None:
+            vaca.inseminada = inseminada
+            campos.append('inseminada')
+            if inseminada and not vaca.fecha_inseminacion:
+                vaca.fecha_inseminacion = now()
+                campos.append('fecha_inseminacion')
+            elif not inseminada:
+                vaca.fecha_inseminacion = None
+                campos.append('fecha_inseminacion')
+
+        if gestante is not None:
+            vaca.gestante = gestante
+            campos.append('gestante')
+            if gestante and not vaca.fecha_gestacion:
+                vaca.fecha_gestacion = now()
+                campos.append('fecha_gestacion')
+            elif not gestante:
+                vaca.fecha_gestacion = None
+                campos.append('fecha_gestacion')
+
+        if campos:
+            vaca.save(update_fields=campos)
+        serializer = self.get_serializer(vaca)
+        return Response(serializer.data, status=status.HTTP_200_OK)
+    @action(detail=True, methods=['put'], permission_classes=[IsAuthenticated, AccesoFinca])
+    @vista_actual('reevaluar')
+    def reevaluar(self, request, pk=None):
+        vaca = self.get_object()
+        serializer = self.get_serializer(vaca, data=request.data, partial=True)
+        serializer.is_valid(raise_exception=True)
+
+        with transaction.atomic():
+            # Calcular nueva predicción con el modelo cargado en el proceso
+            registro = entrada_reevaluacion(vaca, serializer)
+            probabilidad = float(predecir_probabilidades([registro])[0])
+            datos = guardar_reevaluacion(vaca, serializer, probabilidad)
+        return Response(datos, status=status.HTTP_200_OK)
+
+def entrada_reevaluacion(vaca, serializer):
+    """Registro del modelo con los datos de ``vaca`` tras aplicar los cambios ya validados."""
+    datos = datos_de_vaca(vaca)
+    datos.update((campo, valor) for campo, valor in serializer.validated_data.items() if campo in datos)
+    with medir('linea_base'):
+        relativas = caracteristicas_relativas(estadistica_de(vaca), datos['actividad'], datos['temperatura'])
+    return {**datos, **relativas}
+
+
+def guardar_reevaluacion(vaca, serializer, probabilidad):
+    """Guarda los cambios y la nueva predicción; devuelve la vaca serializada."""
+    # La vaca guarda el estado actual; la lectura queda en el historial
+    with medir('base_de_datos'), transaction.atomic():
+        serializer.save()
+        vaca.prediccion = probabilidad
+        vaca.fecha = now()
+        vaca.save(update_fields=['prediccion', 'fecha'])
+        guardar_lectura(vaca, obtener_modelo().version, vaca.fecha)
+    with medir('serializacion'):
+        return VacaSerializer(vaca).data
+
+
+def lectura_de_peticion(datos, usuario):
+    """``(vaca, datos)``: con ``vaca`` (id) sus valores completan los campos no enviados.
+
+    La vaca debe ser de una finca visible para ``usuario``; sin ella se
+    comprueba que pueda registrar vacas nuevas.
+    """
+    if datos.get('vaca') in (None, ''):
+        return None, {**datos, 'finca': finca_para_alta(usuario, datos.get('finca'))}
+    vaca = get_object_or_404(vacas_visibles(usuario), pk=datos['vaca'])
+    return vaca, {**datos_de_vaca(vaca), 'nombre': vaca.nombre, **datos}
+
+
+def entrada_prediccion(vaca, datos):
+    """``(registro para el modelo, valores de Vaca)`` de una lectura; lanza si falta o sobra algo."""
+    actividad = int(datos['actividad'])
+    temperatura = float(datos['temperatura'])
+    valores = dict(
+        nombre=datos['nombre'],
+        actividad=actividad,
+        temperatura=temperatura,
+        dias_posparto=int(datos['dias_posparto']),
+        condicion=float(datos['condicion']),
+        raza=datos['raza'],  # Debe ser uno de los códigos de RAZAS
+        parto_asistido=bool(int(datos.get('parto_asistido', 0))),  # 0 o 1
+    )
+    for campo, (minimo, maximo) in RANGOS_LECTURA.items():
+        if valores[campo] < minimo or (maximo is not None and valores[campo] > maximo):
+            limite = f'mayor o igual que {minimo}' if maximo is None else f'entre {minimo} y {maximo}'
+            raise ValueError(f'{campo} debe ser {limite}')
+    if vaca is None:
+        # Vaca nueva: ``lectura_de_peticion`` ya resolvió su finca
+        valores['finca_id'] = datos['finca']
+    # Lectura comparada con la línea base de la vaca si ya tiene historial
+    with medir('linea_base'):
+        relativas = caracteristicas_relativas(estadistica_de(vaca), actividad, temperatura)
+    registro = {campo: valor for campo, valor in valores.items() if campo not in ('nombre', 'finca_id')}
+    return {**registro, **relativas}, valores
+
+
+def guardar_prediccion(vaca, valores, probabilidad):
+    """Crea la vaca (o actualiza ``vaca``) con la predicción y la lectura; devuelve la vaca serializada."""
+    valores = {**valores, 'prediccion': probabilidad, 'fecha': now()}
+    with medir('base_de_datos'), transaction.atomic():
+        if vaca is None:
+            vaca = Vaca.objects.create(**valores)
+        else:
+            for campo, valor in valores.items():
+                setattr(vaca, campo, valor)
+            vaca.save()
+        guardar_lectura(vaca, obtener_modelo().version, vaca.fecha)
+    with medir('serializacion'):
+        return VacaSerializer(vaca).data
+
+
+class PrediccionCeloAPIView(APIView):
+    """Predice una lectura y la agrega al historial.
+
+    Con ``vaca`` (id) la lectura se asigna a esa vaca, cuyos datos completan
+    los campos que no se envíen; sin él se registra una vaca nueva.
+    """
+    permission_classes = [IsAuthenticated, AccesoFinca]
+
+    @vista_actual('predecir')
+    def post(self, request):
+        vaca, datos = lectura_de_peticion(request.data, request.user)
+        try:
+            registro, valores = entrada_prediccion(vaca, datos)
+            # Realiza la predicción (one-hot encoding de la raza incluido)
+            probabilidad = float(predecir_probabilidades([registro])[0])
+            # Guarda el registro en la base de datos
+            guardado = guardar_prediccion(vaca, valores, probabilidad)
+            return Response({'prediccion': probabilidad, 'registro': guardado}, status=status.HTTP_201_CREATED)
+
+        except Exception as e:
+            return Response({'error': str(e)}, status=status.HTTP_400_BAD_REQUEST)
+
+
+class PrediccionLoteAPIView(APIView):
+    """Predice y guarda un lote de vacas (lista JSON o archivo CSV en ``archivo``).
+
+    Las filas inválidas se reportan en ``errores`` sin detener el resto del lote.
+    """
+    permission_classes = [IsAuthenticated, AccesoFinca]
+
+    @vista_actual('predecir_lote')
+    def post(self, request):
+        archivo = request.FILES.get('archivo')
+        finca = request.query_params.get('finca')
+        if archivo is not None:
+            filas = list(csv.DictReader(io.TextIOWrapper(archivo.file, encoding='utf-8-sig')))
+            finca = request.data.get('finca', finca)
+        elif isinstance(request.data, dict):
+            filas = request.data.get('vacas')
+            finca = request.data.get('finca', finca)
+        else:
+            filas = request.data
+        finca = finca_para_alta(request.user, finca)
+
+        if not isinstance(filas, list) or not filas:
+            return Response({'error': 'Se esperaba una lista de vacas o un archivo CSV'},
+                            status=status.HTTP_400_BAD_REQUEST)
+
+        validos, errores = [], []
+        with medir('validacion'):
+            for numero, fila in enumerate(filas, start=1):
+                entrada = EntradaPrediccionSerializer(data=fila)
+                if entrada.is_valid():
+                    validos.append(entrada.validated_data)
+                else:
+                    errores.append({'fila': numero, 'errores': entrada.errors})
+
+        # Una sola llamada al modelo para todo el lote
+        probabilidades = predecir_probabilidades(validos)
+        with medir('base_de_datos'), transaction.atomic():
+            vacas = Vaca.objects.bulk_create(
+                [Vaca(**datos, finca_id=finca, prediccion=float(p)) for datos, p in zip(validos, probabilidades)],
+                batch_size=500,
+            )
+            registrar_lecturas(vacas, obtener_modelo().version)
+            registrar_cambios(vacas)
+        # bulk_create no emite post_save
+        invalidar_resumen()
+
+        with medir('serializacion'):
+            registros = VacaSerializer(vacas, many=True).data
+        return Response(
+            {
+                'creados': len(vacas),
+                'registros': registros,
+                'errores': errores,
+            },
+            status=status.HTTP_201_CREATED if vacas else status.HTTP_400_BAD_REQUEST,
+        )
+
+
+class TareaReevaluacionViewSet(mixins.CreateModelMixin, viewsets.ReadOnlyModelViewSet):
+    """Encola reevaluaciones del rebaño y consulta su avance.
+
+    ``POST`` con ``{"filtros": {...}}`` (mismos parámetros que el listado de
+    vacas) devuelve la tarea creada; la procesa ``manage.py procesar_tareas``.
+    """
+    permission_classes = [IsAuthenticated, AccesoFinca]
+    queryset = TareaReevaluacion.objects.all().order_by('-creada')
+    serializer_class = TareaReevaluacionSerializer
+
+    def get_queryset(self):
+        finca = finca_de(self.request.user)
+        queryset = super().get_queryset()
+        return queryset if finca is None else queryset.filter(creada_por__finca_id=finca)
+
+    def create(self, request, *args, **kwargs):
+        serializer = self.get_serializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        tarea = encolar_reevaluacion(serializer.validated_data.get('filtros'), request.user)
+        return Response(self.get_serializer(tarea).data, status=status.HTTP_202_ACCEPTED)
+
+
+class ModeloEstadoAPIView(APIView):
+    """Versión del modelo en uso y estadísticas de la caché de predicciones del proceso."""
+    permission_classes = [IsAuthenticated]
+
+    def get(self, request):
+        cargado = obtener_modelo()
+        return Response({
+            'version': cargado.version,
+            'columnas': cargado.columnas,
+            'bosque_compilado': cargado.bosque is not None,
+            'metadatos': cargado.metadatos,
+            'lote_maximo_bosque': LOTE_MAXIMO_BOSQUE,
+            'cache': cache_predicciones.estadisticas(),
+        })
+
+
+class ReporteAPIView(APIView):
+    """Descarga un reporte (``?formato=csv|xlsx|pdf``) generado fila a fila.
+
+    Los reportes de vacas admiten los mismos filtros que el listado.
+    """
+    permission_classes = [IsAuthenticated]
+
+    def get(self, request, tipo):
+        reporte = REPORTES.get(tipo)
+        if reporte is None:
+            return Response({'error': f'Reportes disponibles: {", ".join(REPORTES)}'}, status=status.HTTP_404_NOT_FOUND)
+        if reporte.solo_admin and not IsRoleAdmin().has_permission(request, self):
+            self.permission_denied(request)
+        formato = request.query_params.get('formato', 'csv')
+        if formato not in FORMATOS:
+            return Response({'formato': f'Valores posibles: {", ".join(FORMATOS)}.'}, status=status.HTTP_400_BAD_REQUEST)
+
+        queryset = reporte.consulta()
+        if reporte.vacas:
+            queryset = filtrar_vacas(vacas_visibles(request.user, queryset), request.query_params)
+        tipo_contenido, contenido = exportar(reporte, formato, queryset)
+        respuesta = StreamingHttpResponse(contenido, content_type=tipo_contenido)
+        respuesta['Content-Disposition'] = (
+            f'attachment; filename="reporte_{tipo}_{now().date().isoformat()}.{formato}"'
+        )
+        return respuesta
+
+
+def metricas(request):
+    """Métricas del proceso en formato de texto de Prometheus.
+
+    Sin ``METRICAS_TOKEN`` en settings el acceso es libre (como suele
+    consultarlas Prometheus); con él se exige ``Authorization: Bearer <token>``.
+    """
+    token = getattr(settings, 'METRICAS_TOKEN', None)
+    if token and request.headers.get('Authorization') != f'Bearer {token}':
+        return HttpResponse(status=401)
+    return HttpResponse(registro_metricas.exportar(), content_type='text/plain; version=0.0.4; charset=utf-8')
+
+
+class RegisterView(generics.CreateAPIView):
+    permission_classes = [IsRoleAdmin]
+    serializer_class = RegisterSerializer
+
+
+class UserListView(generics.ListCreateAPIView):
+    permission_classes = [IsRoleAdmin]
+    queryset = CustomUser.objects.all()
+    serializer_class = UserSerializer
+    pagination_class = UsuarioCursorPagination
+
+    def list(self, request, *args, **kwargs):
+        # Los campos de UserSerializer son columnas simples (y el nombre de la finca): values() da el mismo resultado
+        campos = UserSerializer.Meta.fields
+        queryset = self.filter_queryset(self.get_queryset()).values(
+            *(campo for campo in campos if campo != 'farm'), farm=F('finca__nombre'),
+        )
+        pagina = self.paginate_queryset(queryset)
+        return self.get_paginated_response([{campo: fila[campo] for campo in campos} for fila in pagina])
+
+
+class UserDetailView(generics.RetrieveUpdateDestroyAPIView):
+    permission_classes = [IsRoleAdmin]
+    queryset = CustomUser.objects.all()
+    serializer_class = UserSerializer
+
+
+class CustomTokenObtainPairView(TokenObtainPairView):
+    serializer_class = CustomTokenObtainPairSerializer
+
+
+class CurrentUserView(APIView):
+    permission_classes = [IsAuthenticated]
+
+    def get(self, request):
+        serializer = UserSerializer(request.user)
+        return Response(serializer.data)
@@ -0,0 +1,226 @@
+"""Versiones asíncronas (ASGI) de la predicción y la reevaluación.
+
+Mismo contrato que ``PrediccionCeloAPIView`` y ``VacaViewSet.reevaluar``,
+pero como vistas async de Django: las consultas van al hilo de base de
+datos con ``sync_to_async`` y la predicción pasa por el ``agrupador``, que
+junta las peticiones concurrentes en una sola llamada al modelo. Mientras
+una petición espera al modelo o a la base de datos, el worker atiende otras.
+
+DRF no ejecuta vistas async, así que la autenticación (JWT o sesión) y los
+errores se resuelven aquí. Bajo WSGI funcionan igual, pero cada petición
+tiene su propio bucle y no se agrupan.
+"""
+import asyncio
+import json
+
+from asgiref.sync import sync_to_async
+from django.http import Http404, JsonResponse, StreamingHttpResponse
+from django.views.decorators.csrf import csrf_exempt
+from django.views.decorators.http import require_http_methods
+from rest_framework import exceptions
+from rest_framework_simplejwt.authentication import JWTAuthentication
+
+from .agrupador import Saturado, agrupador
+from .fincas import AccesoFinca, finca_de, tiene_acceso, vacas_visibles
+from .alertas import OPCIONES as OPCIONES_ALERTAS, alertas_desde, ultimo_cursor, vigia
+from .metricas import vista_actual
+from .serializers import VacaSerializer
+from .views import entrada_prediccion, entrada_reevaluacion, guardar_prediccion, guardar_reevaluacion
+from .views import lectura_de_peticion
+
+
+async def _autenticar(request):
+    """Usuario del token JWT o de la sesión; None si la petición es anónima."""
+    try:
+        resultado = await sync_to_async(JWTAuthentication().authenticate)(request)
+    except exceptions.AuthenticationFailed:
+        return None
+    if resultado is not None:
+        return resultado[0]
+    # La sesión solo está disponible con AuthenticationMiddleware
+    if not hasattr(request, 'auser'):
+        return None
+    usuario = await request.auser()
+    return usuario if usuario.is_authenticated else None
+
+
+def _rechazo(usuario):
+    """Respuesta de error si ``usuario`` no puede acceder a las vacas; None si puede."""
+    if usuario is None:
+        return _error('Las credenciales de autenticación no se proveyeron.', 401)
+    if not tiene_acceso(usuario):
+        return _error(AccesoFinca.message, 403)
+    return None
+
+
+def _cuerpo_json(request):
+    try:
+        datos = json.loads(request.body or b'{}')
+    except ValueError:
+        raise exceptions.ParseError('JSON inválido')
+    if not isinstance(datos, dict):
+        raise exceptions.ParseError('Se esperaba un objeto JSON')
+    return datos
+
+
+def _error(detalle, estado):
+    return JsonResponse({'detail': detalle}, status=estado)
+
+
+@csrf_exempt
+@require_http_methods(['POST'])
+async def predecir(request):
+    """Async de ``POST predecir/``: predice una lectura y la agrega al historial."""
+    with vista_actual('predecir_async'):
+        usuario = await _autenticar(request)
+        rechazo = _rechazo(usuario)
+        if rechazo is not None:
+            return rechazo
+        try:
+            vaca, datos = await sync_to_async(lectura_de_peticion)(_cuerpo_json(request), usuario)
+        except exceptions.ParseError as e:
+            return _error(str(e.detail), 400)
+        except exceptions.ValidationError as e:
+            return JsonResponse(e.detail, status=400, safe=False)
+        except Http404:
+            return _error('No encontrado.', 404)
+
+        try:
+            registro, valores = await sync_to_async(entrada_prediccion)(vaca, datos)
+            probabilidad = await agrupador.predecir(registro)
+            guardado = await sync_to_async(guardar_prediccion)(vaca, valores, probabilidad)
+        except Saturado:
+            return _error('Demasiadas predicciones en espera, reintente.', 503)
+        except Exception as e:
+            return JsonResponse({'error': str(e)}, status=400)
+        return JsonResponse({'prediccion': probabilidad, 'registro': guardado}, status=201)
+
+
+def _validar_reevaluacion(pk, datos, usuario):
+    vaca = vacas_visibles(usuario).filter(pk=pk).first()
+    if vaca is None:
+        raise Http404
+    serializer = VacaSerializer(vaca, data=datos, partial=True)
+    serializer.is_valid(raise_exception=True)
+    return vaca, serializer, entrada_reevaluacion(vaca, serializer)
+
+
+@csrf_exempt
+@require_http_methods(['PUT'])
+async def reevaluar(request, pk):
+    """Async de ``PUT vacas/<pk>/reevaluar/``.
+
+    A diferencia de la versión síncrona, la predicción se calcula fuera de
+    la transacción: los cambios y la nueva predicción se guardan juntos al final.
+    """
+    with vista_actual('reevaluar_async'):
+        usuario = await _autenticar(request)
+        rechazo = _rechazo(usuario)
+        if rechazo is not None:
+            return rechazo
+        try:
+            vaca, serializer, registro = await sync_to_async(_validar_reevaluacion)(pk, _cuerpo_json(request), usuario)
+        except exceptions.ParseError as e:
+            return _error(str(e.detail), 400)
+        except exceptions.ValidationError as e:
+            return JsonResponse(e.detail, status=400, safe=False)
+        except Http404:
+            return _error('No encontrado.', 404)
+
+        try:
+            probabilidad = await agrupador.predecir(registro)
+        except Saturado:
+            return _error('Demasiadas predicciones en espera, reintente.', 503)
+        datos = await sync_to_async(guardar_reevaluacion)(vaca, serializer, probabilidad)
+        return JsonResponse(datos, status=200)
+
+
+def _cursor_alertas(texto):
+    try:
+        cursor = int(texto)
+    except (TypeError, ValueError):
+        raise exceptions.ParseError('El cursor debe ser un entero')
+    if cursor < 0:
+        raise exceptions.ParseError('El cursor debe ser un entero')
+    return cursor
+
+
+@require_http_methods(['GET'])
+async def alertas(request):
+    """Long-polling de alertas de celo: ``GET alertas/?desde=<cursor>&espera=<segundos>``.
+
+    Sin ``desde`` responde de inmediato con el cursor actual y sin alertas
+    (el cliente ya cargó el listado). Con ``desde`` espera hasta ``espera``
+    segundos a que haya alertas posteriores y devuelve las nuevas y el cursor
+    para la siguiente petición.
+    """
+    with vista_actual('alertas'):
+        usuario = await _autenticar(request)
+        rechazo = _rechazo(usuario)
+        if rechazo is not None:
+            return rechazo
+        respuesta = {'umbral': OPCIONES_ALERTAS['umbral'], 'alertas': []}
+        if 'desde' not in request.GET:
+            respuesta['cursor'] = await sync_to_async(ultimo_cursor)()
+            return JsonResponse(respuesta)
+        try:
+            cursor = _cursor_alertas(request.GET['desde'])
+            espera = float(request.GET.get('espera', 0))
+        except exceptions.ParseError as e:
+            return _error(str(e.detail), 400)
+        except ValueError:
+            return _error('espera debe ser un número de segundos', 400)
+        espera = min(espera, OPCIONES_ALERTAS['espera_maxima']) if espera > 0 else 0
+
+        finca = finca_de(usuario)
+        bucle = asyncio.get_running_loop()
+        fin = bucle.time() + espera
+        respuesta['alertas'], respuesta['cursor'] = await sync_to_async(alertas_desde)(cursor, finca)
+        # Las alertas de otras fincas despiertan la espera pero solo avanzan el cursor
+        while not respuesta['alertas'] and bucle.time() < fin:
+            if not await vigia.esperar(respuesta['cursor'], fin - bucle.time()):
+                break
+            respuesta['alertas'], respuesta['cursor'] = await sync_to_async(alertas_desde)(respuesta['cursor'], finca)
+        return JsonResponse(respuesta)
+
+
+# Un comentario cada tanto mantiene abierta la conexión a través de proxies
+LATIDO_EVENTOS = 15
+# Al cerrarse la conexión el navegador reconecta enviando Last-Event-ID
+DURACION_EVENTOS = 300
+
+
+async def _eventos_alertas(cursor, finca):
+    bucle = asyncio.get_running_loop()
+    fin = bucle.time() + DURACION_EVENTOS
+    yield f'retry: 3000\nevent: umbral\ndata: {json.dumps(OPCIONES_ALERTAS["umbral"])}\n\n'
+    while bucle.time() < fin:
+        nuevas, cursor = await sync_to_async(alertas_desde)(cursor, finca)
+        for alerta in nuevas:
+            yield f'id: {alerta["id"]}\nevent: alerta\ndata: {json.dumps(alerta)}\n\n'
+        if not nuevas and not await vigia.esperar(cursor, min(LATIDO_EVENTOS, fin - bucle.time())):
+            yield ': latido\n\n'
+
+
+@require_http_methods(['GET'])
+async def eventos_alertas(request):
+    """Server-Sent Events con las alertas de celo (``GET alertas/eventos/``).
+
+    El cursor se toma de ``Last-Event-ID`` (reconexión) o de ``?desde=``; sin
+    ninguno, solo se envían las alertas que se generen desde ahora. Pensado
+    para ASGI: bajo WSGI cada conexión ocupa un worker mientras dure.
+    """
+    usuario = await _autenticar(request)
+    rechazo = _rechazo(usuario)
+    if rechazo is not None:
+        return rechazo
+    texto = request.headers.get('Last-Event-ID') or request.GET.get('desde')
+    try:
+        cursor = _cursor_alertas(texto) if texto else await sync_to_async(ultimo_cursor)()
+    except exceptions.ParseError as e:
+        return _error(str(e.detail), 400)
+    respuesta = StreamingHttpResponse(_eventos_alertas(cursor, finca_de(usuario)), content_type='text/event-stream')
+    respuesta['Cache-Control'] = 'no-cache'
+    # Evita que nginx acumule los eventos antes de enviarlos
+    respuesta['X-Accel-Buffering'] = 'no'
+    return respuesta
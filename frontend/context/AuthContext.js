@@ -1,5 +1,6 @@
 import { createContext, useContext, useState, useEffect } from 'react';
 import api from '../utils/axiosConfig'; // <--- Importa tu instancia de Axios
+import { olvidarVacas } from '../utils/sincronizacionVacas';
 
 const AuthContext = createContext();
 
@@ -11,6 +12,8 @@ export const AuthProvider = ({ children }) => {
   const logout = () => {
     localStorage.removeItem('accessToken');
     localStorage.removeItem('refreshToken');
+    // Las vacas descargadas son de la finca de este usuario
+    olvidarVacas();
     setUser(null);
   };
 
@@ -41,6 +44,7 @@ export const AuthProvider = ({ children }) => {
       const response = await api.post('/login/', credentials);
       localStorage.setItem('accessToken', response.data.access);
       localStorage.setItem('refreshToken', response.data.refresh);
+      olvidarVacas();
       setUser(response.data.user);
       return { success: true };
     } catch (error) {
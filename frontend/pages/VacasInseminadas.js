@@ -1,191 +1,225 @@
-import React, { useEffect, useState, useMemo } from 'react';
-import { Table, Button, Container, Spinner, Alert } from 'react-bootstrap';
-import { useNavigate } from 'react-router-dom';
-import api from '../utils/axiosConfig';
-import { BiCheckDouble, BiRefresh } from 'react-icons/bi';
-
-const razasNombres = {
-  SIB: 'Siboney de Cuba',
-  MAM: 'Mambi de Cuba',
-  TAI: 'Taino',
-  CRI: 'Criolla',
-  CEB: 'Cebu',
-  CRU: 'Cruzamiento',
-  CHA: 'Chacuba',
-  HOL: 'Holstein'
-};
-
-function formatearFecha(fechaIso) {
-  if (!fechaIso) return '';
-  const fecha = new Date(fechaIso);
-  return `${fecha.getDate().toString().padStart(2, '0')}/${(fecha.getMonth() + 1).toString().padStart(2, '0')}/${fecha.getFullYear()} ${fecha.getHours().toString().padStart(2, '0')}:${fecha.getMinutes().toString().padStart(2, '0')}`;
-}
-
-function VacasInseminadas() {
-  const [historial, setHistorial] = useState([]);
-  const [cargando, setCargando] = useState(true);
-  const [error, setError] = useState(null);
-  const [sortConfig, setSortConfig] = useState({ key: null, direction: 'asc' });
-  const navigate = useNavigate();
-
-  useEffect(() => {
-    api.get('/vacas/')
-      .then(res => {
-        setHistorial(res.data);
-        setCargando(false);
-      })
-      .catch(() => {
-        setError('Error al cargar los datos');
-        setCargando(false);
-      });
-  }, []);
-
-  const vacasInseminadas = useMemo(
-    () => historial.filter(v => v.inseminada && !v.gestante),
-    [historial]
-  );
-
-  const vacasOrdenadas = useMemo(() => {
-    let ordenadas = [...vacasInseminadas];
-    if (sortConfig.key !== null) {
-      ordenadas.sort((a, b) => {
-        if (a[sortConfig.key] < b[sortConfig.key]) {
-          return sortConfig.direction === 'asc' ? -1 : 1;
-        }
-        if (a[sortConfig.key] > b[sortConfig.key]) {
-          return sortConfig.direction === 'asc' ? 1 : -1;
-        }
-        return 0;
-      });
-    }
-    return ordenadas;
-  }, [vacasInseminadas, sortConfig]);
-
-  const requestSort = key => {
-    let direction = 'asc';
-    if (sortConfig.key === key && sortConfig.direction === 'asc') {
-      direction = 'desc';
-    }
-    setSortConfig({ key, direction });
-  };
-
-  const declararGestante = async (id) => {
-    try {
-      const fechaActual = new Date().toISOString();
-      await api.patch(`/vacas/${id}/`, { gestante: true, fecha_gestacion: fechaActual });
-      setHistorial(historial =>
-        historial.map(v =>
-          v.id === id ? { ...v, gestante: true, fecha_gestacion: fechaActual } : v
-        )
-      );
-    } catch (error) {
-      alert('Error al declarar gestante');
-    }
-  };
-
-  const volverAInseminar = async (id) => {
-    try {
-      const fechaActual = new Date().toISOString();
-      await api.patch(`/vacas/${id}/`, { inseminada: true, gestante: false, fecha_inseminacion: fechaActual });
-      setHistorial(historial =>
-        historial.map(v =>
-          v.id === id ? { ...v, inseminada: true, gestante: false, fecha_inseminacion: fechaActual, fecha_gestacion: null } : v
-        )
-      );
-    } catch (error) {
-      alert('Error al volver a inseminar');
-    }
-  };
-
-  if (cargando) {
-    return (
-      <Container className="mt-5 text-center">
-        <Spinner animation="border" />
-        <div>Cargando vacas inseminadas...</div>
-      </Container>
-    );
-  }
-
-  if (error) {
-    return (
-      <Container className="mt-5">
-        <Alert variant="danger">{error}</Alert>
-      </Container>
-    );
-  }
-
-  return (
-    <Container className="mt-5">
-      <h2 className="mb-4 text-center" style={{ color: 'var(--primary-700)' }}>
-        Vacas Inseminadas (pendiente de diagnóstico)
-      </h2>
-      <Table className="modern-table" hover responsive>
-        <thead>
-          <tr>
-            <th onClick={() => requestSort('nombre')}>Nombre</th>
-            <th onClick={() => requestSort('fecha_inseminacion')}>Fecha inseminación</th>
-            <th onClick={() => requestSort('actividad')}>Actividad</th>
-            <th onClick={() => requestSort('temperatura')}>Temperatura</th>
-            <th onClick={() => requestSort('dias_posparto')}>Días posparto</th>
-            <th onClick={() => requestSort('condicion')}>Condición</th>
-            <th onClick={() => requestSort('raza')}>Raza</th>
-            <th onClick={() => requestSort('parto_asistido')}>Parto asistido</th>
-            <th onClick={() => requestSort('prediccion')}>Probabilidad (%)</th>
-            <th>Acción</th>
-          </tr>
-        </thead>
-        <tbody>
-          {vacasOrdenadas.length === 0 && (
-            <tr>
-              <td colSpan={10} className="text-center">
-                No hay vacas inseminadas pendientes de diagnóstico.
-              </td>
-            </tr>
-          )}
-          {vacasOrdenadas.map(v => (
-            <tr key={v.id}>
-              <td>{v.nombre}</td>
-              <td>{formatearFecha(v.fecha_inseminacion)}</td>
-              <td>{v.actividad}</td>
-              <td>{v.temperatura}</td>
-              <td>{v.dias_posparto}</td>
-              <td>{v.condicion}</td>
-              <td>{razasNombres[v.raza] || v.raza}</td>
-              <td>{v.parto_asistido ? "Sí" : "No"}</td>
-              <td>{v.prediccion?.toFixed(2)}</td>
-              <td>
-                <Button
-                  variant="outline-primary"
-                  size="sm"
-                  className="btn-modern me-2"
-                  onClick={() => declararGestante(v.id)}
-                  title="Declarar gestante"
-                >
-                  <BiCheckDouble style={{ marginBottom: '3px' }} /> Gestante
-                </Button>
-                <Button
-                  variant="outline-primary"
-                  size="sm"
-                  className="btn-modern"
-                  onClick={() => volverAInseminar(v.id)}
-                  title="Volver a inseminar"
-                >
-                  <BiRefresh style={{ marginBottom: '3px' }} /> Volver a inseminar
-                </Button>
-              </td>
-            </tr>
-          ))}
-        </tbody>
-      </Table>
-      <Button
-        variant="secondary"
-        className="btn-modern mt-3"
-        onClick={() => navigate('/dashboard')}
-      >
-        Volver
-      </Button>
-    </Container>
-  );
-}
-
-export default VacasInseminadas;
+import React, { useEffect, useState, useMemo } from 'react';
+import { Table, Button, Container, Spinner, Alert, Form } from 'react-bootstrap';
+import { useNavigate } from 'react-router-dom';
+import api from '../utils/axiosConfig';
+import { obtenerVacas } from '../utils/sincronizacionVacas';
+import { BiCheckDouble, BiRefresh } from 'react-icons/bi';
+
+const razasNombres = {
+  SIB: 'Siboney de Cuba',
+  MAM: 'Mambi de Cuba',
+  TAI: 'Taino',
+  CRI: 'Criolla',
+  CEB: 'Cebu',
+  CRU: 'Cruzamiento',
+  CHA: 'Chacuba',
+  HOL: 'Holstein'
+};
+
+function formatearFecha(fechaIso) {
+  if (!fechaIso) return '';
+  const fecha = new Date(fechaIso);
+  return `${fecha.getDate().toString().padStart(2, '0')}/${(fecha.getMonth() + 1).toString().padStart(2, '0')}/${fecha.getFullYear()} ${fecha.getHours().toString().padStart(2, '0')}:${fecha.getMinutes().toString().padStart(2, '0')}`;
+}
+
+function VacasInseminadas() {
+  const [historial, setHistorial] = useState([]);
+  const [cargando, setCargando] = useState(true);
+  const [error, setError] = useState(null);
+  const [sortConfig, setSortConfig] = useState({ key: null, direction: 'asc' });
+  const [seleccionadas, setSeleccionadas] = useState([]);
+  const navigate = useNavigate();
+
+  useEffect(() => {
+    obtenerVacas({ estado: 'inseminada' })
+      .then(vacas => {
+        setHistorial(vacas);
+        setCargando(false);
+      })
+      .catch(() => {
+        setError('Error al cargar los datos');
+        setCargando(false);
+      });
+  }, []);
+
+  const vacasInseminadas = useMemo(
+    () => historial.filter(v => v.inseminada && !v.gestante),
+    [historial]
+  );
+
+  const vacasOrdenadas = useMemo(() => {
+    let ordenadas = [...vacasInseminadas];
+    if (sortConfig.key !== null) {
+      ordenadas.sort((a, b) => {
+        if (a[sortConfig.key] < b[sortConfig.key]) {
+          return sortConfig.direction === 'asc' ? -1 : 1;
+        }
+        if (a[sortConfig.key] > b[sortConfig.key]) {
+          return sortConfig.direction === 'asc' ? 1 : -1;
+        }
+        return 0;
+      });
+    }
+    return ordenadas;
+  }, [vacasInseminadas, sortConfig]);
+
+  const requestSort = key => {
+    let direction = 'asc';
+    if (sortConfig.key === key && sortConfig.direction === 'asc') {
+      direction = 'desc';
+    }
+    setSortConfig({ key, direction });
+  };
+
+  const todasSeleccionadas = vacasOrdenadas.length > 0 && vacasOrdenadas.every(v => seleccionadas.includes(v.id));
+
+  const alternarSeleccion = id => {
+    setSeleccionadas(seleccionadas =>
+      seleccionadas.includes(id) ? seleccionadas.filter(s => s !== id) : [...seleccionadas, id]
+    );
+  };
+
+  const alternarTodas = () => {
+    setSeleccionadas(todasSeleccionadas ? [] : vacasOrdenadas.map(v => v.id));
+  };
+
+  // Aplica la transición a todas las vacas indicadas con una sola petición
+  const aplicarTransicion = async (transicion, ids) => {
+    const response = await api.post('/vacas/transicion/', { transicion, ids });
+    const cambios = response.data.cambios;
+    setHistorial(historial =>
+      historial.map(v => (ids.includes(v.id) ? { ...v, ...cambios } : v))
+    );
+    setSeleccionadas(seleccionadas => seleccionadas.filter(id => !ids.includes(id)));
+  };
+
+  const declararGestantes = async (ids) => {
+    try {
+      await aplicarTransicion('confirmar_gestacion', ids);
+    } catch (error) {
+      alert(error.response?.data?.error || 'Error al declarar gestante');
+    }
+  };
+
+  const volverAInseminar = async (ids) => {
+    try {
+      await aplicarTransicion('inseminar', ids);
+    } catch (error) {
+      alert(error.response?.data?.error || 'Error al volver a inseminar');
+    }
+  };
+
+  if (cargando) {
+    return (
+      <Container className="mt-5 text-center">
+        <Spinner animation="border" />
+        <div>Cargando vacas inseminadas...</div>
+      </Container>
+    );
+  }
+
+  if (error) {
+    return (
+      <Container className="mt-5">
+        <Alert variant="danger">{error}</Alert>
+      </Container>
+    );
+  }
+
+  return (
+    <Container className="mt-5">
+      <h2 className="mb-4 text-center" style={{ color: 'var(--primary-700)' }}>
+        Vacas Inseminadas (pendiente de diagnóstico)
+      </h2>
+      <Button
+        variant="outline-primary"
+        className="btn-modern mb-3 me-2"
+        disabled={seleccionadas.length === 0}
+        onClick={() => declararGestantes(seleccionadas)}
+      >
+        <BiCheckDouble style={{ marginBottom: '3px' }} /> Declarar gestantes ({seleccionadas.length})
+      </Button>
+      <Button
+        variant="outline-primary"
+        className="btn-modern mb-3"
+        disabled={seleccionadas.length === 0}
+        onClick={() => volverAInseminar(seleccionadas)}
+      >
+        <BiRefresh style={{ marginBottom: '3px' }} /> Volver a inseminar ({seleccionadas.length})
+      </Button>
+      <Table className="modern-table" hover responsive>
+        <thead>
+          <tr>
+            <th>
+              <Form.Check type="checkbox" checked={todasSeleccionadas} onChange={alternarTodas} title="Seleccionar todas" />
+            </th>
+            <th onClick={() => requestSort('nombre')}>Nombre</th>
+            <th onClick={() => requestSort('fecha_inseminacion')}>Fecha inseminación</th>
+            <th onClick={() => requestSort('actividad')}>Actividad</th>
+            <th onClick={() => requestSort('temperatura')}>Temperatura</th>
+            <th onClick={() => requestSort('dias_posparto')}>Días posparto</th>
+            <th onClick={() => requestSort('condicion')}>Condición</th>
+            <th onClick={() => requestSort('raza')}>Raza</th>
+            <th onClick={() => requestSort('parto_asistido')}>Parto asistido</th>
+            <th onClick={() => requestSort('prediccion')}>Probabilidad (%)</th>
+            <th>Acción</th>
+          </tr>
+        </thead>
+        <tbody>
+          {vacasOrdenadas.length === 0 && (
+            <tr>
+              <td colSpan={11} className="text-center">
+                No hay vacas inseminadas pendientes de diagnóstico.
+              </td>
+            </tr>
+          )}
+          {vacasOrdenadas.map(v => (
+            <tr key={v.id}>
+              <td>
+                <Form.Check type="checkbox" checked={seleccionadas.includes(v.id)} onChange={() => alternarSeleccion(v.id)} />
+              </td>
+              <td>{v.nombre}</td>
+              <td>{formatearFecha(v.fecha_inseminacion)}</td>
+              <td>{v.actividad}</td>
+              <td>{v.temperatura}</td>
+              <td>{v.dias_posparto}</td>
+              <td>{v.condicion}</td>
+              <td>{razasNombres[v.raza] || v.raza}</td>
+              <td>{v.parto_asistido ? "Sí" : "No"}</td>
+              <td>{v.prediccion?.toFixed(2)}</td>
+              <td>
+                <Button
+                  variant="outline-primary"
+                  size="sm"
+                  className="btn-modern me-2"
+                  onClick={() => declararGestantes([v.id])}
+                  title="Declarar gestante"
+                >
+                  <BiCheckDouble style={{ marginBottom: '3px' }} /> Gestante
+                </Button>
+                <Button
+                  variant="outline-primary"
+                  size="sm"
+                  className="btn-modern"
+                  onClick={() => volverAInseminar([v.id])}
+                  title="Volver a inseminar"
+                >
+                  <BiRefresh style={{ marginBottom: '3px' }} /> Volver a inseminar
+                </Button>
+              </td>
+            </tr>
+          ))}
+        </tbody>
+      </Table>
+      <Button
+        variant="secondary"
+        className="btn-modern mt-3"
+        onClick={() => navigate('/dashboard')}
+      >
+        Volver
+      </Button>
+    </Container>
+  );
+}
+
+export default VacasInseminadas;
@@ -1,32 +1,32 @@
-import axios from 'axios';
-
-const api = axios.create({
-  baseURL: 'http://localhost:8000/api',
-});
-
-// Interceptor para agregar el token a cada request si existe
-api.interceptors.request.use(
-  (config) => {
-    const token = localStorage.getItem('accessToken');
-    if (token) {
-      config.headers['Authorization'] = `Bearer ${token}`;
-    }
-    return config;
-  },
-  (error) => Promise.reject(error)
-);
-
-// Interceptor para manejar errores 401 sin recargar ni navegar fuera de React Router
-api.interceptors.response.use(
-  (response) => response,
-  (error) => {
-    if (error.response && error.response.status === 401) {
-      localStorage.removeItem('accessToken');
-      localStorage.removeItem('refreshToken');
-      // NO redirigir aquí. El AuthContext y las rutas protegidas se encargarán de mostrar el login.
-    }
-    return Promise.reject(error);
-  }
-);
-
-export default api;
+import axios from 'axios';
+
+const api = axios.create({
+  baseURL: 'http://localhost:8000/api',
+});
+
+// Interceptor para agregar el token a cada request si existe
+api.interceptors.request.use(
+  (config) => {
+    const token = localStorage.getItem('accessToken');
+    if (token) {
+      config.headers['Authorization'] = `Bearer ${token}`;
+    }
+    return config;
+  },
+  (error) => Promise.reject(error)
+);
+
+// Interceptor para manejar errores 401 sin recargar ni navegar fuera de React Router
+api.interceptors.response.use(
+  (response) => response,
+  (error) => {
+    if (error.response && error.response.status === 401) {
+      localStorage.removeItem('accessToken');
+      localStorage.removeItem('refreshToken');
+      // NO redirigir aquí. El AuthContext y las rutas protegidas se encargarán de mostrar el login.
+    }
+    return Promise.reject(error);
+  }
+);
+
+export default api;
@@ -0,0 +1,44 @@
+import api from './axiosConfig';
+
+// Copia local de cada listado de vacas (por parámetros) y el cursor de cambios del servidor.
+// Es de la sesión que la descargó: otro token (otro usuario, otra finca) empieza de cero
+const listados = new Map();
+let sesion = null;
+
+// Descarta las copias locales; AuthContext la llama al iniciar y al cerrar sesión
+export function olvidarVacas() {
+  listados.clear();
+  sesion = null;
+}
+
+const porFechaDescendente = (a, b) =>
+  new Date(b.fecha) - new Date(a.fecha) || b.id - a.id;
+
+// La primera vez descarga el listado completo (since=0); después solo pide
+// las vacas que cambiaron desde el cursor y quita las eliminadas
+export async function obtenerVacas(params = {}) {
+  const token = localStorage.getItem('accessToken');
+  if (token !== sesion) {
+    olvidarVacas();
+    sesion = token;
+  }
+  const clave = JSON.stringify(params);
+  const guardado = listados.get(clave);
+  const vacas = new Map(guardado ? guardado.vacas : []);
+  let cursor = guardado ? guardado.cursor : 0;
+  let mas = true;
+
+  while (mas) {
+    const res = await api.get('/vacas/', { params: { ...params, since: cursor } });
+    res.data.vacas.forEach(v => vacas.set(v.id, v));
+    res.data.eliminadas.forEach(id => vacas.delete(id));
+    cursor = res.data.cursor;
+    mas = res.data.mas;
+  }
+
+  // Si la sesión cambió durante la descarga, el resultado no se guarda
+  if (sesion === token) {
+    listados.set(clave, { cursor, vacas });
+  }
+  return [...vacas.values()].sort(porFechaDescendente);
+}